@@ -0,0 +1,342 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from datetime import date, datetime
+from time import monotonic
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+AOSS_BULK_CHUNK_SIZE = int(os.getenv('AOSS_BULK_CHUNK_SIZE', 500))
+AOSS_BULK_MAX_CHUNK_BYTES = int(os.getenv('AOSS_BULK_MAX_CHUNK_BYTES', 10 * 1024 * 1024))
+AOSS_BULK_CONCURRENCY = int(os.getenv('AOSS_BULK_CONCURRENCY', 4))
+AOSS_BULK_MAX_RETRIES = int(os.getenv('AOSS_BULK_MAX_RETRIES', 3))
+# 'true', 'false' or 'wait_for'; unset leaves the index's refresh interval in charge
+AOSS_REFRESH = os.getenv('AOSS_REFRESH') or None
+AOSS_WRITE_BEHIND = os.getenv('AOSS_WRITE_BEHIND', 'false').lower() == 'true'
+AOSS_RETRY_QUEUE_PATH = os.getenv('AOSS_RETRY_QUEUE_PATH') or None
+AOSS_RETRY_INTERVAL = float(os.getenv('AOSS_RETRY_INTERVAL', 30))
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class AossBulkError(BaseModel):
+    index: str | None = None
+    id: str | None = None
+    status: int | None = Field(default=None, description='HTTP status, None if the request failed')
+    error: str
+    retryable: bool = False
+    action: dict[str, Any] = Field(default_factory=dict, repr=False)
+
+
+class AossBulkResult(BaseModel):
+    success: int = 0
+    errors: list[AossBulkError] = Field(default_factory=list)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _action_lines(action: dict[str, Any]) -> tuple[str, ...]:
+    op = action.get('_op_type', 'index')
+    meta = {'_index': action['_index'], '_id': action['_id']}
+    if action.get('_routing') is not None:
+        meta['routing'] = action['_routing']
+
+    header = json.dumps({op: meta})
+    if op == 'delete':
+        return (header,)
+    return header, json.dumps(action['_source'], default=_json_default)
+
+
+def chunk_actions(
+    actions: Iterable[dict[str, Any]], chunk_size: int, max_chunk_bytes: int
+) -> Iterator[list[tuple[dict[str, Any], tuple[str, ...]]]]:
+    """
+    Serialize bulk actions once and group them into chunks of at most `chunk_size` actions
+    and `max_chunk_bytes` of NDJSON. A single action larger than the byte limit is sent alone.
+    """
+    chunk: list[tuple[dict[str, Any], tuple[str, ...]]] = []
+    size = 0
+    for action in actions:
+        lines = _action_lines(action)
+        action_bytes = sum(len(line.encode()) + 1 for line in lines)
+        if chunk and (len(chunk) >= chunk_size or size + action_bytes > max_chunk_bytes):
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append((action, lines))
+        size += action_bytes
+
+    if chunk:
+        yield chunk
+
+
+def _append_actions(path: str, actions: list[dict[str, Any]]):
+    with open(path, 'a') as f:
+        for action in actions:
+            f.write(json.dumps(action, default=_json_default) + '\n')
+
+
+def _read_actions(path: str) -> list[dict[str, Any]]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class AossIndexer:
+    """
+    Bulk indexing pipeline for the OpenSearch indexes.
+
+    Actions use the opensearch-py `helpers.bulk` format (`_op_type`, `_index`, `_id`,
+    `_routing`, `_source`). They are streamed into chunks bounded by `chunk_size` actions and
+    `max_chunk_bytes`, with up to `concurrency` chunks in flight. Items rejected with a
+    retryable status are retried with exponential backoff; other per-item failures are logged
+    and returned instead of raised. Deleting a missing document counts as a success.
+
+    With `write_behind`, `submit` returns as soon as the actions are queued and a background
+    task indexes them in order. Actions that still fail with a retryable error are appended to
+    `retry_queue_path` (JSON lines, kept in memory when unset), which is replayed when the
+    worker starts and every `retry_interval` seconds, so they survive restarts. Call `flush`
+    before relying on the index reflecting earlier writes, and `close` on shutdown.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        chunk_size: int = AOSS_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = AOSS_BULK_MAX_CHUNK_BYTES,
+        concurrency: int = AOSS_BULK_CONCURRENCY,
+        max_retries: int = AOSS_BULK_MAX_RETRIES,
+        initial_backoff: float = 1.0,
+        refresh: str | None = AOSS_REFRESH,
+        request_timeout: float = 60,
+        write_behind: bool = AOSS_WRITE_BEHIND,
+        retry_queue_path: str | None = AOSS_RETRY_QUEUE_PATH,
+        retry_interval: float = AOSS_RETRY_INTERVAL,
+    ):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.refresh = refresh
+        self.request_timeout = request_timeout
+        self.write_behind = write_behind
+        self.retry_queue_path = retry_queue_path
+        self.retry_interval = retry_interval
+
+        self._queue: asyncio.Queue[list[dict[str, Any]]] | None = None
+        self._worker: asyncio.Task | None = None
+        self._retry_buffer: list[dict[str, Any]] = []
+        self._last_retry = 0.0
+
+    async def index(self, actions: Iterable[dict[str, Any]]) -> AossBulkResult:
+        """Index `actions` now and wait for every chunk to finish."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: list[asyncio.Task[AossBulkResult]] = []
+        for chunk in chunk_actions(actions, self.chunk_size, self.max_chunk_bytes):
+            # Acquire before creating the task so at most `concurrency` requests are in flight
+            # and the stream is only consumed as fast as chunks are sent
+            await semaphore.acquire()
+            task = asyncio.create_task(self._send(chunk))
+            task.add_done_callback(lambda _: semaphore.release())
+            tasks.append(task)
+
+        result = AossBulkResult()
+        for chunk_result in await asyncio.gather(*tasks):
+            result.success += chunk_result.success
+            result.errors.extend(chunk_result.errors)
+
+        if result.errors:
+            first = result.errors[0]
+            logger.warning(
+                f'{len(result.errors)} OpenSearch bulk actions failed, e.g. '
+                f'{first.index}/{first.id}: {first.status} {first.error}'
+            )
+        return result
+
+    async def submit(self, actions: Iterable[dict[str, Any]]) -> int:
+        """
+        Index `actions`, or queue them when running write-behind. Returns the number of
+        actions indexed, or queued.
+        """
+        if not self.write_behind:
+            return (await self.index(actions)).success
+
+        queued = list(actions)
+        if not queued:
+            return 0
+        self._start()
+        assert self._queue is not None
+        self._queue.put_nowait(queued)
+        return len(queued)
+
+    async def flush(self):
+        """Wait until every queued action has been attempted."""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def close(self):
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+    async def retry_failed(self) -> int:
+        """Re-index the actions in the retry queue; returns how many were indexed."""
+        self._last_retry = monotonic()
+        actions, self._retry_buffer = self._retry_buffer, []
+
+        # Move the queue aside first so failures can be appended to a fresh file, and only
+        # remove it once its actions are indexed or re-queued
+        path = self.retry_queue_path
+        retrying = f'{path}.retrying' if path else None
+        if path and retrying:
+            if not os.path.exists(retrying) and os.path.exists(path):
+                os.replace(path, retrying)
+            if os.path.exists(retrying):
+                actions += await asyncio.to_thread(_read_actions, retrying)
+
+        if not actions:
+            return 0
+
+        indexed = await self._index_or_requeue(actions)
+        if retrying:
+            with suppress(FileNotFoundError):
+                os.remove(retrying)
+        return indexed
+
+    def _start(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        assert self._queue is not None
+        try:
+            # Replay whatever a previous process left in the retry queue
+            await self.retry_failed()
+        except Exception as e:
+            logger.error(f'Failed to replay the OpenSearch retry queue: {e}')
+
+        while True:
+            actions: list[dict[str, Any]] | None = None
+            with suppress(asyncio.TimeoutError):
+                actions = await asyncio.wait_for(self._queue.get(), timeout=self.retry_interval)
+
+            try:
+                if actions is not None:
+                    await self._index_or_requeue(actions)
+                if monotonic() - self._last_retry >= self.retry_interval:
+                    await self.retry_failed()
+            except Exception as e:
+                logger.error(f'OpenSearch write-behind indexing failed: {e}')
+            finally:
+                if actions is not None:
+                    self._queue.task_done()
+
+    async def _index_or_requeue(self, actions: list[dict[str, Any]]) -> int:
+        try:
+            result = await self.index(actions)
+        except Exception as e:
+            logger.error(f'OpenSearch bulk indexing failed, queueing for retry: {e}')
+            await self._requeue(actions)
+            return 0
+
+        failed = [error.action for error in result.errors if error.retryable]
+        if failed:
+            await self._requeue(failed)
+        return result.success
+
+    async def _requeue(self, actions: list[dict[str, Any]]):
+        if self.retry_queue_path is None:
+            self._retry_buffer.extend(actions)
+            return
+        await asyncio.to_thread(_append_actions, self.retry_queue_path, actions)
+
+    async def _send(self, chunk: list[tuple[dict[str, Any], tuple[str, ...]]]) -> AossBulkResult:
+        result = AossBulkResult()
+        params: dict[str, Any] = {'request_timeout': self.request_timeout}
+        if self.refresh is not None:
+            params['refresh'] = self.refresh
+
+        pending = chunk
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.initial_backoff * 2 ** (attempt - 1))
+            last_attempt = attempt == self.max_retries
+
+            body = ''.join(line + '\n' for _, lines in pending for line in lines)
+            try:
+                response = await self.client.bulk(body=body, **params)
+            except Exception as e:
+                status = getattr(e, 'status_code', None)
+                retryable = not isinstance(status, int) or status in RETRYABLE_STATUSES
+                if retryable and not last_attempt:
+                    continue
+                result.errors.extend(
+                    AossBulkError(
+                        index=action['_index'],
+                        id=action['_id'],
+                        status=status if isinstance(status, int) else None,
+                        error=str(e),
+                        retryable=retryable,
+                        action=action,
+                    )
+                    for action, _ in pending
+                )
+                return result
+
+            retry = []
+            for (action, lines), item in zip(pending, response['items'], strict=True):
+                op, info = next(iter(item.items()))
+                status = info.get('status', 500)
+                if status < 300 or (op == 'delete' and status == 404):
+                    result.success += 1
+                elif status in RETRYABLE_STATUSES and not last_attempt:
+                    retry.append((action, lines))
+                else:
+                    result.errors.append(
+                        AossBulkError(
+                            index=action['_index'],
+                            id=action['_id'],
+                            status=status,
+                            error=json.dumps(info.get('error')),
+                            retryable=status in RETRYABLE_STATUSES,
+                            action=action,
+                        )
+                    )
+
+            pending = retry
+            if not pending:
+                break
+
+        return result
@@ -16,6 +16,7 @@ limitations under the License.
 
 import asyncio
 import copy
+import functools
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -26,15 +27,16 @@ from typing import Any
 
 from dotenv import load_dotenv
 
+from graphiti_core.driver.aoss_indexer import AossIndexer
+from graphiti_core.driver.instrumentation import QueryInstrumentation, instrument_query
 from graphiti_core.embedder.client import EMBEDDING_DIM
 
 try:
-    from opensearchpy import AsyncOpenSearch, helpers
+    from opensearchpy import AsyncOpenSearch
 
     _HAS_OPENSEARCH = True
 except ImportError:
     OpenSearch = None
-    helpers = None
     _HAS_OPENSEARCH = False
 
 logger = logging.getLogger(__name__)
@@ -143,6 +145,13 @@ aoss_indices = [
 
 class GraphDriverSession(ABC):
     provider: GraphProvider
+    # Set by GraphDriver.session from the driver's instrumentation
+    instrumentation: QueryInstrumentation | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'run' in cls.__dict__:
+            cls.run = instrument_query(cls.__dict__['run'])  # type: ignore[method-assign]
 
     async def __aenter__(self):
         return self
@@ -165,6 +174,17 @@ class GraphDriverSession(ABC):
         raise NotImplementedError()
 
 
+def _propagate_instrumentation(session_factory):
+    @functools.wraps(session_factory)
+    def wrapper(self, *args, **kwargs):
+        session = session_factory(self, *args, **kwargs)
+        if isinstance(session, GraphDriverSession):
+            session.instrumentation = self.instrumentation
+        return session
+
+    return wrapper
+
+
 class GraphDriver(ABC):
     provider: GraphProvider
     fulltext_syntax: str = (
@@ -172,11 +192,57 @@ class GraphDriver(ABC):
     )
     _database: str
     aoss_client: AsyncOpenSearch | None  # type: ignore
+    aoss_indexer: AossIndexer | None = None
+    # Assign a QueryInstrumentation to record latency, row counts and slow queries
+    instrumentation: QueryInstrumentation | None = None
+    # Labels whose embeddings are covered by a native vector index (see query_vector_index)
+    vector_index_labels: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ('execute_query', 'execute_query_columns'):
+            if name in cls.__dict__:
+                setattr(cls, name, instrument_query(cls.__dict__[name]))
+        if 'session' in cls.__dict__:
+            cls.session = _propagate_instrumentation(cls.__dict__['session'])
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
         raise NotImplementedError()
 
+    def get_vector_index_dim(self, label: str) -> int:
+        """Size of the embeddings save queries mirror into `label`'s vector index, 0 for none."""
+        return 0
+
+    async def profile_query(self, cypher_query_: str, **kwargs: Any) -> str | None:
+        """Run a read query with PROFILE and return the plan; None if unsupported."""
+        return None
+
+    async def query_vector_index(
+        self, label: str, search_vector: list[float], k: int
+    ) -> list[tuple[str, float]] | None:
+        """
+        Approximate `k` nearest neighbours of `search_vector` among `label`'s embeddings as
+        (uuid, cosine similarity) pairs, best first; None if there is no usable index.
+        """
+        return None
+
+    @instrument_query
+    async def execute_query_columns(self, cypher_query_: str, **kwargs: Any) -> dict[str, list]:
+        """
+        Run a query and return its result as columns keyed by the returned field names.
+
+        Meant for internal callers that only need a few scalar columns (uuids, scores,
+        embeddings) and would otherwise build a dict per record. Drivers that receive
+        results row-major from the database can override this to skip the per-record dicts.
+        """
+        records, _, _ = await self.execute_query(cypher_query_, **kwargs)
+        if not records:
+            return {}
+
+        keys = list(records[0].keys())
+        return {key: [record[key] for record in records] for key in keys}
+
     @abstractmethod
     def session(self, database: str | None = None) -> GraphDriverSession:
         raise NotImplementedError()
@@ -281,37 +347,49 @@ class GraphDriver(ABC):
             else:
                 logger.warning(f"Index '{index_name}' does not exist")
 
+    def get_aoss_indexer(self) -> AossIndexer:
+        """Bulk pipeline used for OpenSearch writes; assign `aoss_indexer` to configure it."""
+        if self.aoss_indexer is None or self.aoss_indexer.client is not self.aoss_client:
+            self.aoss_indexer = AossIndexer(self.aoss_client)
+        return self.aoss_indexer
+
     async def save_to_aoss(self, name: str, data: list[dict]) -> int:
         client = self.aoss_client
-        if not client or not helpers:
+        if not client:
             logger.warning('No OpenSearch client found')
             return 0
 
         for index in aoss_indices:
             if name.lower() == index['index_name']:
-                to_index = []
-                for d in data:
-                    doc = {}
-                    for p in index['body']['mappings']['properties']:
-                        if p in d:  # protect against missing fields
-                            doc[p] = d[p]
-
-                    item = {
+                properties = index['body']['mappings']['properties']
+                actions = (
+                    {
                         '_index': name,
                         '_id': d['uuid'],
                         '_routing': d.get('group_id'),
-                        '_source': doc,
+                        # protect against missing fields
+                        '_source': {p: d[p] for p in properties if p in d},
                     }
-                    to_index.append(item)
-
-                success, failed = await helpers.async_bulk(
-                    client, to_index, stats_only=True, request_timeout=60
+                    for d in data
                 )
-
-                return success if failed == 0 else success
+                return await self.get_aoss_indexer().submit(actions)
 
         return 0
 
+    async def delete_from_aoss(
+        self, index_names: list[str], uuids: list[str], routing: str | None = None
+    ) -> int:
+        """Delete documents by id from each of `index_names` in bulk."""
+        if not self.aoss_client or not uuids:
+            return 0
+
+        actions = (
+            {'_op_type': 'delete', '_index': index_name, '_id': uuid, '_routing': routing}
+            for index_name in index_names
+            for uuid in uuids
+        )
+        return await self.get_aoss_indexer().submit(actions)
+
     def build_fulltext_query(
         self, query: str, group_ids: list[str] | None = None, max_query_length: int = 128
     ) -> str:
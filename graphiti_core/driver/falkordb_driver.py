@@ -15,7 +15,8 @@ limitations under the License.
 """
 
 import logging
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
 
 if TYPE_CHECKING:
     from falkordb import Graph as FalkorGraph
@@ -32,6 +33,8 @@ else:
         ) from None
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.embedder.client import EMBEDDING_DIM
+from graphiti_core.graph_queries import FALKORDB_VECTOR_INDEXES, get_falkordb_vector_index_query
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 
 logger = logging.getLogger(__name__)
@@ -73,6 +76,69 @@ STOPWORDS = [
 ]
 
 
+class FalkorRecords(Sequence[dict[str, Any]]):
+    """
+    Columnar view over a FalkorDB result set.
+
+    FalkorDB returns a header and a list of rows. Instead of converting every row into a
+    dict up front, records are materialized only when they are indexed or iterated, so the
+    `get_*_from_record` helpers can build models in a single pass and callers that only
+    need a few columns never build a dict at all.
+    """
+
+    __slots__ = ('header', 'rows', '_width')
+
+    def __init__(self, header: list[str], rows: list[list[Any]]):
+        self.header = header
+        self.rows = rows
+        self._width = len(header)
+
+    def _record(self, row: list[Any]) -> dict[str, Any]:
+        if len(row) < self._width:
+            # If there are more fields in header than values in row, set to None
+            row = list(row) + [None] * (self._width - len(row))
+        return dict(zip(self.header, row, strict=False))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._record(row) for row in self.rows[index]]
+        return self._record(self.rows[index])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        record = self._record
+        for row in self.rows:
+            yield record(row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FalkorRecords):
+            return self.header == other.header and self.rows == other.rows
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'FalkorRecords(header={self.header!r}, rows={len(self.rows)})'
+
+    def column(self, name: str) -> list[Any]:
+        """Return a single column without materializing any records."""
+        if name not in self.header:
+            return [None] * len(self.rows)
+        i = self.header.index(name)
+        return [row[i] if i < len(row) else None for row in self.rows]
+
+    def columns(self) -> dict[str, list[Any]]:
+        return {name: self.column(name) for name in self.header}
+
+
 class FalkorDriverSession(GraphDriverSession):
     provider = GraphProvider.FALKORDB
 
@@ -120,6 +186,7 @@ class FalkorDriver(GraphDriver):
         password: str | None = None,
         falkor_db: FalkorDB | None = None,
         database: str = 'default_db',
+        embedding_dim: int = EMBEDDING_DIM,
     ):
         """
         Initialize the FalkorDB driver.
@@ -127,10 +194,16 @@ class FalkorDriver(GraphDriver):
         FalkorDB is a multi-tenant graph database.
         To connect, provide the host and port.
         The default parameters assume a local (on-premises) FalkorDB instance.
+
+        `embedding_dim` is the dimension of the vector indexes created by
+        build_indices_and_constraints; 0 skips them. Similarity search uses whichever vector
+        indexes exist in the graph, detected on first use.
         """
         super().__init__()
 
         self._database = database
+        self.embedding_dim = embedding_dim
+        self._vector_indexes_loaded = False
         if falkor_db is not None:
             # If a FalkorDB instance is provided, use it directly
             self.client = falkor_db
@@ -145,14 +218,14 @@ class FalkorDriver(GraphDriver):
             graph_name = self._database
         return self.client.select_graph(graph_name)
 
-    async def execute_query(self, cypher_query_, **kwargs: Any):
+    async def _query(self, cypher_query_: str, kwargs: dict[str, Any]) -> Any:
         graph = self._get_graph(self._database)
 
         # Convert datetime objects to ISO strings (FalkorDB does not support datetime objects directly)
         params = convert_datetimes_to_strings(dict(kwargs))
 
         try:
-            result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            return await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
         except Exception as e:
             if 'already indexed' in str(e):
                 # check if index already exists
@@ -161,22 +234,66 @@ class FalkorDriver(GraphDriver):
             logger.error(f'Error executing FalkorDB query: {e}\n{cypher_query_}\n{params}')
             raise
 
+    async def execute_query(self, cypher_query_, **kwargs: Any):
+        result = await self._query(cypher_query_, kwargs)
+        if result is None:
+            return None
+
         # Convert the result header to a list of strings
         header = [h[1] for h in result.header]
 
-        # Convert FalkorDB's result format (list of lists) to the format expected by Graphiti (list of dicts)
-        records = []
-        for row in result.result_set:
-            record = {}
-            for i, field_name in enumerate(header):
-                if i < len(row):
-                    record[field_name] = row[i]
-                else:
-                    # If there are more fields in header than values in row, set to None
-                    record[field_name] = None
-            records.append(record)
+        # Keep FalkorDB's row-major result set and expose it as a sequence of dicts lazily
+        return FalkorRecords(header, result.result_set), header, None
+
+    async def execute_query_columns(self, cypher_query_: str, **kwargs: Any) -> dict[str, list]:
+        result = await self._query(cypher_query_, kwargs)
+        if result is None:
+            return {}
 
-        return records, header, None
+        return FalkorRecords([h[1] for h in result.header], result.result_set).columns()
+
+    async def profile_query(self, cypher_query_: str, **kwargs: Any) -> str | None:
+        graph = self._get_graph(self._database)
+        params = convert_datetimes_to_strings(dict(kwargs))
+        plan = await graph.profile(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+        return str(plan)
+
+    async def load_vector_indexes(self) -> frozenset[str]:
+        """Detect which labels have a vector index on their embedding property."""
+        records, _, _ = await self.execute_query(
+            'CALL db.indexes() YIELD label, types RETURN label, types'
+        )
+        labels = set()
+        for record in records:
+            if record['label'] not in FALKORDB_VECTOR_INDEXES:
+                continue
+            _, prop = FALKORDB_VECTOR_INDEXES[record['label']]
+            if 'VECTOR' in (record['types'] or {}).get(prop, []):
+                labels.add(record['label'])
+
+        self.vector_index_labels = frozenset(labels)
+        self._vector_indexes_loaded = True
+        return self.vector_index_labels
+
+    async def query_vector_index(
+        self, label: str, search_vector: list[float], k: int
+    ) -> list[tuple[str, float]] | None:
+        if not self._vector_indexes_loaded:
+            await self.load_vector_indexes()
+        if label not in self.vector_index_labels:
+            return None
+        if self.embedding_dim and len(search_vector) != self.embedding_dim:
+            return None
+
+        records, _, _ = await self.execute_query(
+            get_falkordb_vector_index_query(label),
+            search_vector=search_vector,
+            k=k,
+            routing_='r',
+        )
+        hits = [(record['uuid'], record['score']) for record in records]
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits
 
     def session(self, database: str | None = None) -> GraphDriverSession:
         return FalkorDriverSession(self._get_graph(database))
@@ -194,13 +311,17 @@ class FalkorDriver(GraphDriver):
         await self.execute_query(
             'CALL db.indexes() YIELD name DROP INDEX name',
         )
+        self.vector_index_labels = frozenset()
 
     def clone(self, database: str) -> 'GraphDriver':
         """
         Returns a shallow copy of this driver with a different default database.
         Reuses the same connection (e.g. FalkorDB, Neo4j).
         """
-        cloned = FalkorDriver(falkor_db=self.client, database=database)
+        cloned = FalkorDriver(
+            falkor_db=self.client, database=database, embedding_dim=self.embedding_dim
+        )
+        cloned.instrumentation = self.instrumentation
 
         return cloned
 
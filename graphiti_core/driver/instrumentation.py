@@ -0,0 +1,287 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import random
+import sys
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from time import perf_counter
+from types import FrameType
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('GRAPHITI_SLOW_QUERY_MS', 1000))
+PROFILE_SAMPLE_RATE = float(os.getenv('GRAPHITI_PROFILE_SAMPLE_RATE', 0))
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+MAX_LOGGED_QUERY_LENGTH = 500
+
+# Set while an instrumented call is running so nested calls (a driver delegating to another
+# instrumented method, or PROFILE re-runs) are not recorded twice
+_observing: ContextVar[bool] = ContextVar('graphiti_query_observing', default=False)
+
+
+class QueryMetric(BaseModel):
+    name: str = Field(description='Stable query name: calling function plus a hash of the text')
+    provider: str | None = Field(default=None, description='Graph provider that ran the query')
+    duration_ms: float
+    rows: int | None = Field(default=None, description='Records returned, when known')
+    param_values: int = Field(description='Number of scalar values passed as parameters')
+    slow: bool = False
+    error: str | None = Field(default=None, description='Exception type if the query failed')
+    profile: str | None = Field(default=None, description='PROFILE plan for sampled slow reads')
+
+
+class QueryStats(BaseModel):
+    count: int = 0
+    errors: int = 0
+    slow: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    param_values: int = 0
+    buckets: list[int] = Field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        description='Latency histogram; bucket i counts calls <= LATENCY_BUCKETS_MS[i]',
+    )
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the histogram bucket containing the q-th percentile latency."""
+        if self.count == 0:
+            return 0.0
+        target = q / 100 * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+
+class QueryMetricsSink(ABC):
+    """Receives one QueryMetric per instrumented call; implement to export elsewhere."""
+
+    @abstractmethod
+    def record(self, metric: QueryMetric) -> None:
+        raise NotImplementedError()
+
+
+class InMemoryQueryMetrics(QueryMetricsSink):
+    """Aggregates latency histograms, row counts and parameter sizes per query name."""
+
+    def __init__(self):
+        self.stats: dict[str, QueryStats] = {}
+
+    def record(self, metric: QueryMetric) -> None:
+        stats = self.stats.get(metric.name)
+        if stats is None:
+            stats = self.stats[metric.name] = QueryStats()
+
+        stats.count += 1
+        stats.errors += metric.error is not None
+        stats.slow += metric.slow
+        stats.total_ms += metric.duration_ms
+        stats.max_ms = max(stats.max_ms, metric.duration_ms)
+        stats.rows += metric.rows or 0
+        stats.param_values += metric.param_values
+        stats.buckets[bisect_left(LATENCY_BUCKETS_MS, metric.duration_ms)] += 1
+
+    def slowest(self, n: int = 10) -> list[tuple[str, QueryStats]]:
+        return sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)[:n]
+
+    def clear(self):
+        self.stats.clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _query_digest(query: str) -> str:
+    return hashlib.sha1(' '.join(query.split()).encode()).hexdigest()[:8]
+
+
+def query_name(query: str, frame: FrameType | None) -> str:
+    """Name a query by the function that issued it, skipping driver internals."""
+    while frame is not None and frame.f_globals.get('__name__', '').startswith(
+        'graphiti_core.driver'
+    ):
+        frame = frame.f_back
+
+    caller = 'unknown'
+    if frame is not None:
+        module = frame.f_globals.get('__name__', '').rsplit('.', 1)[-1]
+        caller = f'{module}.{frame.f_code.co_name}'
+
+    return f'{caller}:{_query_digest(query)}'
+
+
+def count_param_values(value: Any) -> int:
+    if isinstance(value, dict):
+        return sum(count_param_values(v) for v in value.values())
+    if isinstance(value, list | tuple):
+        if value and isinstance(value[0], int | float):
+            # Embeddings and other flat numeric lists
+            return len(value)
+        return sum(count_param_values(v) for v in value)
+    return 1
+
+
+def _row_count(result: Any) -> int | None:
+    # Drivers return (records, header/summary, ...) tuples or columns; sessions may return anything
+    if isinstance(result, tuple) and result and hasattr(result[0], '__len__'):
+        return len(result[0])
+    if isinstance(result, dict):
+        return len(next(iter(result.values()), []))
+    return None
+
+
+class QueryInstrumentation:
+    """
+    Per-query instrumentation for GraphDriver.execute_query and GraphDriverSession.run.
+
+    Every call is tagged with a stable name and reported to the sink with its latency, row
+    count and parameter size. Calls slower than `slow_query_threshold_ms` are logged, and a
+    `profile_sample_rate` fraction of slow reads (`routing_='r'`) is re-run with PROFILE on
+    drivers that support it so the plan can be inspected. Only reads are profiled because
+    profiling executes the query again.
+    """
+
+    def __init__(
+        self,
+        sink: QueryMetricsSink | None = None,
+        slow_query_threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+        profile_sample_rate: float = PROFILE_SAMPLE_RATE,
+    ):
+        self.sink = sink if sink is not None else InMemoryQueryMetrics()
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.profile_sample_rate = profile_sample_rate
+
+    async def observe(
+        self,
+        query: str,
+        params: dict[str, Any],
+        run: Callable[[], Awaitable[T]],
+        name: str,
+        provider: str | None = None,
+        profile: Callable[[], Awaitable[str | None]] | None = None,
+    ) -> T:
+        error: str | None = None
+        result: Any = None
+        start = perf_counter()
+        try:
+            result = await run()
+            return result
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration_ms = (perf_counter() - start) * 1000
+            await self._report(query, params, name, provider, duration_ms, result, error, profile)
+
+    async def _report(
+        self,
+        query: str,
+        params: dict[str, Any],
+        name: str,
+        provider: str | None,
+        duration_ms: float,
+        result: Any,
+        error: str | None,
+        profile: Callable[[], Awaitable[str | None]] | None,
+    ):
+        slow = duration_ms >= self.slow_query_threshold_ms
+        metric = QueryMetric(
+            name=name,
+            provider=provider,
+            duration_ms=duration_ms,
+            rows=_row_count(result),
+            param_values=count_param_values(params),
+            slow=slow,
+            error=error,
+        )
+
+        if slow:
+            logger.warning(
+                f'Slow query {name} took {duration_ms:.1f} ms '
+                f'({metric.rows} rows, {metric.param_values} parameter values): '
+                f'{" ".join(query.split())[:MAX_LOGGED_QUERY_LENGTH]}'
+            )
+            if (
+                error is None
+                and profile is not None
+                and params.get('routing_') == 'r'
+                and random.random() < self.profile_sample_rate
+            ):
+                try:
+                    metric.profile = await profile()
+                except Exception as e:
+                    logger.warning(f'Failed to profile slow query {name}: {e}')
+                if metric.profile:
+                    logger.warning(f'PROFILE for {name}:\n{metric.profile}')
+
+        try:
+            self.sink.record(metric)
+        except Exception as e:
+            logger.error(f'Query metrics sink failed: {e}')
+
+
+def instrument_query(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Wrap a driver's execute_query or a session's run with its `instrumentation`, if any."""
+
+    @functools.wraps(method)
+    async def wrapper(self, cypher_query_, /, **kwargs: Any) -> T:
+        instrumentation: QueryInstrumentation | None = self.instrumentation
+        if instrumentation is None or _observing.get():
+            return await method(self, cypher_query_, **kwargs)
+
+        # Session.run accepts a list of (query, params) pairs; name the batch by its first query
+        text = (
+            str(cypher_query_[0][0])
+            if isinstance(cypher_query_, list) and cypher_query_
+            else str(cypher_query_)
+        )
+        name = query_name(text, sys._getframe(1))
+
+        profile = None
+        profile_query = getattr(self, 'profile_query', None)
+        if profile_query is not None:
+
+            async def profile() -> str | None:
+                return await profile_query(text, **kwargs)
+
+        provider = getattr(self, 'provider', None)
+        token = _observing.set(True)
+        try:
+            return await instrumentation.observe(
+                text,
+                kwargs,
+                lambda: method(self, cypher_query_, **kwargs),
+                name,
+                provider.value if provider is not None else None,
+                profile,
+            )
+        finally:
+            _observing.reset(token)
+
+    return wrapper
@@ -14,15 +14,24 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
+import os
 from typing import Any
 
 import kuzu
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.graph_queries import KUZU_VECTOR_INDEXES, get_kuzu_vector_index_query
+from graphiti_core.helpers import semaphore_gather
 
 logger = logging.getLogger(__name__)
 
+KUZU_READ_POOL_SIZE = int(os.getenv('KUZU_READ_POOL_SIZE', os.cpu_count() or 4))
+KUZU_MAX_THREADS_PER_READ = int(os.getenv('KUZU_MAX_THREADS_PER_READ', 0))
+# Dimension of the embeddings to index; 0 disables the vector indexes and search scans every row
+KUZU_EMBEDDING_DIM = int(os.getenv('KUZU_EMBEDDING_DIM', 0))
+
 # Kuzu requires an explicit schema.
 # As Kuzu currently does not support creating full text indexes on edge properties,
 # we work around this by representing (n:Entity)-[:RELATES_TO]->(m:Entity) as
@@ -54,6 +63,7 @@ SCHEMA_QUERIES = """
         name STRING,
         group_id STRING,
         created_at TIMESTAMP,
+        built_at TIMESTAMP,
         name_embedding FLOAT[],
         summary STRING
     );
@@ -98,13 +108,43 @@ class KuzuDriver(GraphDriver):
         self,
         db: str = ':memory:',
         max_concurrent_queries: int = 1,
+        read_pool_size: int = KUZU_READ_POOL_SIZE,
+        max_threads_per_read: int = KUZU_MAX_THREADS_PER_READ,
+        embedding_dim: int = KUZU_EMBEDDING_DIM,
     ):
+        """
+        Initialize the Kuzu driver.
+
+        Writes go through `client`, a pool of `max_concurrent_queries` connections; Kuzu only
+        runs one write transaction at a time, so the default of one keeps writes in order.
+        Queries issued with `routing_='r'` go through `read_client`, a separate pool of
+        `read_pool_size` connections (one per CPU by default) whose queries run in parallel
+        with each other and with ingestion. `max_threads_per_read` caps the threads a single
+        read may use; 0 lets Kuzu use every core for each query, while 1 favours throughput
+        when the pool is saturated.
+
+        With `embedding_dim` set, entity, community and fact embeddings of that size are
+        mirrored into tables with HNSW vector indexes (see KUZU_VECTOR_INDEXES), and
+        similarity search takes its candidates from the index instead of scanning every row.
+        Kuzu's vector index does not survive row deletions, so the embedding tables are
+        append-only; `rebuild_vector_indices` compacts them.
+        """
         super().__init__()
         self.db = kuzu.Database(db)
+        self.embedding_dim = embedding_dim
 
         self.setup_schema()
 
         self.client = kuzu.AsyncConnection(self.db, max_concurrent_queries=max_concurrent_queries)
+        self.read_client = (
+            kuzu.AsyncConnection(
+                self.db,
+                max_concurrent_queries=read_pool_size,
+                max_threads_per_query=max_threads_per_read,
+            )
+            if read_pool_size > 0
+            else self.client
+        )
 
     async def execute_query(
         self, cypher_query_: str, **kwargs: Any
@@ -112,10 +152,10 @@ class KuzuDriver(GraphDriver):
         params = {k: v for k, v in kwargs.items() if v is not None}
         # Kuzu does not support these parameters.
         params.pop('database_', None)
-        params.pop('routing_', None)
+        client = self.read_client if params.pop('routing_', None) == 'r' else self.client
 
         try:
-            results = await self.client.execute(cypher_query_, parameters=params)
+            results = await client.execute(cypher_query_, parameters=params)
         except Exception as e:
             params = {k: (v[:5] if isinstance(v, list) else v) for k, v in params.items()}
             logger.error(f'Error executing Kuzu query: {e}\n{cypher_query_}\n{params}')
@@ -140,11 +180,92 @@ class KuzuDriver(GraphDriver):
     def delete_all_indexes(self, database_: str):
         pass
 
+    def get_vector_index_dim(self, label: str) -> int:
+        return self.embedding_dim if label in self.vector_index_labels else 0
+
+    async def query_vector_index(
+        self, label: str, search_vector: list[float], k: int
+    ) -> list[tuple[str, float]] | None:
+        if label not in self.vector_index_labels or len(search_vector) != self.embedding_dim:
+            return None
+
+        records, _, _ = await self.execute_query(
+            get_kuzu_vector_index_query(label),
+            search_vector=search_vector,
+            k=k,
+            routing_='r',
+        )
+        # Kuzu does not return neighbours in distance order
+        hits = [(record['uuid'], record['score']) for record in records]
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits
+
+    async def rebuild_vector_indices(self):
+        """
+        Rebuild the embedding tables and their vector indexes from the current graph, dropping
+        rows for embeddings that have since changed or been deleted. Run it while no writes
+        are in flight.
+        """
+        if not self.embedding_dim:
+            return
+        await asyncio.to_thread(self._setup_vector_indices, rebuild=True)
+
     def setup_schema(self):
         conn = kuzu.Connection(self.db)
         conn.execute(SCHEMA_QUERIES)
         conn.close()
 
+        if self.embedding_dim:
+            self._setup_vector_indices()
+
+    def _setup_vector_indices(self, rebuild: bool = False):
+        conn = kuzu.Connection(self.db)
+        try:
+            existing = {row[1] for row in conn.execute('CALL SHOW_INDEXES() RETURN *;').get_all()}
+            for node_table, table, index, prop in KUZU_VECTOR_INDEXES.values():
+                if not rebuild and index in existing:
+                    self._check_embedding_table(conn, table)
+                    continue
+
+                # Deleting rows corrupts the index, so it is always rebuilt from an empty table
+                if index in existing:
+                    conn.execute(f"CALL DROP_VECTOR_INDEX('{table}', '{index}');")
+                conn.execute(f'DROP TABLE IF EXISTS {table};')
+                conn.execute(
+                    f'CREATE NODE TABLE {table} ('
+                    f'key STRING PRIMARY KEY, node_uuid STRING, embedding FLOAT[{self.embedding_dim}]);'
+                )
+                conn.execute(
+                    f"""
+                    MATCH (n:{node_table})
+                    WHERE n.{prop} IS NOT NULL AND size(n.{prop}) = $dim
+                    CREATE (:{table} {{
+                        key: n.uuid + ':' + string(hash(n.{prop})),
+                        node_uuid: n.uuid,
+                        embedding: n.{prop}
+                    }})
+                    """,
+                    {'dim': self.embedding_dim},
+                )
+                conn.execute(
+                    f"CALL CREATE_VECTOR_INDEX('{table}', '{index}', 'embedding', metric := 'cosine');"
+                )
+        finally:
+            conn.close()
+
+        self.vector_index_labels = frozenset(KUZU_VECTOR_INDEXES)
+
+    def _check_embedding_table(self, conn: kuzu.Connection, table: str):
+        columns = {
+            row[1]: row[2]
+            for row in conn.execute(f"CALL TABLE_INFO('{table}') RETURN *;").get_all()
+        }
+        if columns.get('embedding') != f'FLOAT[{self.embedding_dim}]':
+            raise ValueError(
+                f'{table} stores {columns.get("embedding")} embeddings but embedding_dim is '
+                f'{self.embedding_dim}; call rebuild_vector_indices() after changing embedders'
+            )
+
 
 class KuzuDriverSession(GraphDriverSession):
     provider = GraphProvider.KUZU
@@ -169,6 +290,13 @@ class KuzuDriverSession(GraphDriverSession):
 
     async def run(self, query: str | list, **kwargs: Any) -> Any:
         if isinstance(query, list):
+            if query and all(params.get('routing_') == 'r' for _, params in query):
+                # Reads do not depend on each other and can use the whole read pool
+                await semaphore_gather(
+                    *(self.driver.execute_query(cypher, **params) for cypher, params in query)
+                )
+                return None
+            # Writes run in order, since later statements may match what earlier ones created
             for cypher, params in query:
                 await self.driver.execute_query(cypher, **params)
         else:
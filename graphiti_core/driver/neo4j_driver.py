@@ -15,17 +15,23 @@ limitations under the License.
 """
 
 import logging
+import os
 from collections.abc import Coroutine
-from typing import Any
+from typing import Any, TypeVar
 
-from neo4j import AsyncGraphDatabase, EagerResult
+from neo4j import AsyncGraphDatabase, AsyncManagedTransaction, AsyncSession, EagerResult
+from neo4j.exceptions import ConnectionAcquisitionTimeoutError
+from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.instrumentation import QueryInstrumentation, instrument_query
 from graphiti_core.helpers import semaphore_gather
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 try:
     import boto3
     from opensearchpy import (
@@ -44,6 +50,103 @@ except ImportError:
     Urllib3HttpConnection = None
     _HAS_OPENSEARCH = False
 
+NEO4J_MAX_CONNECTION_POOL_SIZE = int(os.getenv('NEO4J_MAX_CONNECTION_POOL_SIZE', 100))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(os.getenv('NEO4J_CONNECTION_ACQUISITION_TIMEOUT', 60))
+NEO4J_MAX_CONNECTION_LIFETIME = float(os.getenv('NEO4J_MAX_CONNECTION_LIFETIME', 3600))
+NEO4J_FETCH_SIZE = int(os.getenv('NEO4J_FETCH_SIZE', 1000))
+
+# URI schemes that go through the cluster routing table; bolt:// connects to a single server
+ROUTING_SCHEMES = ('neo4j', 'neo4j+s', 'neo4j+ssc')
+
+
+class Neo4jPoolMetrics(BaseModel):
+    max_connection_pool_size: int = Field(description='Maximum connections per server')
+    in_flight_reads: int = Field(description='Read queries currently holding a connection')
+    in_flight_writes: int = Field(
+        description='Write queries and session transactions currently holding a connection'
+    )
+    peak_in_flight: int = Field(description='Highest number of concurrent queries observed')
+    total_reads: int = Field(description='Read queries executed since the driver was created')
+    total_writes: int = Field(
+        description='Write queries and session transactions run since the driver was created'
+    )
+    acquisition_timeouts: int = Field(
+        description='Queries that failed to obtain a connection from the pool in time'
+    )
+    utilization: float = Field(
+        description='In-flight queries as a fraction of the pool size; 1.0 means saturated'
+    )
+
+
+class _QueryCounters:
+    """Mutable counters shared by a driver and the copies returned by `with_database`."""
+
+    def __init__(self):
+        self.in_flight_reads = 0
+        self.in_flight_writes = 0
+        self.peak_in_flight = 0
+        self.total_reads = 0
+        self.total_writes = 0
+        self.acquisition_timeouts = 0
+
+    def acquire(self, is_read: bool):
+        if is_read:
+            self.in_flight_reads += 1
+            self.total_reads += 1
+        else:
+            self.in_flight_writes += 1
+            self.total_writes += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight_reads + self.in_flight_writes)
+
+    def release(self, is_read: bool):
+        if is_read:
+            self.in_flight_reads -= 1
+        else:
+            self.in_flight_writes -= 1
+
+
+class Neo4jTransaction:
+    """Managed transaction handed to `execute_write` callbacks, with instrumented `run`."""
+
+    provider = GraphProvider.NEO4J
+
+    def __init__(self, tx: AsyncManagedTransaction, instrumentation: QueryInstrumentation | None):
+        self.tx = tx
+        self.instrumentation = instrumentation
+
+    @instrument_query
+    async def run(self, query: LiteralString, **kwargs: Any) -> Any:
+        return await self.tx.run(query, **kwargs)
+
+
+class Neo4jSession(GraphDriverSession):
+    """
+    Wraps a Neo4j session so its queries, and those of its transactions, are instrumented and
+    counted in the driver's pool metrics. A `run` or a whole `execute_write` transaction holds
+    one connection and counts as one in-flight write.
+    """
+
+    provider = GraphProvider.NEO4J
+
+    def __init__(self, session: AsyncSession, driver: 'Neo4jDriver'):
+        self.session = session
+        self.driver = driver
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def run(self, query: LiteralString, **kwargs: Any) -> Any:
+        return await self.driver._hold_connection(False, self.session.run(query, **kwargs))
+
+    async def close(self):
+        await self.session.close()
+
+    async def execute_write(self, func, *args, **kwargs):
+        async def work(tx: AsyncManagedTransaction):
+            return await func(Neo4jTransaction(tx, self.instrumentation), *args, **kwargs)
+
+        return await self.driver._hold_connection(False, self.session.execute_write(work))
+
 
 class Neo4jDriver(GraphDriver):
     provider = GraphProvider.NEO4J
@@ -59,13 +162,43 @@ class Neo4jDriver(GraphDriver):
         aws_profile_name: str | None = None,
         aws_region: str | None = None,
         aws_service: str | None = None,
+        max_connection_pool_size: int = NEO4J_MAX_CONNECTION_POOL_SIZE,
+        connection_acquisition_timeout: float = NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        max_connection_lifetime: float = NEO4J_MAX_CONNECTION_LIFETIME,
+        fetch_size: int = NEO4J_FETCH_SIZE,
+        route_reads_to_followers: bool = True,
     ):
+        """
+        Initialize the Neo4j driver.
+
+        Pool settings are passed through to the Neo4j driver. Each `execute_query` call holds
+        one pooled connection for its duration, so `max_connection_pool_size` bounds the
+        concurrency per server and `connection_acquisition_timeout` is how long a query waits
+        for a free connection before failing. `max_connection_lifetime` recycles connections
+        before load balancers or firewalls drop them, and `fetch_size` is the number of records
+        pulled per batch.
+
+        Queries issued with `routing_='r'` are sent to followers and read replicas when the URI
+        uses a routing scheme (neo4j://, neo4j+s://), so search load scales across a causal
+        cluster independently of ingestion writes. Set `route_reads_to_followers=False` to send
+        every query to the leader, e.g. when reads must observe the latest writes.
+        """
         super().__init__()
         self.client = AsyncGraphDatabase.driver(
             uri=uri,
             auth=(user or '', password or ''),
+            max_connection_pool_size=max_connection_pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+            max_connection_lifetime=max_connection_lifetime,
+            fetch_size=fetch_size,
         )
         self._database = database
+        self.max_connection_pool_size = max_connection_pool_size
+        self.route_reads_to_followers = route_reads_to_followers
+        if route_reads_to_followers and uri.split('://', 1)[0] not in ROUTING_SCHEMES:
+            logger.debug(f'{uri} does not use a routing scheme; reads will go to the same server')
+
+        self._counters = _QueryCounters()
 
         self.aoss_client = None
         if aoss_host and aoss_port and boto3 is not None:
@@ -95,19 +228,74 @@ class Neo4jDriver(GraphDriver):
             params = {}
         params.setdefault('database_', self._database)
 
+        is_read = kwargs.get('routing_') == 'r'
+        if is_read and not self.route_reads_to_followers:
+            kwargs.pop('routing_')
+
         try:
-            result = await self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
+            result = await self._hold_connection(
+                is_read, self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
+            )
+        except ConnectionAcquisitionTimeoutError:
+            raise
         except Exception as e:
             logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
             raise
 
         return result
 
+    async def _hold_connection(self, is_read: bool, work: Coroutine[Any, Any, T]) -> T:
+        """Await `work`, counting it as a query holding a pooled connection."""
+        self._counters.acquire(is_read)
+        try:
+            return await work
+        except ConnectionAcquisitionTimeoutError:
+            self._counters.acquisition_timeouts += 1
+            logger.warning(
+                f'Timed out waiting for a Neo4j connection; pool metrics: {self.pool_metrics()}'
+            )
+            raise
+        finally:
+            self._counters.release(is_read)
+
+    async def profile_query(self, cypher_query_: LiteralString, **kwargs: Any) -> str | None:
+        params = dict(kwargs.pop('params', None) or {})
+        params.setdefault('database_', self._database)
+        if not self.route_reads_to_followers:
+            kwargs.pop('routing_', None)
+
+        result = await self.client.execute_query(
+            'PROFILE ' + cypher_query_,  # type: ignore[operator]
+            parameters_=params,
+            **kwargs,
+        )
+        return str(result.summary.profile)
+
+    def pool_metrics(self) -> Neo4jPoolMetrics:
+        """
+        Connection pool utilization as seen by `execute_query` calls and by the queries and
+        write transactions of sessions opened through this driver.
+        """
+        counters = self._counters
+        in_flight = counters.in_flight_reads + counters.in_flight_writes
+        return Neo4jPoolMetrics(
+            max_connection_pool_size=self.max_connection_pool_size,
+            in_flight_reads=counters.in_flight_reads,
+            in_flight_writes=counters.in_flight_writes,
+            peak_in_flight=counters.peak_in_flight,
+            total_reads=counters.total_reads,
+            total_writes=counters.total_writes,
+            acquisition_timeouts=counters.acquisition_timeouts,
+            utilization=in_flight / self.max_connection_pool_size,
+        )
+
     def session(self, database: str | None = None) -> GraphDriverSession:
         _database = database or self._database
-        return self.client.session(database=_database)  # type: ignore
+        return Neo4jSession(self.client.session(database=_database), self)
 
     async def close(self) -> None:
+        if self.aoss_indexer is not None:
+            await self.aoss_indexer.close()
         return await self.client.close()
 
     def delete_all_indexes(self) -> Coroutine:
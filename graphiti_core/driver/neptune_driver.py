@@ -17,15 +17,24 @@ limitations under the License.
 import asyncio
 import datetime
 import logging
-from collections.abc import Coroutine
-from typing import Any
+import os
+import re
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import boto3
+from botocore.config import Config
 from langchain_aws.graphs import NeptuneAnalyticsGraph, NeptuneGraph
-from opensearchpy import OpenSearch, Urllib3AWSV4SignerAuth, Urllib3HttpConnection
+from opensearchpy import AsyncHttpConnection, AsyncOpenSearch, AWSV4SignerAsyncAuth
 
 from graphiti_core.driver.driver import (
+    COMMUNITY_INDEX_NAME,
     DEFAULT_SIZE,
+    ENTITY_EDGE_INDEX_NAME,
+    ENTITY_INDEX_NAME,
+    EPISODE_INDEX_NAME,
     GraphDriver,
     GraphDriverSession,
     GraphProvider,
@@ -33,6 +42,11 @@ from graphiti_core.driver.driver import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+NEPTUNE_MAX_CONCURRENT_QUERIES = int(os.getenv('NEPTUNE_MAX_CONCURRENT_QUERIES', 20))
+NEPTUNE_QUERY_TIMEOUT = float(os.getenv('NEPTUNE_QUERY_TIMEOUT', 60))
+
 neptune_aoss_indices = [
     {
         'index_name': 'node_name_and_summary',
@@ -113,31 +127,103 @@ neptune_aoss_indices = [
     },
 ]
 
+# Maps the provider-independent index names used by nodes/edges onto the Neptune indices
+neptune_aoss_index_names = {
+    ENTITY_INDEX_NAME: 'node_name_and_summary',
+    COMMUNITY_INDEX_NAME: 'community_name',
+    EPISODE_INDEX_NAME: 'episode_content',
+    ENTITY_EDGE_INDEX_NAME: 'edge_name_and_fact',
+}
+
+PARAMETER_PATTERN = re.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)')
+
+
+def _convert_datetimes(value: Any) -> Any:
+    """Return a copy of value with every datetime replaced by its ISO 8601 string."""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        # Parameter lists are homogeneous, so lists of scalars (embeddings, uuids, labels)
+        # are passed through without walking every element
+        if value and isinstance(value[0], float | int | str):
+            return value
+        return [_convert_datetimes(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _convert_datetimes(v) for k, v in value.items()}
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _compile_query(query: str, datetime_list_params: frozenset[str]) -> str:
+    """
+    Rewrite a query template once per parameter shape.
+
+    Top-level list parameters that hold datetimes are sent as ISO strings and converted
+    server side with a list comprehension, so the query text stays the same from call to
+    call regardless of the values.
+    """
+    if not datetime_list_params:
+        return query
+
+    def _rewrite(match: re.Match) -> str:
+        name = match.group(1)
+        if name in datetime_list_params:
+            return f'[dt IN ${name} | datetime(dt)]'
+        return match.group(0)
+
+    return PARAMETER_PATTERN.sub(_rewrite, query)
+
+
+def prepare_query(query: str, params: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    datetime_list_params = frozenset(
+        k
+        for k, v in params.items()
+        if isinstance(v, list) and v and isinstance(v[0], datetime.datetime)
+    )
+    return _compile_query(query, datetime_list_params), _convert_datetimes(params)
+
 
 class NeptuneDriver(GraphDriver):
     provider: GraphProvider = GraphProvider.NEPTUNE
 
-    def __init__(self, host: str, aoss_host: str, port: int = 8182, aoss_port: int = 443):
+    def __init__(
+        self,
+        host: str,
+        aoss_host: str,
+        port: int = 8182,
+        aoss_port: int = 443,
+        max_concurrent_queries: int = NEPTUNE_MAX_CONCURRENT_QUERIES,
+        query_timeout: float | None = NEPTUNE_QUERY_TIMEOUT,
+    ):
         """This initializes a NeptuneDriver for use with Neptune as a backend
 
+        The Neptune clients are synchronous, so queries run on a dedicated bounded thread pool
+        to keep the event loop free. OpenSearch calls use the async client.
+
         Args:
             host (str): The Neptune Database or Neptune Analytics host
             aoss_host (str): The OpenSearch host value
             port (int, optional): The Neptune Database port, ignored for Neptune Analytics. Defaults to 8182.
             aoss_port (int, optional): The OpenSearch port. Defaults to 443.
+            max_concurrent_queries (int, optional): Size of the query thread pool. Defaults to 20.
+            query_timeout (float | None, optional): Seconds before a query is abandoned, also used as the client read timeout. None to wait indefinitely. Defaults to 60.
         """
         if not host:
             raise ValueError('You must provide an endpoint to create a NeptuneDriver')
 
+        # A client side read timeout makes boto give up on a stuck request, which is the only
+        # way to actually free the worker thread running it
+        config = Config(read_timeout=query_timeout) if query_timeout is not None else None
+
         if host.startswith('neptune-db://'):
             # This is a Neptune Database Cluster
             endpoint = host.replace('neptune-db://', '')
-            self.client = NeptuneGraph(endpoint, port)
+            self.client = NeptuneGraph(endpoint, port, config=config)
             logger.debug('Creating Neptune Database session for %s', host)
         elif host.startswith('neptune-graph://'):
             # This is a Neptune Analytics Graph
             graphId = host.replace('neptune-graph://', '')
-            self.client = NeptuneAnalyticsGraph(graphId)
+            self.client = NeptuneAnalyticsGraph(graphId, config=config)
             logger.debug('Creating Neptune Graph session for %s', host)
         else:
             raise ValueError(
@@ -147,54 +233,67 @@ class NeptuneDriver(GraphDriver):
         if not aoss_host:
             raise ValueError('You must provide an AOSS endpoint to create an OpenSearch driver.')
 
+        self.max_concurrent_queries = max_concurrent_queries
+        self.query_timeout = query_timeout
+        # Admits at most one query per pool thread, so submitted queries start right away and
+        # the timeout only covers running work, never time spent queued behind other queries
+        self._query_slots = asyncio.Semaphore(max_concurrent_queries)
+        self._executor = self._create_executor()
+
         session = boto3.Session()
-        self.aoss_client = OpenSearch(
+        self.aoss_client = AsyncOpenSearch(
             hosts=[{'host': aoss_host, 'port': aoss_port}],
-            http_auth=Urllib3AWSV4SignerAuth(
-                session.get_credentials(), session.region_name, 'aoss'
-            ),
+            http_auth=AWSV4SignerAsyncAuth(session.get_credentials(), session.region_name, 'aoss'),
             use_ssl=True,
             verify_certs=True,
-            connection_class=Urllib3HttpConnection,
-            pool_maxsize=20,
+            connection_class=AsyncHttpConnection,
+            pool_maxsize=max_concurrent_queries,
         )
 
-    def _sanitize_parameters(self, query, params: dict):
-        if isinstance(query, list):
-            queries = []
-            for q in query:
-                queries.append(self._sanitize_parameters(q, params))
-            return queries
-        else:
-            for k, v in params.items():
-                if isinstance(v, datetime.datetime):
-                    params[k] = v.isoformat()
-                elif isinstance(v, list):
-                    # Handle lists that might contain datetime objects
-                    for i, item in enumerate(v):
-                        if isinstance(item, datetime.datetime):
-                            v[i] = item.isoformat()
-                            query = str(query).replace(f'${k}', f'datetime(${k})')
-                        if isinstance(item, dict):
-                            query = self._sanitize_parameters(query, v[i])
-
-                    # If the list contains datetime objects, we need to wrap each element with datetime()
-                    if any(isinstance(item, str) and 'T' in item for item in v):
-                        # Create a new list expression with datetime() wrapped around each element
-                        datetime_list = (
-                            '['
-                            + ', '.join(
-                                f'datetime("{item}")'
-                                if isinstance(item, str) and 'T' in item
-                                else repr(item)
-                                for item in v
-                            )
-                            + ']'
-                        )
-                        query = str(query).replace(f'${k}', datetime_list)
-                elif isinstance(v, dict):
-                    query = self._sanitize_parameters(query, v)
-            return query
+    def _create_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_concurrent_queries, thread_name_prefix='neptune-query'
+        )
+
+    def _replace_executor(self, stalled: ThreadPoolExecutor) -> None:
+        """
+        Swap in a fresh pool after a query on ``stalled`` timed out.
+
+        The timed out worker thread cannot be interrupted and would otherwise hold one of the
+        pool's threads until the query returns, so enough hung queries would block every later
+        one. The old pool is shut down without waiting and its threads exit as their queries
+        finish or hit the client read timeout. Its still running queries keep their query
+        slots, so only the hung queries run beyond `max_concurrent_queries`.
+        """
+        if self._executor is not stalled:
+            # Another timed out query on the same pool already replaced it
+            return
+        self._executor = self._create_executor()
+        stalled.shutdown(wait=False)
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        async with self._query_slots:
+            loop = asyncio.get_running_loop()
+            started = asyncio.Event()
+
+            def run() -> T:
+                loop.call_soon_threadsafe(started.set)
+                return func(*args)
+
+            executor = self._executor
+            future = asyncio.wrap_future(executor.submit(run))
+            # The timeout starts once a worker picks the query up
+            waiting = asyncio.ensure_future(started.wait())
+            try:
+                await asyncio.wait([future, waiting], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiting.cancel()
+            try:
+                return await asyncio.wait_for(future, timeout=self.query_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f'Neptune query timed out after {self.query_timeout}s')
+                self._replace_executor(executor)
+                raise
 
     async def execute_query(
         self, cypher_query_, **kwargs: Any
@@ -202,13 +301,13 @@ class NeptuneDriver(GraphDriver):
         params = dict(kwargs)
         if isinstance(cypher_query_, list):
             for q in cypher_query_:
-                result, _, _ = self._run_query(q[0], q[1])
+                result, _, _ = await self._run_in_executor(self._run_query, q[0], q[1])
             return result, None, None
         else:
-            return self._run_query(cypher_query_, params)
+            return await self._run_in_executor(self._run_query, cypher_query_, params)
 
     def _run_query(self, cypher_query_, params):
-        cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
+        cypher_query_, params = prepare_query(str(cypher_query_), params)
         try:
             result = self.client.query(cypher_query_, params=params)
         except Exception as e:
@@ -223,6 +322,10 @@ class NeptuneDriver(GraphDriver):
         return NeptuneDriverSession(driver=self)
 
     async def close(self) -> None:
+        if self.aoss_indexer is not None:
+            await self.aoss_indexer.close()
+        await self.aoss_client.close()
+        self._executor.shutdown(wait=False)
         return self.client.client.close()
 
     async def _delete_all_data(self) -> Any:
@@ -236,12 +339,12 @@ class NeptuneDriver(GraphDriver):
                 raise ValueError(
                     'You must provide an AOSS endpoint to create an OpenSearch driver.'
                 )
-            if not client.indices.exists(index=index_name):
+            if not await client.indices.exists(index=index_name):
                 await client.indices.create(index=index_name, body=index['body'])
 
             alias_name = index.get('alias_name', index_name)
 
-            if not client.indices.exists_alias(name=alias_name, index=index_name):
+            if not await client.indices.exists_alias(name=alias_name, index=index_name):
                 await client.indices.put_alias(index=index_name, name=alias_name)
 
         # Sleep for 1 minute to let the index creation complete
@@ -250,6 +353,47 @@ class NeptuneDriver(GraphDriver):
     def delete_all_indexes(self) -> Coroutine[Any, Any, Any]:
         return self.delete_all_indexes_impl()
 
+    def _get_aoss_index(self, name: str) -> dict[str, Any] | None:
+        name = neptune_aoss_index_names.get(name.lower(), name.lower())
+        for index in neptune_aoss_indices:
+            if name in (index['index_name'], index['alias_name']):
+                return index
+        return None
+
+    async def run_aoss_query(
+        self, name: str, query_text: str, limit: int = DEFAULT_SIZE
+    ) -> dict[str, Any]:
+        index = self._get_aoss_index(name)
+        if index is None:
+            return {'hits': {'total': {'value': 0}, 'hits': []}}
+
+        body = {
+            'query': {
+                'multi_match': {
+                    'query': query_text,
+                    'fields': index['query']['query']['multi_match']['fields'],
+                }
+            },
+            'size': limit,
+        }
+        return await self.aoss_client.search(body=body, index=index['index_name'])
+
+    async def save_to_aoss(self, name: str, data: list[dict]) -> int:
+        index = self._get_aoss_index(name)
+        if index is None:
+            return 0
+
+        properties = index['body']['mappings']['properties']
+        to_index = [
+            {
+                '_index': index['index_name'],
+                '_id': d['uuid'],
+                '_source': {p: d[p] for p in properties if p in d},
+            }
+            for d in data
+        ]
+        return await self.get_aoss_indexer().submit(to_index)
+
 
 class NeptuneDriverSession(GraphDriverSession):
     provider = GraphProvider.NEPTUNE
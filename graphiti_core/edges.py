@@ -22,13 +22,14 @@ from time import time
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
 from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import ENTITY_EDGE_INDEX_NAME, GraphDriver, GraphProvider
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import Embedding, embedding_to_list, parse_db_date, to_embedding
 from graphiti_core.models.edges.edge_db_queries import (
     COMMUNITY_EDGE_RETURN,
     EPISODIC_EDGE_RETURN,
@@ -78,10 +79,8 @@ class Edge(BaseModel, ABC):
             )
 
             if driver.aoss_client:
-                await driver.aoss_client.delete(
-                    index=ENTITY_EDGE_INDEX_NAME,
-                    id=self.uuid,
-                    params={'routing': self.group_id},
+                await driver.delete_from_aoss(
+                    [ENTITY_EDGE_INDEX_NAME], [self.uuid], routing=self.group_id
                 )
 
         logger.debug(f'Deleted Edge: {self.uuid}')
@@ -228,7 +227,7 @@ class EpisodicEdge(Edge):
 class EntityEdge(Edge):
     name: str = Field(description='name of the edge, relation name')
     fact: str = Field(description='fact representing the edge and nodes that it connects')
-    fact_embedding: list[float] | None = Field(default=None, description='embedding of the fact')
+    fact_embedding: Embedding | None = Field(default=None, description='embedding of the fact')
     episodes: list[str] = Field(
         default=[],
         description='list of episode ids that reference these entity edges',
@@ -250,7 +249,7 @@ class EntityEdge(Edge):
         start = time()
 
         text = self.fact.replace('\n', ' ')
-        self.fact_embedding = await embedder.create(input_data=[text])
+        self.fact_embedding = to_embedding(await embedder.create(input_data=[text]))
 
         end = time()
         logger.debug(f'embedded {text} in {end - start} ms')
@@ -279,7 +278,9 @@ class EntityEdge(Edge):
             )
 
             if resp['hits']['hits']:
-                self.fact_embedding = resp['hits']['hits'][0]['_source']['fact_embedding']
+                self.fact_embedding = to_embedding(
+                    resp['hits']['hits'][0]['_source']['fact_embedding']
+                )
                 return
             else:
                 raise EdgeNotFoundError(self.uuid)
@@ -299,7 +300,7 @@ class EntityEdge(Edge):
         if len(records) == 0:
             raise EdgeNotFoundError(self.uuid)
 
-        self.fact_embedding = records[0]['fact_embedding']
+        self.fact_embedding = to_embedding(records[0]['fact_embedding'])
 
     async def save(self, driver: GraphDriver):
         edge_data: dict[str, Any] = {
@@ -309,7 +310,7 @@ class EntityEdge(Edge):
             'name': self.name,
             'group_id': self.group_id,
             'fact': self.fact,
-            'fact_embedding': self.fact_embedding,
+            'fact_embedding': embedding_to_list(self.fact_embedding),
             'episodes': self.episodes,
             'created_at': self.created_at,
             'expired_at': self.expired_at,
@@ -320,7 +321,11 @@ class EntityEdge(Edge):
         if driver.provider == GraphProvider.KUZU:
             edge_data['attributes'] = json.dumps(self.attributes)
             result = await driver.execute_query(
-                get_entity_edge_save_query(driver.provider, has_aoss=bool(driver.aoss_client)),
+                get_entity_edge_save_query(
+                    driver.provider,
+                    has_aoss=bool(driver.aoss_client),
+                    vector_index_dim=driver.get_vector_index_dim('RELATES_TO'),
+                ),
                 **edge_data,
             )
         else:
@@ -647,5 +652,7 @@ async def create_entity_edge_embeddings(embedder: EmbedderClient, edges: list[En
     if len(edges) == 0:
         return
     fact_embeddings = await embedder.create_batch([edge.fact for edge in edges])
-    for edge, fact_embedding in zip(edges, fact_embeddings, strict=True):
+    # Edges hold row views into one contiguous float32 matrix rather than separate lists
+    matrix = np.asarray(fact_embeddings, dtype=np.float32)
+    for edge, fact_embedding in zip(edges, matrix, strict=True):
         edge.fact_embedding = fact_embedding
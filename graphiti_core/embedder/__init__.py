@@ -1,8 +1,14 @@
+from .cache import CachedEmbedder, EmbeddingCacheConfig
 from .client import EmbedderClient
+from .coalesce import CoalescingConfig, CoalescingEmbedder
 from .openai import OpenAIEmbedder, OpenAIEmbedderConfig
 
 __all__ = [
+    'CachedEmbedder',
+    'CoalescingConfig',
+    'CoalescingEmbedder',
     'EmbedderClient',
+    'EmbeddingCacheConfig',
     'OpenAIEmbedder',
     'OpenAIEmbedderConfig',
 ]
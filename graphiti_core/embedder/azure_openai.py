@@ -19,7 +19,9 @@ from typing import Any
 
 from openai import AsyncAzureOpenAI
 
+from .batching import EmbeddingBatcher
 from .client import EmbedderClient
+from .openai import DEFAULT_BATCH_SIZE, DEFAULT_MAX_BATCH_TOKENS
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +29,18 @@ logger = logging.getLogger(__name__)
 class AzureOpenAIEmbedderClient(EmbedderClient):
     """Wrapper class for AsyncAzureOpenAI that implements the EmbedderClient interface."""
 
-    def __init__(self, azure_client: AsyncAzureOpenAI, model: str = 'text-embedding-3-small'):
+    def __init__(
+        self,
+        azure_client: AsyncAzureOpenAI,
+        model: str = 'text-embedding-3-small',
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_tokens: int | None = DEFAULT_MAX_BATCH_TOKENS,
+    ):
         self.azure_client = azure_client
         self.model = model
+        self.batcher = EmbeddingBatcher(
+            max_batch_size=batch_size, max_batch_tokens=max_batch_tokens
+        )
 
     async def create(self, input_data: str | list[str] | Any) -> list[float]:
         """Create embeddings using Azure OpenAI client."""
@@ -54,11 +65,11 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         """Create batch embeddings using Azure OpenAI client."""
         try:
-            response = await self.azure_client.embeddings.create(
-                model=self.model, input=input_data_list
-            )
-
-            return [embedding.embedding for embedding in response.data]
+            return await self.batcher.run(input_data_list, self._embed_chunk)
         except Exception as e:
             logger.error(f'Error in Azure OpenAI batch embedding: {e}')
             raise
+
+    async def _embed_chunk(self, chunk: list[str]) -> list[list[float]]:
+        response = await self.azure_client.embeddings.create(model=self.model, input=chunk)
+        return [embedding.embedding for embedding in response.data]
@@ -0,0 +1,123 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CONCURRENCY = int(os.getenv('EMBEDDING_CONCURRENCY', 4))
+DEFAULT_MAX_RETRIES = 2
+# Rough chars-per-token ratio for English text, used to stay under per-request token limits
+# without pulling in a tokenizer for every provider.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class EmbeddingBatcher:
+    """
+    Shared batching engine for embedder create_batch implementations.
+
+    Splits the input into chunks bounded by item count and estimated token count, embeds
+    the chunks concurrently with at most `max_concurrency` requests in flight, and
+    reassembles the vectors in input order. A failed chunk is retried on its own with
+    exponential backoff; chunks that succeeded are never re-sent. ValueError and TypeError
+    are treated as deterministic (bad input or malformed response) and are not retried.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_batch_tokens: int | None = None,
+        max_concurrency: int = EMBEDDING_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_retry_wait: float = 10.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+
+    def split(self, input_data_list: list[str]) -> list[list[str]]:
+        chunks: list[list[str]] = []
+        chunk: list[str] = []
+        chunk_tokens = 0
+        for text in input_data_list:
+            tokens = estimate_tokens(text)
+            over_tokens = (
+                self.max_batch_tokens is not None and chunk_tokens + tokens > self.max_batch_tokens
+            )
+            if chunk and (len(chunk) >= self.max_batch_size or over_tokens):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(text)
+            chunk_tokens += tokens
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def run(
+        self,
+        input_data_list: list[str],
+        embed_chunk: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        if not input_data_list:
+            return []
+
+        chunks = self.split(input_data_list)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _embed(index: int, chunk: list[str]) -> list[list[float]]:
+            async with semaphore:
+                async for attempt in AsyncRetrying(
+                    stop=stop_after_attempt(self.max_retries + 1),
+                    wait=wait_random_exponential(multiplier=0.5, max=self.max_retry_wait),
+                    retry=retry_if_not_exception_type((ValueError, TypeError)),
+                    reraise=True,
+                ):
+                    with attempt:
+                        if attempt.retry_state.attempt_number > 1:
+                            logger.warning(
+                                f'Retrying embedding chunk {index + 1}/{len(chunks)} '
+                                f'(attempt {attempt.retry_state.attempt_number})'
+                            )
+                        embeddings = await embed_chunk(chunk)
+                        if len(embeddings) != len(chunk):
+                            raise ValueError(
+                                f'Expected {len(chunk)} embeddings, got {len(embeddings)}'
+                            )
+                        return embeddings
+            raise AssertionError('unreachable')
+
+        results = await asyncio.gather(*(_embed(i, chunk) for i, chunk in enumerate(chunks)))
+        return [embedding for chunk_result in results for embedding in chunk_result]
@@ -0,0 +1,274 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .client import EmbedderClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_DISK_CAPACITY = 1_000_000
+
+
+class EmbeddingCacheConfig(BaseModel):
+    max_entries: int = Field(
+        default=DEFAULT_MAX_ENTRIES, description='Maximum number of vectors kept in memory'
+    )
+    disk_path: str | None = Field(
+        default=None, description='Directory for the memory-mapped float32 store, if any'
+    )
+    disk_capacity: int = Field(
+        default=DEFAULT_DISK_CAPACITY, description='Maximum number of vectors kept on disk'
+    )
+
+
+def embedding_cache_key(model: str, dim: int, text: str) -> str:
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return f'{model}:{dim}:{digest}'
+
+
+class DiskEmbeddingStore:
+    """
+    Append-only float32 vector store backed by np.memmap.
+
+    Vectors live in a fixed-size `<dim>.f32` matrix and the cache keys in a sidecar
+    `<dim>.keys` file, one key per line, where the line number is the matrix row. A row
+    is always flushed before its key is written so a crash never leaves a key pointing
+    at an unwritten row.
+    """
+
+    def __init__(self, path: str, dim: int, capacity: int = DEFAULT_DISK_CAPACITY):
+        os.makedirs(path, exist_ok=True)
+        self.dim = dim
+        self.capacity = capacity
+        self._vectors_path = os.path.join(path, f'{dim}.f32')
+        self._keys_path = os.path.join(path, f'{dim}.keys')
+
+        mode = 'r+' if os.path.exists(self._vectors_path) else 'w+'
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float32, mode=mode, shape=(capacity, dim)
+        )
+
+        self._rows: dict[str, int] = {}
+        if os.path.exists(self._keys_path):
+            with open(self._keys_path, encoding='utf-8') as f:
+                for row, line in enumerate(f):
+                    key = line.rstrip('\n')
+                    if key and row < capacity:
+                        self._rows[key] = row
+
+        self._keys_file = open(self._keys_path, 'a', encoding='utf-8')  # noqa: SIM115
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def get(self, key: str) -> list[float] | None:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return self._vectors[row].tolist()
+
+    def put_many(self, items: list[tuple[str, list[float]]]) -> None:
+        new_items = [(key, vector) for key, vector in items if key not in self._rows]
+        sized_items = [(key, vector) for key, vector in new_items if len(vector) == self.dim]
+        if len(sized_items) < len(new_items):
+            logger.warning(
+                f'Embedding disk store at {self._vectors_path} holds {self.dim}-dimensional '
+                f'vectors, dropping {len(new_items) - len(sized_items)} of another size'
+            )
+            new_items = sized_items
+        available = self.capacity - len(self._rows)
+        if len(new_items) > available:
+            logger.warning(
+                f'Embedding disk store at {self._vectors_path} is full, '
+                f'dropping {len(new_items) - available} vectors'
+            )
+            new_items = new_items[:available]
+        if not new_items:
+            return
+
+        start = len(self._rows)
+        for offset, (_, vector) in enumerate(new_items):
+            self._vectors[start + offset] = np.asarray(vector, dtype=np.float32)
+        self._vectors.flush()
+
+        self._keys_file.write(''.join(f'{key}\n' for key, _ in new_items))
+        self._keys_file.flush()
+        for offset, (key, _) in enumerate(new_items):
+            self._rows[key] = start + offset
+
+    def close(self) -> None:
+        self._vectors.flush()
+        self._keys_file.close()
+
+
+class CachedEmbedder(EmbedderClient):
+    """
+    Caching wrapper around any EmbedderClient.
+
+    Embeddings are keyed by (model, embedding_dim, sha256(text)) and kept in a bounded
+    in-memory LRU, optionally backed by a memory-mapped on-disk store that survives
+    restarts. create_batch only forwards cache misses to the wrapped client, and repeated
+    strings within a single batch are embedded once.
+
+    Only plain text inputs are cached; token id inputs are passed through unchanged.
+
+    The model and dimension are read from the client at the bottom of any wrapper chain
+    (clients exposing the client they wrap as `.embedder`), and must be passed explicitly
+    when that client does not expose them.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbedderClient,
+        config: EmbeddingCacheConfig | None = None,
+        model: str | None = None,
+        embedding_dim: int | None = None,
+    ):
+        if config is None:
+            config = EmbeddingCacheConfig()
+        self.embedder = embedder
+        self.config = config
+
+        inner = embedder
+        while isinstance(getattr(inner, 'embedder', None), EmbedderClient):
+            inner = inner.embedder  # type: ignore[attr-defined]
+        inner_config = getattr(inner, 'config', None)
+
+        if model is None:
+            model = getattr(inner_config, 'embedding_model', None)
+        if not isinstance(model, str):
+            model = getattr(inner, 'model', None)
+        if not isinstance(model, str) or not model:
+            raise ValueError(
+                f'Cannot tell which model {type(inner).__name__} embeds with; pass model='
+            )
+        if embedding_dim is None:
+            embedding_dim = getattr(inner_config, 'embedding_dim', None)
+        if not isinstance(embedding_dim, int):
+            raise ValueError(
+                f'Cannot tell the embedding size of {type(inner).__name__}; pass embedding_dim='
+            )
+        self.model: str = model
+        self.embedding_dim: int = embedding_dim
+
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._disk: DiskEmbeddingStore | None = None
+        if config.disk_path is not None:
+            self._disk = DiskEmbeddingStore(
+                config.disk_path, self.embedding_dim, config.disk_capacity
+            )
+
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        return embedding_cache_key(self.model, self.embedding_dim, text)
+
+    def _get(self, key: str) -> list[float] | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            return list(vector)
+
+        if self._disk is not None:
+            vector = self._disk.get(key)
+            if vector is not None:
+                self._remember(key, vector)
+                return vector
+
+        return None
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._memory[key] = list(vector)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.max_entries:
+            self._memory.popitem(last=False)
+
+    def _put_many(self, items: list[tuple[str, list[float]]]) -> None:
+        for key, vector in items:
+            self._remember(key, vector)
+        if self._disk is not None:
+            self._disk.put_many(items)
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            text = input_data
+        elif (
+            isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str)
+        ):
+            text = input_data[0]
+        else:
+            return await self.embedder.create(input_data)
+
+        key = self._key(text)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        embedding = await self.embedder.create(input_data)
+        self._put_many([(key, embedding)])
+        return embedding
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if not input_data_list:
+            return []
+
+        keys = [self._key(text) for text in input_data_list]
+        results: list[list[float] | None] = []
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, input_data_list, strict=True):
+            cached = self._get(key)
+            if cached is None and key not in missing:
+                missing[key] = text
+            results.append(cached)
+
+        self.hits += len(input_data_list) - sum(1 for r in results if r is None)
+        self.misses += len(missing)
+
+        if missing:
+            embeddings = await self.embedder.create_batch(list(missing.values()))
+            fetched = dict(zip(missing.keys(), embeddings, strict=True))
+            self._put_many(list(fetched.items()))
+            results = [
+                r if r is not None else list(fetched[key])
+                for r, key in zip(results, keys, strict=True)
+            ]
+
+        return results  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Drop the in-memory tier. The on-disk store is left untouched."""
+        self._memory.clear()
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
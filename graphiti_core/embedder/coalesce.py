@@ -0,0 +1,125 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from pydantic import BaseModel, Field
+
+from .client import EmbedderClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class CoalescingConfig(BaseModel):
+    window_ms: float = Field(
+        default=DEFAULT_WINDOW_MS,
+        description='How long to wait for more requests after the first one arrives',
+    )
+    max_batch_size: int = Field(
+        default=DEFAULT_MAX_BATCH_SIZE,
+        description='Flush as soon as this many distinct strings are pending',
+    )
+
+
+class CoalescingEmbedder(EmbedderClient):
+    """
+    Coalesces concurrent embedding requests into shared create_batch calls.
+
+    The first request to arrive opens a window of `window_ms`; every text requested by
+    concurrent create/create_batch calls during that window is sent to the wrapped client
+    in a single create_batch call, and the vectors are scattered back to the callers. A
+    window is flushed early once `max_batch_size` distinct strings are pending.
+
+    Only plain text inputs are coalesced; token id inputs are passed through unchanged.
+    """
+
+    def __init__(self, embedder: EmbedderClient, config: CoalescingConfig | None = None):
+        if config is None:
+            config = CoalescingConfig()
+        self.embedder = embedder
+        self.config = config
+
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def _enqueue(self, text: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(text, []).append(future)
+
+        if len(self._pending) >= self.config.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.config.window_ms / 1000, self._flush)
+
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: dict[str, list[asyncio.Future]]) -> None:
+        texts = list(batch.keys())
+        try:
+            embeddings = await self.embedder.create_batch(texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(
+                    f'Expected {len(texts)} embeddings from create_batch, got {len(embeddings)}'
+                )
+        except Exception as e:
+            logger.error(f'Coalesced embedding batch of {len(texts)} inputs failed: {e}')
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for text, embedding in zip(texts, embeddings, strict=True):
+            for future in batch[text]:
+                if not future.done():
+                    future.set_result(list(embedding))
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            return await self._enqueue(input_data)
+        if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            return await self._enqueue(input_data[0])
+
+        return await self.embedder.create(input_data)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if not input_data_list:
+            return []
+
+        futures = [self._enqueue(text) for text in input_data_list]
+        return list(await asyncio.gather(*futures))
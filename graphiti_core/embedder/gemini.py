@@ -33,6 +33,7 @@ else:
 
 from pydantic import Field
 
+from .batching import EmbeddingBatcher
 from .client import EmbedderClient, EmbedderConfig
 
 logger = logging.getLogger(__name__)
@@ -85,6 +86,8 @@ class GeminiEmbedder(EmbedderClient):
         else:
             self.batch_size = batch_size
 
+        self.batcher = EmbeddingBatcher(max_batch_size=self.batch_size)
+
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
@@ -115,7 +118,8 @@ class GeminiEmbedder(EmbedderClient):
         Create embeddings for a batch of input data using Google's Gemini embedding model.
 
         This method handles batching to respect the Gemini API's limits on the number
-        of instances that can be processed in a single request.
+        of instances that can be processed in a single request. Batches are sent
+        concurrently, and a batch that fails falls back to embedding its items one by one.
 
         Args:
             input_data_list: A list of strings to create embeddings for.
@@ -123,61 +127,54 @@ class GeminiEmbedder(EmbedderClient):
         Returns:
             A list of embedding vectors (each vector is a list of floats).
         """
-        if not input_data_list:
-            return []
+        return await self.batcher.run(input_data_list, self._embed_chunk)
+
+    async def _embed_chunk(self, batch: list[str]) -> list[list[float]]:
+        try:
+            # Generate embeddings for this batch
+            result = await self.client.aio.models.embed_content(
+                model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
+                contents=batch,  # type: ignore[arg-type]  # mypy fails on broad union type
+                config=types.EmbedContentConfig(output_dimensionality=self.config.embedding_dim),
+            )
+
+            if not result.embeddings or len(result.embeddings) == 0:
+                raise Exception('No embeddings returned')
+
+            batch_embeddings = []
+            for embedding in result.embeddings:
+                if not embedding.values:
+                    raise ValueError('Empty embedding values returned')
+                batch_embeddings.append(embedding.values)
+            return batch_embeddings
+
+        except Exception as e:
+            # If batch processing fails, fall back to individual processing
+            logger.warning(
+                f'Batch embedding failed for batch of {len(batch)} inputs, falling back to individual processing: {e}'
+            )
 
-        batch_size = self.batch_size
         all_embeddings = []
-
-        # Process inputs in batches
-        for i in range(0, len(input_data_list), batch_size):
-            batch = input_data_list[i : i + batch_size]
-
+        for item in batch:
             try:
-                # Generate embeddings for this batch
+                # Process each item individually
                 result = await self.client.aio.models.embed_content(
                     model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
-                    contents=batch,  # type: ignore[arg-type]  # mypy fails on broad union type
+                    contents=[item],  # type: ignore[arg-type]  # mypy fails on broad union type
                     config=types.EmbedContentConfig(
                         output_dimensionality=self.config.embedding_dim
                     ),
                 )
 
                 if not result.embeddings or len(result.embeddings) == 0:
-                    raise Exception('No embeddings returned')
-
-                # Process embeddings from this batch
-                for embedding in result.embeddings:
-                    if not embedding.values:
-                        raise ValueError('Empty embedding values returned')
-                    all_embeddings.append(embedding.values)
-
-            except Exception as e:
-                # If batch processing fails, fall back to individual processing
-                logger.warning(
-                    f'Batch embedding failed for batch {i // batch_size + 1}, falling back to individual processing: {e}'
-                )
+                    raise ValueError('No embeddings returned from Gemini API')
+                if not result.embeddings[0].values:
+                    raise ValueError('Empty embedding values returned')
+
+                all_embeddings.append(result.embeddings[0].values)
 
-                for item in batch:
-                    try:
-                        # Process each item individually
-                        result = await self.client.aio.models.embed_content(
-                            model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
-                            contents=[item],  # type: ignore[arg-type]  # mypy fails on broad union type
-                            config=types.EmbedContentConfig(
-                                output_dimensionality=self.config.embedding_dim
-                            ),
-                        )
-
-                        if not result.embeddings or len(result.embeddings) == 0:
-                            raise ValueError('No embeddings returned from Gemini API')
-                        if not result.embeddings[0].values:
-                            raise ValueError('Empty embedding values returned')
-
-                        all_embeddings.append(result.embeddings[0].values)
-
-                    except Exception as individual_error:
-                        logger.error(f'Failed to embed individual item: {individual_error}')
-                        raise individual_error
+            except Exception as individual_error:
+                logger.error(f'Failed to embed individual item: {individual_error}')
+                raise individual_error
 
         return all_embeddings
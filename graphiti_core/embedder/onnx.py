@@ -0,0 +1,233 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+else:
+    try:
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+    except ImportError:
+        raise ImportError(
+            'onnxruntime and tokenizers are required for OnnxEmbedder. '
+            'Install them with: pip install graphiti-core[onnx]'
+        ) from None
+
+from pydantic import Field
+
+from .client import EMBEDDING_DIM, EmbedderClient, EmbedderConfig
+from .coalesce import CoalescingConfig, CoalescingEmbedder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_SEQ_LENGTH = 256
+MODEL_FILE_CANDIDATES = ['model.onnx', 'onnx/model.onnx']
+QUANTIZED_SUFFIX = '.int8.onnx'
+
+
+class OnnxEmbedderConfig(EmbedderConfig):
+    embedding_dim: int | None = Field(  # type: ignore[assignment]
+        default=None,
+        frozen=True,
+        description="Output size, defaults to the model's own dimension; smaller values truncate",
+    )
+    embedding_model: str = Field(
+        default=DEFAULT_EMBEDDING_MODEL,
+        description='Local model directory, or a Hugging Face repo id to download',
+    )
+    model_file: str | None = Field(
+        default=None, description='ONNX file inside the model directory, if not model.onnx'
+    )
+    max_seq_length: int = DEFAULT_MAX_SEQ_LENGTH
+    batch_size: int = DEFAULT_BATCH_SIZE
+    num_threads: int | None = Field(
+        default=None, description='ONNX Runtime intra-op threads, defaults to all cores'
+    )
+    quantize: bool = Field(
+        default=False, description='Dynamically quantize weights to int8 on first load'
+    )
+    pooling: Literal['mean', 'cls'] = 'mean'
+    normalize: bool = True
+    batch_window_ms: float = Field(
+        default=2.0, description='How long create() waits to batch concurrent requests'
+    )
+
+
+def resolve_model_dir(embedding_model: str) -> str:
+    if os.path.isdir(embedding_model):
+        return embedding_model
+
+    try:
+        from huggingface_hub import snapshot_download
+    except ImportError:
+        raise ImportError(
+            f'{embedding_model} is not a local directory and huggingface-hub is not installed. '
+            'Install it with: pip install graphiti-core[onnx]'
+        ) from None
+
+    return snapshot_download(
+        embedding_model, allow_patterns=['*.json', '*.txt', 'model.onnx', 'onnx/model.onnx']
+    )
+
+
+def quantize_model(model_file: str) -> str:
+    """Write an int8 dynamically quantized copy of the model next to it, once."""
+    quantized_file = model_file.removesuffix('.onnx') + QUANTIZED_SUFFIX
+    if os.path.exists(quantized_file):
+        return quantized_file
+
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info(f'Quantizing {model_file} to int8')
+    quantize_dynamic(model_file, quantized_file, weight_type=QuantType.QInt8)
+    return quantized_file
+
+
+class OnnxEmbedder(EmbedderClient):
+    """
+    Local CPU embedder running a sentence-embedding model with ONNX Runtime.
+
+    Inputs are sorted by length and padded per batch so short strings are not padded to
+    the longest one in the request, and concurrent create() calls are batched together.
+    Inference runs on a dedicated thread so it does not block the event loop. Vectors are
+    pooled, truncated to `embedding_dim` and L2-normalized.
+
+    `embedding_dim` defaults to the dimension the model produces, which is probed once at
+    init. A larger value raises, since the vectors would not fit the configured indexes.
+    """
+
+    def __init__(self, config: OnnxEmbedderConfig | None = None):
+        if config is None:
+            config = OnnxEmbedderConfig()
+        self.config = config
+
+        model_dir = resolve_model_dir(config.embedding_model)
+        model_file = self._find_model_file(model_dir)
+        if config.quantize:
+            model_file = quantize_model(model_file)
+
+        options = ort.SessionOptions()
+        if config.num_threads is not None:
+            options.intra_op_num_threads = config.num_threads
+            options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            model_file, sess_options=options, providers=['CPUExecutionProvider']
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, 'tokenizer.json'))
+        self.tokenizer.enable_truncation(max_length=config.max_seq_length)
+        self.tokenizer.enable_padding()
+
+        model_dim = self._embed_sync(['dimension probe']).shape[1]
+        if config.embedding_dim is None:
+            self.config = config.model_copy(update={'embedding_dim': model_dim})
+        elif config.embedding_dim > model_dim:
+            raise ValueError(
+                f'embedding_dim is {config.embedding_dim} but {config.embedding_model} '
+                f'produces {model_dim}-dimensional embeddings'
+            )
+        if self.config.embedding_dim != EMBEDDING_DIM:
+            logger.warning(
+                f'OnnxEmbedder produces {self.config.embedding_dim}-dimensional embeddings but '
+                f'EMBEDDING_DIM is {EMBEDDING_DIM}; set EMBEDDING_DIM={self.config.embedding_dim} '
+                'so vector indexes are sized to match'
+            )
+
+        # A single worker keeps one inference in flight; ONNX Runtime parallelizes within it
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='onnx-embedder')
+        self._coalescer = CoalescingEmbedder(
+            self,
+            CoalescingConfig(window_ms=config.batch_window_ms, max_batch_size=config.batch_size),
+        )
+
+    def _find_model_file(self, model_dir: str) -> str:
+        candidates = [self.config.model_file] if self.config.model_file else MODEL_FILE_CANDIDATES
+        for candidate in candidates:
+            path = os.path.join(model_dir, candidate)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f'No ONNX model found in {model_dir} (looked for {candidates})')
+
+    def _embed_sync(self, texts: list[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {'input_ids': input_ids, 'attention_mask': attention_mask}
+        if 'token_type_ids' in self._input_names:
+            feeds['token_type_ids'] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+        feeds = {name: value for name, value in feeds.items() if name in self._input_names}
+
+        output = self.session.run(None, feeds)[0]
+        if output.ndim == 3:
+            if self.config.pooling == 'cls':
+                output = output[:, 0]
+            else:
+                mask = attention_mask[:, :, None].astype(output.dtype)
+                output = (output * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        output = output[:, : self.config.embedding_dim].astype(np.float32)
+        if self.config.normalize:
+            norms = np.linalg.norm(output, axis=1, keepdims=True)
+            output = output / np.clip(norms, 1e-12, None)
+        return output
+
+    async def _run_batches(self, input_data_list: list[str]) -> list[list[float]]:
+        # Bucket by length so each batch is padded only to its own longest input
+        order = sorted(range(len(input_data_list)), key=lambda i: len(input_data_list[i]))
+        loop = asyncio.get_running_loop()
+        results: list[list[float]] = [[] for _ in input_data_list]
+
+        for start in range(0, len(order), self.config.batch_size):
+            indices = order[start : start + self.config.batch_size]
+            batch = [input_data_list[i] for i in indices]
+            embeddings = await loop.run_in_executor(self._executor, self._embed_sync, batch)
+            for i, embedding in zip(indices, embeddings, strict=True):
+                results[i] = embedding.tolist()
+
+        return results
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            return await self._coalescer.create(input_data)
+        if isinstance(input_data, list) and input_data and isinstance(input_data[0], str):
+            return await self._coalescer.create(input_data[0])
+
+        raise TypeError('OnnxEmbedder only supports text input')
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if not input_data_list:
+            return []
+        return await self._run_batches(input_data_list)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
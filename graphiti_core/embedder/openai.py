@@ -19,15 +19,21 @@ from collections.abc import Iterable
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.types import EmbeddingModel
 
+from .batching import EmbeddingBatcher
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'text-embedding-3-small'
+# OpenAI accepts at most 2048 inputs and 300k tokens per embeddings request
+DEFAULT_BATCH_SIZE = 2048
+DEFAULT_MAX_BATCH_TOKENS = 250_000
 
 
 class OpenAIEmbedderConfig(EmbedderConfig):
     embedding_model: EmbeddingModel | str = DEFAULT_EMBEDDING_MODEL
     api_key: str | None = None
     base_url: str | None = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+    max_batch_tokens: int | None = DEFAULT_MAX_BATCH_TOKENS
 
 
 class OpenAIEmbedder(EmbedderClient):
@@ -51,6 +57,10 @@ class OpenAIEmbedder(EmbedderClient):
         else:
             self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
 
+        self.batcher = EmbeddingBatcher(
+            max_batch_size=config.batch_size, max_batch_tokens=config.max_batch_tokens
+        )
+
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
@@ -60,7 +70,8 @@ class OpenAIEmbedder(EmbedderClient):
         return result.data[0].embedding[: self.config.embedding_dim]
 
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
-        result = await self.client.embeddings.create(
-            input=input_data_list, model=self.config.embedding_model
-        )
+        return await self.batcher.run(input_data_list, self._embed_chunk)
+
+    async def _embed_chunk(self, chunk: list[str]) -> list[list[float]]:
+        result = await self.client.embeddings.create(input=chunk, model=self.config.embedding_model)
         return [embedding.embedding[: self.config.embedding_dim] for embedding in result.data]
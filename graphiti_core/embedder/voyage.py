@@ -30,14 +30,20 @@ else:
 
 from pydantic import Field
 
+from .batching import EmbeddingBatcher
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'voyage-3'
+# Voyage accepts at most 1000 inputs and 120k tokens per request for voyage-3
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_BATCH_TOKENS = 120_000
 
 
 class VoyageAIEmbedderConfig(EmbedderConfig):
     embedding_model: str = Field(default=DEFAULT_EMBEDDING_MODEL)
     api_key: str | None = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+    max_batch_tokens: int | None = DEFAULT_MAX_BATCH_TOKENS
 
 
 class VoyageAIEmbedder(EmbedderClient):
@@ -50,6 +56,9 @@ class VoyageAIEmbedder(EmbedderClient):
             config = VoyageAIEmbedderConfig()
         self.config = config
         self.client = voyageai.AsyncClient(api_key=config.api_key)  # type: ignore[reportUnknownMemberType]
+        self.batcher = EmbeddingBatcher(
+            max_batch_size=config.batch_size, max_batch_tokens=config.max_batch_tokens
+        )
 
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
@@ -69,7 +78,10 @@ class VoyageAIEmbedder(EmbedderClient):
         return [float(x) for x in result.embeddings[0][: self.config.embedding_dim]]
 
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
-        result = await self.client.embed(input_data_list, model=self.config.embedding_model)
+        return await self.batcher.run(input_data_list, self._embed_chunk)
+
+    async def _embed_chunk(self, chunk: list[str]) -> list[list[float]]:
+        result = await self.client.embed(chunk, model=self.config.embedding_model)
         return [
             [float(x) for x in embedding[: self.config.embedding_dim]]
             for embedding in result.embeddings
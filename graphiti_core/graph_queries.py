@@ -5,6 +5,8 @@ This module provides database-agnostic query generation for Neo4j and FalkorDB,
 supporting index creation, fulltext search, and bulk operations.
 """
 
+from functools import lru_cache
+
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphProvider
@@ -23,6 +25,26 @@ INDEX_TO_LABEL_KUZU_MAPPING = {
     'episode_content': 'Episodic',
     'edge_name_and_fact': 'RelatesToNode_',
 }
+# Kuzu can only build a vector index on a fixed-size FLOAT[n] column, and does not allow such a
+# column to be updated once indexed. Embeddings are therefore mirrored into append-only tables,
+# one row per (uuid, embedding) pair.
+# label -> (node table, embedding table, index name, embedding property)
+KUZU_VECTOR_INDEXES = {
+    'Entity': ('Entity', 'EntityEmbedding_', 'entity_name_embedding', 'name_embedding'),
+    'Community': ('Community', 'CommunityEmbedding_', 'community_name_embedding', 'name_embedding'),
+    'RELATES_TO': (
+        'RelatesToNode_',
+        'RelatesToNodeEmbedding_',
+        'edge_fact_embedding',
+        'fact_embedding',
+    ),
+}
+# FalkorDB vector indexes: label -> (index pattern, embedding property)
+FALKORDB_VECTOR_INDEXES = {
+    'Entity': ('(n:Entity)', 'name_embedding'),
+    'Community': ('(n:Community)', 'name_embedding'),
+    'RELATES_TO': ('()-[n:RELATES_TO]-()', 'fact_embedding'),
+}
 
 
 def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
@@ -69,6 +91,17 @@ def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
     ]
 
 
+def get_vector_indices(provider: GraphProvider, dimension: int) -> list[str]:
+    if provider != GraphProvider.FALKORDB or not dimension:
+        return []
+
+    return [
+        f'CREATE VECTOR INDEX FOR {pattern} ON (n.{prop}) '
+        f"OPTIONS {{dimension: {dimension}, similarityFunction: 'cosine'}}"
+        for pattern, prop in FALKORDB_VECTOR_INDEXES.values()
+    ]
+
+
 def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     if provider == GraphProvider.FALKORDB:
         from typing import cast
@@ -127,6 +160,7 @@ def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     ]
 
 
+@lru_cache
 def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
@@ -139,6 +173,7 @@ def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider)
     return f'CALL db.index.fulltext.queryNodes("{name}", {query}, {{limit: $limit}})'
 
 
+@lru_cache
 def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         # FalkorDB uses a different syntax for regular cosine similarity and Neo4j uses normalized cosine similarity
@@ -150,6 +185,7 @@ def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     return f'vector.similarity.cosine({vec1}, {vec2})'
 
 
+@lru_cache
 def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
@@ -160,3 +196,50 @@ def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> s
         return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast($query AS STRING), TOP := $limit)"
 
     return f'CALL db.index.fulltext.queryRelationships("{name}", $query, {{limit: $limit}})'
+
+
+@lru_cache
+def get_falkordb_vector_index_query(label: str) -> str:
+    pattern, prop = FALKORDB_VECTOR_INDEXES[label]
+    procedure, variable = (
+        ('queryRelationships', 'relationship')
+        if pattern.startswith('()')
+        else ('queryNodes', 'node')
+    )
+    # FalkorDB reports cosine distance; map it to the (2 - distance) / 2 similarity used by
+    # get_vector_cosine_func_query so scores compare against the same min_score
+    return f"""
+        CALL db.idx.vector.{procedure}('{label}', '{prop}', $k, vecf32($search_vector))
+        YIELD {variable}, score
+        RETURN {variable}.uuid AS uuid, (2 - score) / 2 AS score
+    """
+
+
+@lru_cache
+def get_kuzu_vector_index_sync_query(label: str, variable: str, dim: int) -> str:
+    """
+    Clause appended to a Kuzu save query that mirrors `variable`'s embedding into the label's
+    embedding table. Rows are keyed by uuid and embedding hash, so re-saving an unchanged
+    embedding is a no-op and a changed one adds a row; stale rows are only ever candidates
+    that search re-scores against the current embedding. Embeddings that are not `dim` long
+    do not fit the table and are left to the scan fallback.
+    """
+    _, table, _, prop = KUZU_VECTOR_INDEXES[label]
+    return f"""
+        WITH {variable}
+        WHERE {variable}.{prop} IS NOT NULL AND size({variable}.{prop}) = {int(dim)}
+        MERGE (:{table} {{
+            key: {variable}.uuid + ':' + string(hash({variable}.{prop})),
+            node_uuid: {variable}.uuid,
+            embedding: {variable}.{prop}
+        }})
+    """
+
+
+@lru_cache
+def get_kuzu_vector_index_query(label: str) -> str:
+    _, table, index, _ = KUZU_VECTOR_INDEXES[label]
+    return f"""
+        CALL QUERY_VECTOR_INDEX('{table}', '{index}', $search_vector, $k)
+        RETURN node.node_uuid AS uuid, 1 - distance AS score
+    """
@@ -15,12 +15,12 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from time import time
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from typing_extensions import LiteralString
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
@@ -28,12 +28,12 @@ from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.driver.neo4j_driver import Neo4jDriver
 from graphiti_core.edges import (
     CommunityEdge,
-    Edge,
     EntityEdge,
     EpisodicEdge,
     create_entity_edge_embeddings,
 )
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
+from graphiti_core.errors import NodeNotFoundError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
     get_default_group_id,
@@ -47,7 +47,6 @@ from graphiti_core.nodes import (
     EntityNode,
     EpisodeType,
     EpisodicNode,
-    Node,
     create_entity_node_embeddings,
 )
 from graphiti_core.search.search import SearchConfig, search
@@ -75,8 +74,10 @@ from graphiti_core.utils.bulk_utils import (
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
     build_communities,
+    refresh_communities,
     remove_communities,
-    update_community,
+    remove_community_members,
+    update_entity_communities,
 )
 from graphiti_core.utils.maintenance.edge_operations import (
     build_episodic_edges,
@@ -86,7 +87,11 @@ from graphiti_core.utils.maintenance.edge_operations import (
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
+    EpisodeRemoval,
+    GroupPurge,
     build_indices_and_constraints,
+    purge_group,
+    remove_episodes,
     retrieve_episodes,
 )
 from graphiti_core.utils.maintenance.node_operations import (
@@ -557,14 +562,8 @@ class Graphiti:
 
             # Update any communities
             if update_communities:
-                communities, community_edges = await semaphore_gather(
-                    *[
-                        update_community(
-                            self.driver, self.llm_client, self.embedder, node, self.ensure_ascii
-                        )
-                        for node in nodes
-                    ],
-                    max_coroutines=self.max_coroutines,
+                communities, community_edges = await update_entity_communities(
+                    self.driver, self.llm_client, self.embedder, hydrated_nodes, self.ensure_ascii
                 )
             end = time()
             logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
@@ -870,7 +869,7 @@ class Graphiti:
             raise e
 
     async def build_communities(
-        self, group_ids: list[str] | None = None
+        self, group_ids: list[str] | None = None, incremental: bool = False
     ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
         """
         Use a community clustering algorithm to find communities of nodes. Create community nodes summarising
@@ -878,16 +877,33 @@ class Graphiti:
         ----------
         query : list[str] | None
             Optional. Create communities only for the listed group_ids. If blank the entire graph will be used.
+        incremental : bool
+            Optional. Keep existing communities and only re-cluster the neighborhoods of entities and edges
+            added since they were built. Only communities whose membership changed by more than
+            COMMUNITY_RESUMMARIZE_THRESHOLD are re-summarized. Returns the communities that were re-clustered
+            and the memberships that were written.
         """
-        # Clear existing communities
-        await remove_communities(self.driver)
+        if incremental:
+            refresh = await refresh_communities(self.driver, self.llm_client, group_ids)
+            if refresh.removed_community_uuids:
+                await CommunityNode.delete_by_uuids(self.driver, refresh.removed_community_uuids)
+            if refresh.rewired_community_uuids:
+                await remove_community_members(self.driver, refresh.rewired_community_uuids)
+            community_nodes, community_edges = refresh.community_nodes, refresh.community_edges
+        else:
+            # Clear existing communities
+            await remove_communities(self.driver)
 
-        community_nodes, community_edges = await build_communities(
-            self.driver, self.llm_client, group_ids
-        )
+            community_nodes, community_edges = await build_communities(
+                self.driver, self.llm_client, group_ids
+            )
 
         await semaphore_gather(
-            *[node.generate_name_embedding(self.embedder) for node in community_nodes],
+            *[
+                node.generate_name_embedding(self.embedder)
+                for node in community_nodes
+                if node.name_embedding is None
+            ],
             max_coroutines=self.max_coroutines,
         )
 
@@ -1082,31 +1098,24 @@ class Graphiti:
         return AddTripletResults(edges=edges, nodes=nodes)
 
     async def remove_episode(self, episode_uuid: str):
-        # Find the episode to be deleted
-        episode = await EpisodicNode.get_by_uuid(self.driver, episode_uuid)
-
-        # Find edges mentioned by the episode
-        edges = await EntityEdge.get_by_uuids(self.driver, episode.entity_edges)
-
-        # We should only delete edges created by the episode
-        edges_to_delete: list[EntityEdge] = []
-        for edge in edges:
-            if edge.episodes and edge.episodes[0] == episode.uuid:
-                edges_to_delete.append(edge)
-
-        # Find nodes mentioned by the episode
-        nodes = await get_mentioned_nodes(self.driver, [episode])
-        # We should delete all nodes that are only mentioned in the deleted episode
-        nodes_to_delete: list[EntityNode] = []
-        for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
-
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
-
-        await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
-        await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
-
-        await episode.delete(self.driver)
+        removal = await remove_episodes(self.driver, [episode_uuid])
+        if not removal.episode_uuids:
+            raise NodeNotFoundError(episode_uuid)
+
+    async def delete_group(
+        self,
+        group_id: str,
+        on_progress: Callable[[GroupPurge], Awaitable[None]] | None = None,
+    ) -> GroupPurge:
+        """
+        Delete every node and edge in a group in bounded transactions. Running it again
+        resumes an interrupted purge; `on_progress` is awaited after each chunk.
+        """
+        return await purge_group(self.driver, group_id, on_progress=on_progress)
+
+    async def remove_episodes(self, episode_uuids: list[str]) -> EpisodeRemoval:
+        """
+        Remove episodes, the entities no other episode mentions and the entity edges first
+        extracted from them, in one chunked transaction. Unknown uuids are ignored.
+        """
+        return await remove_episodes(self.driver, episode_uuids)
@@ -19,13 +19,13 @@ import os
 import re
 from collections.abc import Coroutine
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
 import numpy as np
 from dotenv import load_dotenv
 from neo4j import time as neo4j_time
 from numpy._typing import NDArray
-from pydantic import BaseModel
+from pydantic import BaseModel, PlainSerializer, PlainValidator, WithJsonSchema
 
 from graphiti_core.driver.driver import GraphProvider
 from graphiti_core.errors import GroupIdValidationError
@@ -96,8 +96,34 @@ def lucene_sanitize(query: str) -> str:
     return sanitized
 
 
-def normalize_l2(embedding: list[float]) -> NDArray:
-    embedding_array = np.array(embedding)
+def to_embedding(value: Any) -> NDArray[np.float32] | None:
+    """Coerce a list of floats (or any array-like) into a contiguous 1-d float32 array."""
+    if value is None:
+        return None
+    if isinstance(value, np.ndarray) and value.dtype == np.float32 and value.ndim == 1:
+        return value
+    return np.ascontiguousarray(value, dtype=np.float32).reshape(-1)
+
+
+def embedding_to_list(value: Any) -> list[float] | None:
+    """Convert an embedding back to a plain list of floats for the graph drivers."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+# Embeddings are held as float32 arrays (4 bytes per dimension instead of a boxed Python float)
+# and serialize back to list[float], so model_dump() output and driver parameters are unchanged.
+Embedding = Annotated[
+    NDArray[np.float32],
+    PlainValidator(to_embedding),
+    PlainSerializer(embedding_to_list),
+    WithJsonSchema({'type': 'array', 'items': {'type': 'number'}}),
+]
+
+
+def normalize_l2(embedding: list[float] | NDArray) -> NDArray:
+    embedding_array = np.asarray(embedding)
     norm = np.linalg.norm(embedding_array, 2, axis=0, keepdims=True)
     return np.where(norm == 0, embedding_array, embedding_array / norm)
 
@@ -14,7 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from functools import lru_cache
+
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.graph_queries import get_kuzu_vector_index_sync_query
 
 EPISODIC_EDGE_SAVE = """
     MATCH (episode:Episodic {uuid: $episode_uuid})
@@ -27,6 +30,7 @@ EPISODIC_EDGE_SAVE = """
 """
 
 
+@lru_cache
 def get_episodic_edge_save_bulk_query(provider: GraphProvider) -> str:
     if provider == GraphProvider.KUZU:
         return """
@@ -60,7 +64,10 @@ EPISODIC_EDGE_RETURN = """
 """
 
 
-def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False) -> str:
+@lru_cache
+def get_entity_edge_save_query(
+    provider: GraphProvider, has_aoss: bool = False, vector_index_dim: int = 0
+) -> str:
     match provider:
         case GraphProvider.FALKORDB:
             return """
@@ -68,6 +75,7 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
                 MATCH (target:Entity {uuid: $edge_data.target_uuid})
                 MERGE (source)-[e:RELATES_TO {uuid: $edge_data.uuid}]->(target)
                 SET e = $edge_data
+                SET e.fact_embedding = vecf32($edge_data.fact_embedding)
                 RETURN e.uuid AS uuid
             """
         case GraphProvider.NEPTUNE:
@@ -81,7 +89,8 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
                 RETURN $edge_data.uuid AS uuid
             """
         case GraphProvider.KUZU:
-            return """
+            return (
+                """
                 MATCH (source:Entity {uuid: $source_uuid})
                 MATCH (target:Entity {uuid: $target_uuid})
                 MERGE (source)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: $uuid})-[:RELATES_TO]->(target)
@@ -96,8 +105,16 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
                     e.valid_at = $valid_at,
                     e.invalid_at = $invalid_at,
                     e.attributes = $attributes
+                """
+                + (
+                    get_kuzu_vector_index_sync_query('RELATES_TO', 'e', vector_index_dim)
+                    if vector_index_dim
+                    else ''
+                )
+                + """
                 RETURN e.uuid AS uuid
-            """
+                """
+            )
         case _:  # Neo4j
             save_embedding_query = (
                 """WITH e CALL db.create.setRelationshipVectorProperty(e, "fact_embedding", $edge_data.fact_embedding)"""
@@ -120,7 +137,10 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
             )
 
 
-def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = False) -> str:
+@lru_cache
+def get_entity_edge_save_bulk_query(
+    provider: GraphProvider, has_aoss: bool = False, vector_index_dim: int = 0
+) -> str:
     match provider:
         case GraphProvider.FALKORDB:
             return """
@@ -145,7 +165,8 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
                 RETURN edge.uuid AS uuid
             """
         case GraphProvider.KUZU:
-            return """
+            return (
+                """
                 MATCH (source:Entity {uuid: $source_node_uuid})
                 MATCH (target:Entity {uuid: $target_node_uuid})
                 MERGE (source)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: $uuid})-[:RELATES_TO]->(target)
@@ -160,8 +181,16 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
                     e.valid_at = $valid_at,
                     e.invalid_at = $invalid_at,
                     e.attributes = $attributes
+                """
+                + (
+                    get_kuzu_vector_index_sync_query('RELATES_TO', 'e', vector_index_dim)
+                    if vector_index_dim
+                    else ''
+                )
+                + """
                 RETURN e.uuid AS uuid
-            """
+                """
+            )
         case _:
             save_embedding_query = (
                 'WITH e, edge CALL db.create.setRelationshipVectorProperty(e, "fact_embedding", edge.fact_embedding)'
@@ -183,6 +212,7 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
             )
 
 
+@lru_cache
 def get_entity_edge_return_query(provider: GraphProvider) -> str:
     # `fact_embedding` is not returned by default and must be manually loaded using `load_fact_embedding()`.
 
@@ -221,6 +251,7 @@ def get_entity_edge_return_query(provider: GraphProvider) -> str:
     )
 
 
+@lru_cache
 def get_community_edge_save_query(provider: GraphProvider) -> str:
     match provider:
         case GraphProvider.FALKORDB:
@@ -14,11 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.graph_queries import get_kuzu_vector_index_sync_query
 
 
+@lru_cache
 def get_episode_node_save_query(provider: GraphProvider) -> str:
     match provider:
         case GraphProvider.NEPTUNE:
@@ -58,6 +61,7 @@ def get_episode_node_save_query(provider: GraphProvider) -> str:
             """
 
 
+@lru_cache
 def get_episode_node_save_bulk_query(provider: GraphProvider) -> str:
     match provider:
         case GraphProvider.NEPTUNE:
@@ -126,17 +130,22 @@ EPISODIC_NODE_RETURN_NEPTUNE = """
 """
 
 
-def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: bool = False) -> str:
+@lru_cache(maxsize=1024)
+def get_entity_node_save_query(
+    provider: GraphProvider, labels: str, has_aoss: bool = False, vector_index_dim: int = 0
+) -> str:
     match provider:
         case GraphProvider.FALKORDB:
             return f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
                 SET n:{labels}
                 SET n = $entity_data
+                SET n.name_embedding = vecf32($entity_data.name_embedding)
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
-            return """
+            return (
+                """
                 MERGE (n:Entity {uuid: $uuid})
                 SET
                     n.name = $name,
@@ -146,9 +155,16 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
                     n.name_embedding = $name_embedding,
                     n.summary = $summary,
                     n.attributes = $attributes
-                WITH n
+                """
+                + (
+                    get_kuzu_vector_index_sync_query('Entity', 'n', vector_index_dim)
+                    if vector_index_dim
+                    else 'WITH n'
+                )
+                + """
                 RETURN n.uuid AS uuid
-            """
+                """
+            )
         case GraphProvider.NEPTUNE:
             label_subquery = ''
             for label in labels.split(':'):
@@ -180,7 +196,7 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
 
 
 def get_entity_node_save_bulk_query(
-    provider: GraphProvider, nodes: list[dict], has_aoss: bool = False
+    provider: GraphProvider, nodes: list[dict], has_aoss: bool = False, vector_index_dim: int = 0
 ) -> str | Any:
     match provider:
         case GraphProvider.FALKORDB:
@@ -220,18 +236,7 @@ def get_entity_node_save_bulk_query(
                 )
             return queries
         case GraphProvider.KUZU:
-            return """
-                MERGE (n:Entity {uuid: $uuid})
-                SET
-                    n.name = $name,
-                    n.group_id = $group_id,
-                    n.labels = $labels,
-                    n.created_at = $created_at,
-                    n.name_embedding = $name_embedding,
-                    n.summary = $summary,
-                    n.attributes = $attributes
-                RETURN n.uuid AS uuid
-            """
+            return get_entity_node_save_query(provider, '', vector_index_dim=vector_index_dim)
         case _:  # Neo4j
             save_embedding_query = (
                 'WITH n, node CALL db.create.setNodeVectorProperty(n, "name_embedding", node.name_embedding)'
@@ -252,6 +257,7 @@ def get_entity_node_save_bulk_query(
             )
 
 
+@lru_cache
 def get_entity_node_return_query(provider: GraphProvider) -> str:
     # `name_embedding` is not returned by default and must be loaded manually using `load_name_embedding()`.
     if provider == GraphProvider.KUZU:
@@ -276,36 +282,47 @@ def get_entity_node_return_query(provider: GraphProvider) -> str:
     """
 
 
-def get_community_node_save_query(provider: GraphProvider) -> str:
+@lru_cache
+def get_community_node_save_query(provider: GraphProvider, vector_index_dim: int = 0) -> str:
     match provider:
         case GraphProvider.FALKORDB:
             return """
                 MERGE (n:Community {uuid: $uuid})
-                SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at, name_embedding: vecf32($name_embedding)}
+                SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at, built_at: $built_at, name_embedding: vecf32($name_embedding)}
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.NEPTUNE:
             return """
                 MERGE (n:Community {uuid: $uuid})
-                SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at}
+                SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at, built_at: $built_at}
                 SET n.name_embedding = join([x IN coalesce($name_embedding, []) | toString(x) ], ",")
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
-            return """
+            return (
+                """
                 MERGE (n:Community {uuid: $uuid})
                 SET
                     n.name = $name,
                     n.group_id = $group_id,
                     n.created_at = $created_at,
+                    n.built_at = $built_at,
                     n.name_embedding = $name_embedding,
                     n.summary = $summary
+                """
+                + (
+                    get_kuzu_vector_index_sync_query('Community', 'n', vector_index_dim)
+                    if vector_index_dim
+                    else ''
+                )
+                + """
                 RETURN n.uuid AS uuid
-            """
+                """
+            )
         case _:  # Neo4j
             return """
                 MERGE (n:Community {uuid: $uuid})
-                SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at}
+                SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at, built_at: $built_at}
                 WITH n CALL db.create.setNodeVectorProperty(n, "name_embedding", $name_embedding)
                 RETURN n.uuid AS uuid
             """
@@ -317,7 +334,8 @@ COMMUNITY_NODE_RETURN = """
     c.group_id AS group_id,
     c.created_at AS created_at,
     c.name_embedding AS name_embedding,
-    c.summary AS summary
+    c.summary AS summary,
+    c.built_at AS built_at
 """
 
 COMMUNITY_NODE_RETURN_NEPTUNE = """
@@ -326,5 +344,6 @@ COMMUNITY_NODE_RETURN_NEPTUNE = """
     [x IN split(n.name_embedding, ",") | toFloat(x)] AS name_embedding,
     n.group_id AS group_id,
     n.summary AS summary,
-    n.created_at AS created_at
+    n.created_at AS created_at,
+    n.built_at AS built_at
 """
@@ -23,6 +23,7 @@ from time import time
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
 from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
@@ -36,7 +37,7 @@ from graphiti_core.driver.driver import (
 )
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import NodeNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import Embedding, embedding_to_list, parse_db_date, to_embedding
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_RETURN,
     COMMUNITY_NODE_RETURN_NEPTUNE,
@@ -116,23 +117,15 @@ class Node(BaseModel, ABC):
                 edge_uuids: list[str] = records[0].get('edge_uuids', []) if records else []
 
                 if driver.aoss_client:
-                    # Delete the node from OpenSearch indices
-                    for index in (EPISODE_INDEX_NAME, ENTITY_INDEX_NAME, COMMUNITY_INDEX_NAME):
-                        await driver.aoss_client.delete(
-                            index=index,
-                            id=self.uuid,
-                            params={'routing': self.group_id},
-                        )
-
-                    # Bulk delete the detached edges
-                    if edge_uuids:
-                        actions = []
-                        for eid in edge_uuids:
-                            actions.append(
-                                {'delete': {'_index': ENTITY_EDGE_INDEX_NAME, '_id': eid}}
-                            )
-
-                        await driver.aoss_client.bulk(body=actions)
+                    # Delete the node from OpenSearch indices, along with the detached edges
+                    await driver.delete_from_aoss(
+                        [EPISODE_INDEX_NAME, ENTITY_INDEX_NAME, COMMUNITY_INDEX_NAME],
+                        [self.uuid],
+                        routing=self.group_id,
+                    )
+                    await driver.delete_from_aoss(
+                        [ENTITY_EDGE_INDEX_NAME], edge_uuids, routing=self.group_id
+                    )
 
             case GraphProvider.KUZU:
                 for label in ['Episodic', 'Community']:
@@ -181,80 +174,10 @@ class Node(BaseModel, ABC):
 
     @classmethod
     async def delete_by_group_id(cls, driver: GraphDriver, group_id: str, batch_size: int = 100):
-        match driver.provider:
-            case GraphProvider.NEO4J:
-                async with driver.session() as session:
-                    await session.run(
-                        """
-                        MATCH (n:Entity|Episodic|Community {group_id: $group_id})
-                        CALL {
-                            WITH n
-                            DETACH DELETE n
-                        } IN TRANSACTIONS OF $batch_size ROWS
-                        """,
-                        group_id=group_id,
-                        batch_size=batch_size,
-                    )
-
-                if driver.aoss_client:
-                    await driver.aoss_client.delete_by_query(
-                        index=EPISODE_INDEX_NAME,
-                        body={'query': {'term': {'group_id': group_id}}},
-                        params={'routing': group_id},
-                    )
+        # Imported here as graph_data_operations depends on this module
+        from graphiti_core.utils.maintenance.graph_data_operations import purge_group
 
-                    await driver.aoss_client.delete_by_query(
-                        index=ENTITY_INDEX_NAME,
-                        body={'query': {'term': {'group_id': group_id}}},
-                        params={'routing': group_id},
-                    )
-
-                    await driver.aoss_client.delete_by_query(
-                        index=COMMUNITY_INDEX_NAME,
-                        body={'query': {'term': {'group_id': group_id}}},
-                        params={'routing': group_id},
-                    )
-
-                    await driver.aoss_client.delete_by_query(
-                        index=ENTITY_EDGE_INDEX_NAME,
-                        body={'query': {'term': {'group_id': group_id}}},
-                        params={'routing': group_id},
-                    )
-
-            case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{group_id: $group_id}})
-                        DETACH DELETE n
-                        """,
-                        group_id=group_id,
-                    )
-                # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
-                # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]->(e:RelatesToNode_)
-                    DETACH DELETE e
-                    """,
-                    group_id=group_id,
-                )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {group_id: $group_id})
-                    DETACH DELETE n
-                    """,
-                    group_id=group_id,
-                )
-            case _:  # FalkorDB, Neptune
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{group_id: $group_id}})
-                        DETACH DELETE n
-                        """,
-                        group_id=group_id,
-                    )
+        await purge_group(driver, group_id, batch_size)
 
     @classmethod
     async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str], batch_size: int = 100):
@@ -336,12 +259,7 @@ class Node(BaseModel, ABC):
                             body={'query': {'terms': {'uuid': uuids}}},
                         )
 
-                    if edge_uuids:
-                        actions = [
-                            {'delete': {'_index': ENTITY_EDGE_INDEX_NAME, '_id': eid}}
-                            for eid in edge_uuids
-                        ]
-                        await driver.aoss_client.bulk(body=actions)
+                    await driver.delete_from_aoss([ENTITY_EDGE_INDEX_NAME], edge_uuids)
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
@@ -494,7 +412,7 @@ class EpisodicNode(Node):
 
 
 class EntityNode(Node):
-    name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
+    name_embedding: Embedding | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='regional summary of surrounding edges', default_factory=str)
     attributes: dict[str, Any] = Field(
         default={}, description='Additional attributes of the node. Dependent on node labels'
@@ -503,7 +421,7 @@ class EntityNode(Node):
     async def generate_name_embedding(self, embedder: EmbedderClient):
         start = time()
         text = self.name.replace('\n', ' ')
-        self.name_embedding = await embedder.create(input_data=[text])
+        self.name_embedding = to_embedding(await embedder.create(input_data=[text]))
         end = time()
         logger.debug(f'embedded {text} in {end - start} ms')
 
@@ -526,7 +444,9 @@ class EntityNode(Node):
             )
 
             if resp['hits']['hits']:
-                self.name_embedding = resp['hits']['hits'][0]['_source']['name_embedding']
+                self.name_embedding = to_embedding(
+                    resp['hits']['hits'][0]['_source']['name_embedding']
+                )
                 return
             else:
                 raise NodeNotFoundError(self.uuid)
@@ -545,13 +465,13 @@ class EntityNode(Node):
         if len(records) == 0:
             raise NodeNotFoundError(self.uuid)
 
-        self.name_embedding = records[0]['name_embedding']
+        self.name_embedding = to_embedding(records[0]['name_embedding'])
 
     async def save(self, driver: GraphDriver):
         entity_data: dict[str, Any] = {
             'uuid': self.uuid,
             'name': self.name,
-            'name_embedding': self.name_embedding,
+            'name_embedding': embedding_to_list(self.name_embedding),
             'group_id': self.group_id,
             'summary': self.summary,
             'created_at': self.created_at,
@@ -561,7 +481,11 @@ class EntityNode(Node):
             entity_data['attributes'] = json.dumps(self.attributes)
             entity_data['labels'] = list(set(self.labels + ['Entity']))
             result = await driver.execute_query(
-                get_entity_node_save_query(driver.provider, labels=''),
+                get_entity_node_save_query(
+                    driver.provider,
+                    labels='',
+                    vector_index_dim=driver.get_vector_index_dim('Entity'),
+                ),
                 **entity_data,
             )
         else:
@@ -662,8 +586,13 @@ class EntityNode(Node):
 
 
 class CommunityNode(Node):
-    name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
+    name_embedding: Embedding | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='region summary of member nodes', default_factory=str)
+    built_at: datetime | None = Field(
+        default=None,
+        description='when community detection last covered this community, set only by '
+        'building and refreshing communities',
+    )
 
     async def save(self, driver: GraphDriver):
         if driver.provider == GraphProvider.NEPTUNE:
@@ -672,13 +601,16 @@ class CommunityNode(Node):
                 [{'name': self.name, 'uuid': self.uuid, 'group_id': self.group_id}],
             )
         result = await driver.execute_query(
-            get_community_node_save_query(driver.provider),  # type: ignore
+            get_community_node_save_query(  # type: ignore
+                driver.provider, vector_index_dim=driver.get_vector_index_dim('Community')
+            ),
             uuid=self.uuid,
             name=self.name,
             group_id=self.group_id,
             summary=self.summary,
-            name_embedding=self.name_embedding,
+            name_embedding=embedding_to_list(self.name_embedding),
             created_at=self.created_at,
+            built_at=self.built_at,
         )
 
         logger.debug(f'Saved Node to Graph: {self.uuid}')
@@ -688,7 +620,7 @@ class CommunityNode(Node):
     async def generate_name_embedding(self, embedder: EmbedderClient):
         start = time()
         text = self.name.replace('\n', ' ')
-        self.name_embedding = await embedder.create(input_data=[text])
+        self.name_embedding = to_embedding(await embedder.create(input_data=[text]))
         end = time()
         logger.debug(f'embedded {text} in {end - start} ms')
 
@@ -715,7 +647,7 @@ class CommunityNode(Node):
         if len(records) == 0:
             raise NodeNotFoundError(self.uuid)
 
-        self.name_embedding = records[0]['name_embedding']
+        self.name_embedding = to_embedding(records[0]['name_embedding'])
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
@@ -864,6 +796,7 @@ def get_community_node_from_record(record: Any) -> CommunityNode:
         name_embedding=record['name_embedding'],
         created_at=parse_db_date(record['created_at']),  # type: ignore
         summary=record['summary'],
+        built_at=parse_db_date(record.get('built_at')),
     )
 
 
@@ -872,5 +805,7 @@ async def create_entity_node_embeddings(embedder: EmbedderClient, nodes: list[En
         return
 
     name_embeddings = await embedder.create_batch([node.name for node in nodes])
-    for node, name_embedding in zip(nodes, name_embeddings, strict=True):
+    # Nodes hold row views into one contiguous float32 matrix rather than separate lists
+    matrix = np.asarray(name_embeddings, dtype=np.float32)
+    for node, name_embedding in zip(nodes, matrix, strict=True):
         node.name_embedding = name_embedding
@@ -0,0 +1,71 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+QUERY_TEMPLATE_CACHE_SIZE = int(os.getenv('QUERY_TEMPLATE_CACHE_SIZE', 1024))
+
+
+class QueryTemplateRegistry:
+    """
+    Cache of generated Cypher text keyed by (search method, provider, filter shape).
+
+    Search queries are assembled from provider-specific fragments and filter clauses whose
+    values are always passed as parameters, so the text only depends on the key. Building
+    it once per key avoids the string work on every call and keeps the number of distinct
+    query texts small, which lets the database reuse cached plans.
+    """
+
+    def __init__(self, maxsize: int = QUERY_TEMPLATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[Hashable, str] = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], str]) -> str:
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+        self.misses += 1
+        template = build()
+        self._templates[key] = template
+        if len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+
+        return template
+
+    def templates(self) -> set[str]:
+        """Distinct query texts currently cached."""
+        return set(self._templates.values())
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._templates
+
+
+query_templates = QueryTemplateRegistry()
@@ -16,6 +16,7 @@ limitations under the License.
 
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -65,23 +66,39 @@ def cypher_to_opensearch_operator(op: ComparisonOperator) -> str:
     return mapping.get(op, op.value)
 
 
+NULL_OPERATORS = (ComparisonOperator.is_null, ComparisonOperator.is_not_null)
+DATE_FILTER_FIELDS = ('valid_at', 'invalid_at', 'created_at', 'expired_at')
+
+# Shape of a list of date filters: the comparison operators of each AND group, per OR branch
+DateFilterShape = tuple[tuple[ComparisonOperator, ...], ...]
+
+
 def node_search_filter_query_constructor(
     filters: SearchFilters,
     provider: GraphProvider,
 ) -> tuple[list[str], dict[str, Any]]:
-    filter_queries: list[str] = []
     filter_params: dict[str, Any] = {}
 
     if filters.node_labels is not None:
+        filter_params['labels'] = filters.node_labels
+
+    filter_queries = _node_filter_queries(provider, filters.node_labels is not None)
+
+    return list(filter_queries), filter_params
+
+
+@lru_cache(maxsize=64)
+def _node_filter_queries(provider: GraphProvider, has_node_labels: bool) -> tuple[str, ...]:
+    filter_queries: list[str] = []
+
+    if has_node_labels:
         if provider == GraphProvider.KUZU:
             node_label_filter = 'list_has_all(n.labels, $labels)'
-            filter_params['labels'] = filters.node_labels
         else:
-            node_labels = '|'.join(filters.node_labels)
-            node_label_filter = 'n:' + node_labels
+            node_label_filter = 'any(label IN labels(n) WHERE label IN $labels)'
         filter_queries.append(node_label_filter)
 
-    return filter_queries, filter_params
+    return tuple(filter_queries)
 
 
 def date_filter_query_constructor(
@@ -101,154 +118,88 @@ def edge_search_filter_query_constructor(
     filters: SearchFilters,
     provider: GraphProvider,
 ) -> tuple[list[str], dict[str, Any]]:
-    filter_queries: list[str] = []
     filter_params: dict[str, Any] = {}
 
     if filters.edge_types is not None:
-        edge_types = filters.edge_types
-        filter_queries.append('e.name in $edge_types')
-        filter_params['edge_types'] = edge_types
+        filter_params['edge_types'] = filters.edge_types
 
     if filters.edge_uuids is not None:
-        filter_queries.append('e.uuid in $edge_uuids')
         filter_params['edge_uuids'] = filters.edge_uuids
 
     if filters.node_labels is not None:
+        filter_params['labels'] = filters.node_labels
+
+    date_filter_shapes: list[DateFilterShape | None] = []
+    for field in DATE_FILTER_FIELDS:
+        date_filters: list[list[DateFilter]] | None = getattr(filters, field)
+        if date_filters is None:
+            date_filter_shapes.append(None)
+            continue
+
+        date_filter_shapes.append(
+            tuple(
+                tuple(date_filter.comparison_operator for date_filter in or_list)
+                for or_list in date_filters
+            )
+        )
+        for i, or_list in enumerate(date_filters):
+            for j, date_filter in enumerate(or_list):
+                if date_filter.comparison_operator not in NULL_OPERATORS:
+                    filter_params[f'{field}_{i}_{j}'] = date_filter.date
+
+    filter_queries = _edge_filter_queries(
+        provider,
+        filters.edge_types is not None,
+        filters.edge_uuids is not None,
+        filters.node_labels is not None,
+        tuple(date_filter_shapes),
+    )
+
+    return list(filter_queries), filter_params
+
+
+@lru_cache(maxsize=256)
+def _edge_filter_queries(
+    provider: GraphProvider,
+    has_edge_types: bool,
+    has_edge_uuids: bool,
+    has_node_labels: bool,
+    date_filter_shapes: tuple[DateFilterShape | None, ...],
+) -> tuple[str, ...]:
+    filter_queries: list[str] = []
+
+    if has_edge_types:
+        filter_queries.append('e.name in $edge_types')
+
+    if has_edge_uuids:
+        filter_queries.append('e.uuid in $edge_uuids')
+
+    if has_node_labels:
         if provider == GraphProvider.KUZU:
             node_label_filter = (
                 'list_has_all(n.labels, $labels) AND list_has_all(m.labels, $labels)'
             )
-            filter_params['labels'] = filters.node_labels
         else:
-            node_labels = '|'.join(filters.node_labels)
-            node_label_filter = 'n:' + node_labels + ' AND m:' + node_labels
+            node_label_filter = (
+                'any(label IN labels(n) WHERE label IN $labels) '
+                'AND any(label IN labels(m) WHERE label IN $labels)'
+            )
         filter_queries.append(node_label_filter)
 
-    if filters.valid_at is not None:
-        valid_at_filter = '('
-        for i, or_list in enumerate(filters.valid_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['valid_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.valid_at', f'$valid_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            valid_at_filter += and_filter_query
-
-            if i == len(filters.valid_at) - 1:
-                valid_at_filter += ')'
-            else:
-                valid_at_filter += ' OR '
-
-        filter_queries.append(valid_at_filter)
-
-    if filters.invalid_at is not None:
-        invalid_at_filter = '('
-        for i, or_list in enumerate(filters.invalid_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['invalid_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.invalid_at', f'$invalid_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            invalid_at_filter += and_filter_query
-
-            if i == len(filters.invalid_at) - 1:
-                invalid_at_filter += ')'
-            else:
-                invalid_at_filter += ' OR '
-
-        filter_queries.append(invalid_at_filter)
-
-    if filters.created_at is not None:
-        created_at_filter = '('
-        for i, or_list in enumerate(filters.created_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['created_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.created_at', f'$created_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            created_at_filter += and_filter_query
-
-            if i == len(filters.created_at) - 1:
-                created_at_filter += ')'
-            else:
-                created_at_filter += ' OR '
-
-        filter_queries.append(created_at_filter)
-
-    if filters.expired_at is not None:
-        expired_at_filter = '('
-        for i, or_list in enumerate(filters.expired_at):
-            for j, date_filter in enumerate(or_list):
-                if date_filter.comparison_operator not in [
-                    ComparisonOperator.is_null,
-                    ComparisonOperator.is_not_null,
-                ]:
-                    filter_params['expired_at_' + str(j)] = date_filter.date
-
-            and_filters = [
-                date_filter_query_constructor(
-                    'e.expired_at', f'$expired_at_{j}', date_filter.comparison_operator
-                )
-                for j, date_filter in enumerate(or_list)
-            ]
-            and_filter_query = ''
-            for j, and_filter in enumerate(and_filters):
-                and_filter_query += and_filter
-                if j != len(and_filters) - 1:
-                    and_filter_query += ' AND '
-
-            expired_at_filter += and_filter_query
-
-            if i == len(filters.expired_at) - 1:
-                expired_at_filter += ')'
-            else:
-                expired_at_filter += ' OR '
-
-        filter_queries.append(expired_at_filter)
-
-    return filter_queries, filter_params
+    for field, shape in zip(DATE_FILTER_FIELDS, date_filter_shapes, strict=True):
+        if shape is None:
+            continue
+
+        or_filters = [
+            ' AND '.join(
+                date_filter_query_constructor(f'e.{field}', f'${field}_{i}_{j}', operator)
+                for j, operator in enumerate(and_operators)
+            )
+            for i, and_operators in enumerate(shape)
+        ]
+        filter_queries.append('(' + ' OR '.join(or_filters) + ')')
+
+    return tuple(filter_queries)
 
 
 def build_aoss_node_filters(group_ids: list[str], search_filters: SearchFilters) -> list[dict]:
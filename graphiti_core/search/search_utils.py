@@ -16,6 +16,7 @@ limitations under the License.
 
 import logging
 from collections import defaultdict
+from collections.abc import Callable
 from time import time
 from typing import Any
 
@@ -37,6 +38,7 @@ from graphiti_core.graph_queries import (
     get_vector_cosine_func_query,
 )
 from graphiti_core.helpers import (
+    embedding_to_list,
     lucene_sanitize,
     normalize_l2,
     semaphore_gather,
@@ -55,6 +57,7 @@ from graphiti_core.nodes import (
     get_entity_node_from_record,
     get_episodic_node_from_record,
 )
+from graphiti_core.search.query_templates import query_templates
 from graphiti_core.search.search_filters import (
     SearchFilters,
     build_aoss_edge_filters,
@@ -70,6 +73,8 @@ DEFAULT_MIN_SCORE = 0.6
 DEFAULT_MMR_LAMBDA = 0.5
 MAX_SEARCH_DEPTH = 3
 MAX_QUERY_LENGTH = 128
+# Neighbours requested from a vector index per result, to leave room for post-filtering
+VECTOR_INDEX_OVERSAMPLING = 4
 
 
 def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> float:
@@ -115,6 +120,57 @@ def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver)
     return full_query
 
 
+async def similarity_search_records(
+    driver: GraphDriver,
+    label: str | None,
+    uuid_field: str,
+    search_vector: list[float],
+    filter_queries: list[str],
+    build_query: Callable[[str], str],
+    limit: int,
+    min_score: float,
+    **params: Any,
+) -> list:
+    """
+    Run a similarity search query, narrowed to the candidates from the driver's vector index
+    for `label` when it has one.
+
+    `build_query` turns a WHERE clause into the exact scoring query. The index is asked for
+    `limit * VECTOR_INDEX_OVERSAMPLING` neighbours, which the query filters and re-scores.
+    When the filters leave fewer than `limit` results and the index may hold further
+    neighbours above `min_score`, the query is re-run over every row.
+    """
+    hits = None
+    k = limit * VECTOR_INDEX_OVERSAMPLING
+    if label is not None:
+        hits = await driver.query_vector_index(label, search_vector, k)
+
+    if hits is not None:
+        records, _, _ = await driver.execute_query(
+            build_query(
+                ' WHERE ' + ' AND '.join(filter_queries + [f'{uuid_field} IN $vector_candidates'])
+            ),
+            vector_candidates=list(dict.fromkeys(uuid for uuid, _ in hits)),
+            search_vector=search_vector,
+            limit=limit,
+            min_score=min_score,
+            **params,
+        )
+        exhausted = len(hits) < k or hits[-1][1] <= min_score
+        if exhausted or len(records) >= limit:
+            return records
+
+    filter_query = ' WHERE ' + ' AND '.join(filter_queries) if filter_queries else ''
+    records, _, _ = await driver.execute_query(
+        build_query(filter_query),
+        search_vector=search_vector,
+        limit=limit,
+        min_score=min_score,
+        **params,
+    )
+    return records
+
+
 async def get_episodes_by_mentions(
     driver: GraphDriver,
     nodes: list[EntityNode],
@@ -208,7 +264,7 @@ async def edge_fulltext_search(
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('edge_name_and_fact', query)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('edge_name_and_fact', query)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -283,19 +339,22 @@ async def edge_fulltext_search(
         else:
             return []
     else:
-        query = (
-            get_relationships_query('edge_name_and_fact', limit=limit, provider=driver.provider)
-            + match_query
-            + filter_query
-            + """
-            WITH e, score, n, m
-            RETURN
-            """
-            + get_entity_edge_return_query(driver.provider)
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
+        query = query_templates.get(
+            ('edge_fulltext_search', driver.provider, filter_query),
+            lambda: (
+                get_relationships_query('edge_name_and_fact', limit=limit, provider=driver.provider)
+                + match_query
+                + filter_query
+                + """
+                    WITH e, score, n, m
+                    RETURN
+                    """
+                + get_entity_edge_return_query(driver.provider)
+                + """
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    """
+            ),
         )
 
         records, _, _ = await driver.execute_query(
@@ -321,6 +380,8 @@ async def edge_similarity_search(
     limit: int = RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
 ) -> list[EntityEdge]:
+    # Accept float32 embeddings taken straight off a node or edge
+    search_vector = embedding_to_list(search_vector)  # type: ignore[assignment]
     match_query = """
         MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
     """
@@ -448,28 +509,36 @@ async def edge_similarity_search(
         return []
 
     else:
-        query = (
-            match_query
-            + filter_query
-            + """
-            WITH DISTINCT e, n, m, """
-            + get_vector_cosine_func_query('e.fact_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
-            RETURN
-            """
-            + get_entity_edge_return_query(driver.provider)
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
-
-        records, _, _ = await driver.execute_query(
-            query,
-            search_vector=search_vector,
-            limit=limit,
-            min_score=min_score,
+        records = await similarity_search_records(
+            driver,
+            # The endpoint filters already narrow the search to a handful of edges
+            'RELATES_TO' if source_node_uuid is None and target_node_uuid is None else None,
+            'e.uuid',
+            search_vector,
+            filter_queries,
+            lambda filter_query: query_templates.get(
+                ('edge_similarity_search', driver.provider, filter_query, search_vector_var),
+                lambda: (
+                    match_query
+                    + filter_query
+                    + """
+                    WITH DISTINCT e, n, m, """
+                    + get_vector_cosine_func_query(
+                        'e.fact_embedding', search_vector_var, driver.provider
+                    )
+                    + """ AS score
+                    WHERE score > $min_score
+                    RETURN
+                    """
+                    + get_entity_edge_return_query(driver.provider)
+                    + """
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    """
+                ),
+            ),
+            limit,
+            min_score,
             routing_='r',
             **filter_params,
         )
@@ -525,17 +594,23 @@ async def edge_bfs_search(
             """)
 
         records = []
-        for match_query in match_queries:
+        for i, match_query in enumerate(match_queries):
+            query = query_templates.get(
+                ('edge_bfs_search', driver.provider, filter_query, bfs_max_depth, i),
+                lambda match_query=match_query: (
+                    match_query
+                    + filter_query
+                    + """
+                    RETURN DISTINCT
+                    """
+                    + get_entity_edge_return_query(driver.provider)
+                    + """
+                    LIMIT $limit
+                    """
+                ),
+            )
             sub_records, _, _ = await driver.execute_query(
-                match_query
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """,
+                query,
                 bfs_origin_node_uuids=bfs_origin_node_uuids,
                 limit=limit,
                 routing_='r',
@@ -544,48 +619,54 @@ async def edge_bfs_search(
             records.extend(sub_records)
     else:
         if driver.provider == GraphProvider.NEPTUNE:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS *1..{bfs_max_depth}]->(n:Entity)
-                WHERE origin:Entity OR origin:Episodic
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                    e.uuid AS uuid,
-                    e.group_id AS group_id,
-                    startNode(e).uuid AS source_node_uuid,
-                    endNode(e).uuid AS target_node_uuid,
-                    e.created_at AS created_at,
-                    e.name AS name,
-                    e.fact AS fact,
-                    split(e.episodes, ',') AS episodes,
-                    e.expired_at AS expired_at,
-                    e.valid_at AS valid_at,
-                    e.invalid_at AS invalid_at,
-                    properties(e) AS attributes
-                LIMIT $limit
-                """
+            query = query_templates.get(
+                ('edge_bfs_search', driver.provider, filter_query, bfs_max_depth),
+                lambda: (
+                    f"""
+                        UNWIND $bfs_origin_node_uuids AS origin_uuid
+                        MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS *1..{bfs_max_depth}]->(n:Entity)
+                        WHERE origin:Entity OR origin:Episodic
+                        UNWIND relationships(path) AS rel
+                        MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
+                        """
+                    + filter_query
+                    + """
+                        RETURN DISTINCT
+                            e.uuid AS uuid,
+                            e.group_id AS group_id,
+                            startNode(e).uuid AS source_node_uuid,
+                            endNode(e).uuid AS target_node_uuid,
+                            e.created_at AS created_at,
+                            e.name AS name,
+                            e.fact AS fact,
+                            split(e.episodes, ',') AS episodes,
+                            e.expired_at AS expired_at,
+                            e.valid_at AS valid_at,
+                            e.invalid_at AS invalid_at,
+                            properties(e) AS attributes
+                        LIMIT $limit
+                        """
+                ),
             )
         else:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(:Entity)
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """
+            query = query_templates.get(
+                ('edge_bfs_search', driver.provider, filter_query, bfs_max_depth),
+                lambda: (
+                    f"""
+                        UNWIND $bfs_origin_node_uuids AS origin_uuid
+                        MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(:Entity)
+                        UNWIND relationships(path) AS rel
+                        MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
+                        """
+                    + filter_query
+                    + """
+                        RETURN DISTINCT
+                        """
+                    + get_entity_edge_return_query(driver.provider)
+                    + """
+                        LIMIT $limit
+                        """
+                ),
             )
 
         records, _, _ = await driver.execute_query(
@@ -631,7 +712,7 @@ async def node_fulltext_search(
         yield_query = 'WITH node AS n, score'
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -699,19 +780,22 @@ async def node_fulltext_search(
         else:
             return []
     else:
-        query = (
-            get_nodes_query(
-                'node_name_and_summary', '$query', limit=limit, provider=driver.provider
-            )
-            + yield_query
-            + filter_query
-            + """
-            WITH n, score
-            ORDER BY score DESC
-            LIMIT $limit
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
+        query = query_templates.get(
+            ('node_fulltext_search', driver.provider, filter_query),
+            lambda: (
+                get_nodes_query(
+                    'node_name_and_summary', '$query', limit=limit, provider=driver.provider
+                )
+                + yield_query
+                + filter_query
+                + """
+                    WITH n, score
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    RETURN
+                    """
+                + get_entity_node_return_query(driver.provider)
+            ),
         )
 
         records, _, _ = await driver.execute_query(
@@ -735,6 +819,7 @@ async def node_similarity_search(
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
 ) -> list[EntityNode]:
+    search_vector = embedding_to_list(search_vector)  # type: ignore[assignment]
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -838,30 +923,37 @@ async def node_similarity_search(
             return entity_nodes
         return []
     else:
-        query = (
-            """
-                                                                                                                MATCH (n:Entity)
-                                                                                                                """
-            + filter_query
-            + """
-            WITH n, """
-            + get_vector_cosine_func_query('n.name_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
-
-        records, _, _ = await driver.execute_query(
-            query,
-            search_vector=search_vector,
-            limit=limit,
-            min_score=min_score,
+        records = await similarity_search_records(
+            driver,
+            'Entity',
+            'n.uuid',
+            search_vector,
+            filter_queries,
+            lambda filter_query: query_templates.get(
+                ('node_similarity_search', driver.provider, filter_query, search_vector_var),
+                lambda: (
+                    """
+                                                                                                                        MATCH (n:Entity)
+                                                                                                                        """
+                    + filter_query
+                    + """
+                    WITH n, """
+                    + get_vector_cosine_func_query(
+                        'n.name_embedding', search_vector_var, driver.provider
+                    )
+                    + """ AS score
+                    WHERE score > $min_score
+                    RETURN
+                    """
+                    + get_entity_node_return_query(driver.provider)
+                    + """
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    """
+                ),
+            ),
+            limit,
+            min_score,
             routing_='r',
             **filter_params,
         )
@@ -936,17 +1028,23 @@ async def node_bfs_search(
             """)
 
     records = []
-    for match_query in match_queries:
+    for i, match_query in enumerate(match_queries):
+        query = query_templates.get(
+            ('node_bfs_search', driver.provider, filter_query, bfs_max_depth, i),
+            lambda match_query=match_query: (
+                match_query
+                + filter_query
+                + """
+                RETURN
+                """
+                + get_entity_node_return_query(driver.provider)
+                + """
+                LIMIT $limit
+                """
+            ),
+        )
         sub_records, _, _ = await driver.execute_query(
-            match_query
-            + filter_query
-            + """
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
-            + """
-            LIMIT $limit
-            """,
+            query,
             bfs_origin_node_uuids=bfs_origin_node_uuids,
             limit=limit,
             routing_='r',
@@ -978,7 +1076,7 @@ async def episode_fulltext_search(
         filter_params['group_ids'] = group_ids
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('episode_content', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('episode_content', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -1047,22 +1145,25 @@ async def episode_fulltext_search(
         else:
             return []
     else:
-        query = (
-            get_nodes_query('episode_content', '$query', limit=limit, provider=driver.provider)
-            + """
-            YIELD node AS episode, score
-            MATCH (e:Episodic)
-            WHERE e.uuid = episode.uuid
-            """
-            + group_filter_query
-            + """
-            RETURN
-            """
-            + EPISODIC_NODE_RETURN
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
+        query = query_templates.get(
+            ('episode_fulltext_search', driver.provider, group_filter_query),
+            lambda: (
+                get_nodes_query('episode_content', '$query', limit=limit, provider=driver.provider)
+                + """
+                    YIELD node AS episode, score
+                    MATCH (e:Episodic)
+                    WHERE e.uuid = episode.uuid
+                    """
+                + group_filter_query
+                + """
+                    RETURN
+                    """
+                + EPISODIC_NODE_RETURN
+                + """
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    """
+            ),
         )
 
         records, _, _ = await driver.execute_query(
@@ -1096,7 +1197,7 @@ async def community_fulltext_search(
         yield_query = 'WITH node AS c, score'
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             # Calculate Cosine similarity then return the edge ids
             input_ids = []
@@ -1129,21 +1230,24 @@ async def community_fulltext_search(
         else:
             return []
     else:
-        query = (
-            get_nodes_query('community_name', '$query', limit=limit, provider=driver.provider)
-            + yield_query
-            + """
-            WITH c, score
-            """
-            + group_filter_query
-            + """
-            RETURN
-            """
-            + COMMUNITY_NODE_RETURN
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
+        query = query_templates.get(
+            ('community_fulltext_search', driver.provider, group_filter_query),
+            lambda: (
+                get_nodes_query('community_name', '$query', limit=limit, provider=driver.provider)
+                + yield_query
+                + """
+                    WITH c, score
+                    """
+                + group_filter_query
+                + """
+                    RETURN
+                    """
+                + COMMUNITY_NODE_RETURN
+                + """
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    """
+            ),
         )
 
         records, _, _ = await driver.execute_query(
@@ -1162,11 +1266,14 @@ async def community_similarity_search(
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score=DEFAULT_MIN_SCORE,
 ) -> list[CommunityNode]:
+    search_vector = embedding_to_list(search_vector)  # type: ignore[assignment]
     # vector similarity search over entity names
     query_params: dict[str, Any] = {}
 
+    filter_queries: list[str] = []
     group_filter_query: LiteralString = ''
     if group_ids is not None:
+        filter_queries.append('c.group_id IN $group_ids')
         group_filter_query += ' WHERE c.group_id IN $group_ids'
         query_params['group_ids'] = group_ids
 
@@ -1231,31 +1338,38 @@ async def community_similarity_search(
         if driver.provider == GraphProvider.KUZU:
             search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
-        query = (
-            """
-                                                                                                                MATCH (c:Community)
-                                                                                                                """
-            + group_filter_query
-            + """
-            WITH c,
-            """
-            + get_vector_cosine_func_query('c.name_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
-            RETURN
-            """
-            + COMMUNITY_NODE_RETURN
-            + """
-            ORDER BY score DESC
-            LIMIT $limit
-            """
-        )
-
-        records, _, _ = await driver.execute_query(
-            query,
-            search_vector=search_vector,
-            limit=limit,
-            min_score=min_score,
+        records = await similarity_search_records(
+            driver,
+            'Community',
+            'c.uuid',
+            search_vector,
+            filter_queries,
+            lambda filter_query: query_templates.get(
+                ('community_similarity_search', driver.provider, filter_query, search_vector_var),
+                lambda: (
+                    """
+                                                                                                                        MATCH (c:Community)
+                                                                                                                        """
+                    + filter_query
+                    + """
+                    WITH c,
+                    """
+                    + get_vector_cosine_func_query(
+                        'c.name_embedding', search_vector_var, driver.provider
+                    )
+                    + """ AS score
+                    WHERE score > $min_score
+                    RETURN
+                    """
+                    + COMMUNITY_NODE_RETURN
+                    + """
+                    ORDER BY score DESC
+                    LIMIT $limit
+                    """
+                ),
+            ),
+            limit,
+            min_score,
             routing_='r',
             **query_params,
         )
@@ -1350,11 +1464,29 @@ async def get_relevant_nodes(
         return []
 
     group_id = nodes[0].group_id
+    if driver.provider == GraphProvider.KUZU:
+        # Kuzu's FTS and vector index procedures only accept literals and parameters, not
+        # per-row variables such as `node.fulltext_query`, so each node gets its own searches.
+        # They are reads, so they run in parallel on the driver's read pool.
+        async def search_node(node: EntityNode) -> list[EntityNode]:
+            if node.name_embedding is None:
+                return []
+            vector_nodes, fulltext_nodes = await semaphore_gather(
+                node_similarity_search(
+                    driver, node.name_embedding, search_filter, [group_id], limit, min_score
+                ),
+                node_fulltext_search(driver, node.name, search_filter, [group_id], limit),
+            )
+            vector_uuids = {n.uuid for n in vector_nodes}
+            return vector_nodes + [n for n in fulltext_nodes if n.uuid not in vector_uuids]
+
+        return list(await semaphore_gather(*[search_node(node) for node in nodes]))
+
     query_nodes = [
         {
             'uuid': node.uuid,
             'name': node.name,
-            'name_embedding': node.name_embedding,
+            'name_embedding': embedding_to_list(node.name_embedding),
             'fulltext_query': fulltext_query(node.name, [node.group_id], driver),
         }
         for node in nodes
@@ -1368,74 +1500,23 @@ async def get_relevant_nodes(
     if filter_queries:
         filter_query = 'WHERE ' + (' AND '.join(filter_queries))
 
-    if driver.provider == GraphProvider.KUZU:
-        embedding_size = len(nodes[0].name_embedding) if nodes[0].name_embedding is not None else 0
-        if embedding_size == 0:
-            return []
-
-        # FIXME: Kuzu currently does not support using variables such as `node.fulltext_query` as an input to FTS, which means `get_relevant_nodes()` won't work with Kuzu as the graph driver.
-        query = (
+    query = query_templates.get(
+        ('get_relevant_nodes', driver.provider, filter_query),
+        lambda: (
             """
-                                                                                                                UNWIND $nodes AS node
-                                                                                                                MATCH (n:Entity {group_id: $group_id})
-                                                                                                                """
-            + filter_query
-            + """
-            WITH node, n, """
-            + get_vector_cosine_func_query(
-                'n.name_embedding',
-                f'CAST(node.name_embedding AS FLOAT[{embedding_size}])',
-                driver.provider,
-            )
-            + """ AS score
-            WHERE score > $min_score
-            WITH node, collect(n)[:$limit] AS top_vector_nodes, collect(n.uuid) AS vector_node_uuids
-            """
-            + get_nodes_query(
-                'node_name_and_summary',
-                'node.fulltext_query',
-                limit=limit,
-                provider=driver.provider,
-            )
-            + """
-            WITH node AS m
-            WHERE m.group_id = $group_id AND NOT m.uuid IN vector_node_uuids
-            WITH node, top_vector_nodes, collect(m) AS fulltext_nodes
-
-            WITH node, list_concat(top_vector_nodes, fulltext_nodes) AS combined_nodes
-
-            UNWIND combined_nodes AS x
-            WITH node, collect(DISTINCT {
-                uuid: x.uuid,
-                name: x.name,
-                name_embedding: x.name_embedding,
-                group_id: x.group_id,
-                created_at: x.created_at,
-                summary: x.summary,
-                labels: x.labels,
-                attributes: x.attributes
-            }) AS matches
-
-            RETURN
-            node.uuid AS search_node_uuid, matches
-            """
-        )
-    else:
-        query = (
-            """
-                                                                                                                UNWIND $nodes AS node
-                                                                                                                MATCH (n:Entity {group_id: $group_id})
-                                                                                                                """
+                                                                                                                        UNWIND $nodes AS node
+                                                                                                                        MATCH (n:Entity {group_id: $group_id})
+                                                                                                                        """
             + filter_query
             + """
-            WITH node, n, """
+                    WITH node, n, """
             + get_vector_cosine_func_query(
                 'n.name_embedding', 'node.name_embedding', driver.provider
             )
             + """ AS score
-            WHERE score > $min_score
-            WITH node, collect(n)[..$limit] AS top_vector_nodes, collect(n.uuid) AS vector_node_uuids
-            """
+                    WHERE score > $min_score
+                    WITH node, collect(n)[..$limit] AS top_vector_nodes, collect(n.uuid) AS vector_node_uuids
+                    """
             + get_nodes_query(
                 'node_name_and_summary',
                 'node.fulltext_query',
@@ -1443,33 +1524,34 @@ async def get_relevant_nodes(
                 provider=driver.provider,
             )
             + """
-            YIELD node AS m
-            WHERE m.group_id = $group_id
-            WITH node, top_vector_nodes, vector_node_uuids, collect(m) AS fulltext_nodes
+                    YIELD node AS m
+                    WHERE m.group_id = $group_id
+                    WITH node, top_vector_nodes, vector_node_uuids, collect(m) AS fulltext_nodes
 
-            WITH node,
-                top_vector_nodes,
-                [m IN fulltext_nodes WHERE NOT m.uuid IN vector_node_uuids] AS filtered_fulltext_nodes
+                    WITH node,
+                        top_vector_nodes,
+                        [m IN fulltext_nodes WHERE NOT m.uuid IN vector_node_uuids] AS filtered_fulltext_nodes
 
-            WITH node, top_vector_nodes + filtered_fulltext_nodes AS combined_nodes
+                    WITH node, top_vector_nodes + filtered_fulltext_nodes AS combined_nodes
 
-            UNWIND combined_nodes AS combined_node
-            WITH node, collect(DISTINCT combined_node) AS deduped_nodes
+                    UNWIND combined_nodes AS combined_node
+                    WITH node, collect(DISTINCT combined_node) AS deduped_nodes
 
-            RETURN
-            node.uuid AS search_node_uuid,
-            [x IN deduped_nodes | {
-                uuid: x.uuid,
-                name: x.name,
-                name_embedding: x.name_embedding,
-                group_id: x.group_id,
-                created_at: x.created_at,
-                summary: x.summary,
-                labels: labels(x),
-                attributes: properties(x)
-            }] AS matches
-            """
-        )
+                    RETURN
+                    node.uuid AS search_node_uuid,
+                    [x IN deduped_nodes | {
+                        uuid: x.uuid,
+                        name: x.name,
+                        name_embedding: x.name_embedding,
+                        group_id: x.group_id,
+                        created_at: x.created_at,
+                        summary: x.summary,
+                        labels: labels(x),
+                        attributes: properties(x)
+                    }] AS matches
+                    """
+        ),
+    )
 
     results, _, _ = await driver.execute_query(
         query,
@@ -1584,77 +1666,82 @@ async def get_relevant_edges(
             if embedding_size == 0:
                 return []
 
-            query = (
-                """
-                                                                                                                    UNWIND $edges AS edge
-                                                                                                                    MATCH (n:Entity {uuid: edge.source_node_uuid})-[:RELATES_TO]-(e:RelatesToNode_ {group_id: edge.group_id})-[:RELATES_TO]-(m:Entity {uuid: edge.target_node_uuid})
-                                                                                                                    """
-                + filter_query
-                + """
-                WITH e, edge, n, m, """
-                + get_vector_cosine_func_query(
-                    'e.fact_embedding',
-                    f'CAST(edge.fact_embedding AS FLOAT[{embedding_size}])',
-                    driver.provider,
-                )
-                + """ AS score
-                WHERE score > $min_score
-                WITH e, edge, n, m, score
-                ORDER BY score DESC
-                LIMIT $limit
-                RETURN
-                    edge.uuid AS search_edge_uuid,
-                    collect({
-                        uuid: e.uuid,
-                        source_node_uuid: n.uuid,
-                        target_node_uuid: m.uuid,
-                        created_at: e.created_at,
-                        name: e.name,
-                        group_id: e.group_id,
-                        fact: e.fact,
-                        fact_embedding: e.fact_embedding,
-                        episodes: e.episodes,
-                        expired_at: e.expired_at,
-                        valid_at: e.valid_at,
-                        invalid_at: e.invalid_at,
-                        attributes: e.attributes
-                    }) AS matches
-                """
+            query = query_templates.get(
+                ('get_relevant_edges', driver.provider, filter_query, embedding_size),
+                lambda: (
+                    """
+                                                                                                                            UNWIND $edges AS edge
+                                                                                                                            MATCH (n:Entity {uuid: edge.source_node_uuid})-[:RELATES_TO]-(e:RelatesToNode_ {group_id: edge.group_id})-[:RELATES_TO]-(m:Entity {uuid: edge.target_node_uuid})
+                                                                                                                            """
+                    + filter_query
+                    + """
+                        WITH e, edge, n, m, """
+                    + get_vector_cosine_func_query(
+                        'e.fact_embedding',
+                        f'CAST(edge.fact_embedding AS FLOAT[{embedding_size}])',
+                        driver.provider,
+                    )
+                    + """ AS score
+                        WHERE score > $min_score
+                        WITH e, edge, n, m, score
+                        ORDER BY score DESC
+                        SKIP 0
+                        WITH edge.uuid AS search_edge_uuid, collect({
+                                uuid: e.uuid,
+                                source_node_uuid: n.uuid,
+                                target_node_uuid: m.uuid,
+                                created_at: e.created_at,
+                                name: e.name,
+                                group_id: e.group_id,
+                                fact: e.fact,
+                                fact_embedding: e.fact_embedding,
+                                episodes: e.episodes,
+                                expired_at: e.expired_at,
+                                valid_at: e.valid_at,
+                                invalid_at: e.invalid_at,
+                                attributes: e.attributes
+                            }) AS matches
+                        RETURN search_edge_uuid, matches[:$limit] AS matches
+                        """
+                ),
             )
         else:
-            query = (
-                """
-                                                                                                                    UNWIND $edges AS edge
-                                                                                                                    MATCH (n:Entity {uuid: edge.source_node_uuid})-[e:RELATES_TO {group_id: edge.group_id}]-(m:Entity {uuid: edge.target_node_uuid})
-                                                                                                                    """
-                + filter_query
-                + """
-                WITH e, edge, """
-                + get_vector_cosine_func_query(
-                    'e.fact_embedding', 'edge.fact_embedding', driver.provider
-                )
-                + """ AS score
-                WHERE score > $min_score
-                WITH edge, e, score
-                ORDER BY score DESC
-                RETURN
-                    edge.uuid AS search_edge_uuid,
-                    collect({
-                        uuid: e.uuid,
-                        source_node_uuid: startNode(e).uuid,
-                        target_node_uuid: endNode(e).uuid,
-                        created_at: e.created_at,
-                        name: e.name,
-                        group_id: e.group_id,
-                        fact: e.fact,
-                        fact_embedding: e.fact_embedding,
-                        episodes: e.episodes,
-                        expired_at: e.expired_at,
-                        valid_at: e.valid_at,
-                        invalid_at: e.invalid_at,
-                        attributes: properties(e)
-                    })[..$limit] AS matches
-                """
+            query = query_templates.get(
+                ('get_relevant_edges', driver.provider, filter_query),
+                lambda: (
+                    """
+                                                                                                                            UNWIND $edges AS edge
+                                                                                                                            MATCH (n:Entity {uuid: edge.source_node_uuid})-[e:RELATES_TO {group_id: edge.group_id}]-(m:Entity {uuid: edge.target_node_uuid})
+                                                                                                                            """
+                    + filter_query
+                    + """
+                        WITH e, edge, """
+                    + get_vector_cosine_func_query(
+                        'e.fact_embedding', 'edge.fact_embedding', driver.provider
+                    )
+                    + """ AS score
+                        WHERE score > $min_score
+                        WITH edge, e, score
+                        ORDER BY score DESC
+                        RETURN
+                            edge.uuid AS search_edge_uuid,
+                            collect({
+                                uuid: e.uuid,
+                                source_node_uuid: startNode(e).uuid,
+                                target_node_uuid: endNode(e).uuid,
+                                created_at: e.created_at,
+                                name: e.name,
+                                group_id: e.group_id,
+                                fact: e.fact,
+                                fact_embedding: e.fact_embedding,
+                                episodes: e.episodes,
+                                expired_at: e.expired_at,
+                                valid_at: e.valid_at,
+                                invalid_at: e.invalid_at,
+                                attributes: properties(e)
+                            })[..$limit] AS matches
+                        """
+                ),
             )
 
         results, _, _ = await driver.execute_query(
@@ -1770,79 +1857,85 @@ async def get_edge_invalidation_candidates(
             if embedding_size == 0:
                 return []
 
-            query = (
-                """
-                                                                                                                    UNWIND $edges AS edge
-                                                                                                                    MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {group_id: edge.group_id})-[:RELATES_TO]->(m:Entity)
-                                                                                                                    WHERE (n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid])
-                                                                                                                    """
-                + filter_query
-                + """
-                WITH edge, e, n, m, """
-                + get_vector_cosine_func_query(
-                    'e.fact_embedding',
-                    f'CAST(edge.fact_embedding AS FLOAT[{embedding_size}])',
-                    driver.provider,
-                )
-                + """ AS score
-                WHERE score > $min_score
-                WITH edge, e, n, m, score
-                ORDER BY score DESC
-                LIMIT $limit
-                RETURN
-                    edge.uuid AS search_edge_uuid,
-                    collect({
-                        uuid: e.uuid,
-                        source_node_uuid: n.uuid,
-                        target_node_uuid: m.uuid,
-                        created_at: e.created_at,
-                        name: e.name,
-                        group_id: e.group_id,
-                        fact: e.fact,
-                        fact_embedding: e.fact_embedding,
-                        episodes: e.episodes,
-                        expired_at: e.expired_at,
-                        valid_at: e.valid_at,
-                        invalid_at: e.invalid_at,
-                        attributes: e.attributes
-                    }) AS matches
-                """
+            query = query_templates.get(
+                ('get_edge_invalidation_candidates', driver.provider, filter_query, embedding_size),
+                lambda: (
+                    """
+                                                                                                                            UNWIND $edges AS edge
+                                                                                                                            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {group_id: edge.group_id})-[:RELATES_TO]->(m:Entity)
+                                                                                                                            WHERE (n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid])
+                                                                                                                            """
+                    + filter_query
+                    + """
+                        WITH edge, e, n, m, """
+                    + get_vector_cosine_func_query(
+                        'e.fact_embedding',
+                        f'CAST(edge.fact_embedding AS FLOAT[{embedding_size}])',
+                        driver.provider,
+                    )
+                    + """ AS score
+                        WHERE score > $min_score
+                        WITH edge, e, n, m, score
+                        ORDER BY score DESC
+                        LIMIT $limit
+                        RETURN
+                            edge.uuid AS search_edge_uuid,
+                            collect({
+                                uuid: e.uuid,
+                                source_node_uuid: n.uuid,
+                                target_node_uuid: m.uuid,
+                                created_at: e.created_at,
+                                name: e.name,
+                                group_id: e.group_id,
+                                fact: e.fact,
+                                fact_embedding: e.fact_embedding,
+                                episodes: e.episodes,
+                                expired_at: e.expired_at,
+                                valid_at: e.valid_at,
+                                invalid_at: e.invalid_at,
+                                attributes: e.attributes
+                            }) AS matches
+                        """
+                ),
             )
         else:
-            query = (
-                """
-                                                                                                                    UNWIND $edges AS edge
-                                                                                                                    MATCH (n:Entity)-[e:RELATES_TO {group_id: edge.group_id}]->(m:Entity)
-                                                                                                                    WHERE n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid]
-                                                                                                                    """
-                + filter_query
-                + """
-                WITH edge, e, """
-                + get_vector_cosine_func_query(
-                    'e.fact_embedding', 'edge.fact_embedding', driver.provider
-                )
-                + """ AS score
-                WHERE score > $min_score
-                WITH edge, e, score
-                ORDER BY score DESC
-                RETURN
-                    edge.uuid AS search_edge_uuid,
-                    collect({
-                        uuid: e.uuid,
-                        source_node_uuid: startNode(e).uuid,
-                        target_node_uuid: endNode(e).uuid,
-                        created_at: e.created_at,
-                        name: e.name,
-                        group_id: e.group_id,
-                        fact: e.fact,
-                        fact_embedding: e.fact_embedding,
-                        episodes: e.episodes,
-                        expired_at: e.expired_at,
-                        valid_at: e.valid_at,
-                        invalid_at: e.invalid_at,
-                        attributes: properties(e)
-                    })[..$limit] AS matches
-                """
+            query = query_templates.get(
+                ('get_edge_invalidation_candidates', driver.provider, filter_query),
+                lambda: (
+                    """
+                                                                                                                            UNWIND $edges AS edge
+                                                                                                                            MATCH (n:Entity)-[e:RELATES_TO {group_id: edge.group_id}]->(m:Entity)
+                                                                                                                            WHERE n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid]
+                                                                                                                            """
+                    + filter_query
+                    + """
+                        WITH edge, e, """
+                    + get_vector_cosine_func_query(
+                        'e.fact_embedding', 'edge.fact_embedding', driver.provider
+                    )
+                    + """ AS score
+                        WHERE score > $min_score
+                        WITH edge, e, score
+                        ORDER BY score DESC
+                        RETURN
+                            edge.uuid AS search_edge_uuid,
+                            collect({
+                                uuid: e.uuid,
+                                source_node_uuid: startNode(e).uuid,
+                                target_node_uuid: endNode(e).uuid,
+                                created_at: e.created_at,
+                                name: e.name,
+                                group_id: e.group_id,
+                                fact: e.fact,
+                                fact_embedding: e.fact_embedding,
+                                episodes: e.episodes,
+                                expired_at: e.expired_at,
+                                valid_at: e.valid_at,
+                                invalid_at: e.invalid_at,
+                                attributes: properties(e)
+                            })[..$limit] AS matches
+                        """
+                ),
             )
 
         results, _, _ = await driver.execute_query(
@@ -1907,19 +2000,14 @@ async def node_distance_reranker(
         """
 
     # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
+    columns = await driver.execute_query_columns(
         query,
         node_uuids=filtered_uuids,
         center_uuid=center_node_uuid,
         routing_='r',
     )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
 
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+    scores.update(zip(columns.get('uuid', []), columns.get('score', []), strict=True))
 
     for uuid in filtered_uuids:
         if uuid not in scores:
@@ -1946,7 +2034,7 @@ async def episode_mentions_reranker(
     scores: dict[str, float] = {}
 
     # Find the shortest path to center node
-    results, _, _ = await driver.execute_query(
+    columns = await driver.execute_query_columns(
         """
         UNWIND $node_uuids AS node_uuid
         MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
@@ -1956,8 +2044,7 @@ async def episode_mentions_reranker(
         routing_='r',
     )
 
-    for result in results:
-        scores[result['uuid']] = result['score']
+    scores.update(zip(columns.get('uuid', []), columns.get('score', []), strict=True))
 
     for uuid in sorted_uuids:
         if uuid not in scores:
@@ -2031,16 +2118,16 @@ async def get_embeddings_for_nodes(
             n.uuid AS uuid,
             n.name_embedding AS name_embedding
         """
-    results, _, _ = await driver.execute_query(
+    columns = await driver.execute_query_columns(
         query,
         node_uuids=[node.uuid for node in nodes],
         routing_='r',
     )
 
     embeddings_dict: dict[str, list[float]] = {}
-    for result in results:
-        uuid: str = result.get('uuid')
-        embedding: list[float] = result.get('name_embedding')
+    for uuid, embedding in zip(
+        columns.get('uuid', []), columns.get('name_embedding', []), strict=True
+    ):
         if uuid is not None and embedding is not None:
             embeddings_dict[uuid] = embedding
 
@@ -2066,16 +2153,16 @@ async def get_embeddings_for_communities(
             c.uuid AS uuid,
             c.name_embedding AS name_embedding
         """
-    results, _, _ = await driver.execute_query(
+    columns = await driver.execute_query_columns(
         query,
         community_uuids=[community.uuid for community in communities],
         routing_='r',
     )
 
     embeddings_dict: dict[str, list[float]] = {}
-    for result in results:
-        uuid: str = result.get('uuid')
-        embedding: list[float] = result.get('name_embedding')
+    for uuid, embedding in zip(
+        columns.get('uuid', []), columns.get('name_embedding', []), strict=True
+    ):
         if uuid is not None and embedding is not None:
             embeddings_dict[uuid] = embedding
 
@@ -2111,16 +2198,16 @@ async def get_embeddings_for_edges(
             e.fact_embedding AS fact_embedding
         """
         )
-    results, _, _ = await driver.execute_query(
+    columns = await driver.execute_query_columns(
         query,
         edge_uuids=[edge.uuid for edge in edges],
         routing_='r',
     )
 
     embeddings_dict: dict[str, list[float]] = {}
-    for result in results:
-        uuid: str = result.get('uuid')
-        embedding: list[float] = result.get('fact_embedding')
+    for uuid, embedding in zip(
+        columns.get('uuid', []), columns.get('fact_embedding', []), strict=True
+    ):
         if uuid is not None and embedding is not None:
             embeddings_dict[uuid] = embedding
 
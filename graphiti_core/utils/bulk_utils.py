@@ -31,19 +31,33 @@ from graphiti_core.driver.driver import (
     GraphDriverSession,
     GraphProvider,
 )
-from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
+from graphiti_core.edges import (
+    CommunityEdge,
+    Edge,
+    EntityEdge,
+    EpisodicEdge,
+    create_entity_edge_embeddings,
+)
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import normalize_l2, semaphore_gather
+from graphiti_core.helpers import embedding_to_list, normalize_l2, semaphore_gather
 from graphiti_core.models.edges.edge_db_queries import (
+    get_community_edge_save_query,
     get_entity_edge_save_bulk_query,
     get_episodic_edge_save_bulk_query,
 )
 from graphiti_core.models.nodes.node_db_queries import (
+    get_community_node_save_query,
     get_entity_node_save_bulk_query,
     get_episode_node_save_bulk_query,
 )
-from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, create_entity_node_embeddings
+from graphiti_core.nodes import (
+    CommunityNode,
+    EntityNode,
+    EpisodeType,
+    EpisodicNode,
+    create_entity_node_embeddings,
+)
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 from graphiti_core.utils.maintenance.edge_operations import (
     extract_edges,
@@ -142,7 +156,7 @@ async def add_nodes_and_edges_bulk_tx(
         }
 
         if not bool(driver.aoss_client):
-            entity_data['name_embedding'] = node.name_embedding
+            entity_data['name_embedding'] = embedding_to_list(node.name_embedding)
 
         entity_data['labels'] = list(set(node.labels + ['Entity']))
         if driver.provider == GraphProvider.KUZU:
@@ -172,7 +186,7 @@ async def add_nodes_and_edges_bulk_tx(
         }
 
         if not bool(driver.aoss_client):
-            edge_data['fact_embedding'] = edge.fact_embedding
+            edge_data['fact_embedding'] = embedding_to_list(edge.fact_embedding)
 
         if driver.provider == GraphProvider.KUZU:
             attributes = convert_datetimes_to_strings(edge.attributes) if edge.attributes else {}
@@ -187,10 +201,14 @@ async def add_nodes_and_edges_bulk_tx(
         episode_query = get_episode_node_save_bulk_query(driver.provider)
         for episode in episodes:
             await tx.run(episode_query, **episode)
-        entity_node_query = get_entity_node_save_bulk_query(driver.provider, nodes)
+        entity_node_query = get_entity_node_save_bulk_query(
+            driver.provider, nodes, vector_index_dim=driver.get_vector_index_dim('Entity')
+        )
         for node in nodes:
             await tx.run(entity_node_query, **node)
-        entity_edge_query = get_entity_edge_save_bulk_query(driver.provider)
+        entity_edge_query = get_entity_edge_save_bulk_query(
+            driver.provider, vector_index_dim=driver.get_vector_index_dim('RELATES_TO')
+        )
         for edge in edges:
             await tx.run(entity_edge_query, **edge)
         episodic_edge_query = get_episodic_edge_save_bulk_query(driver.provider)
@@ -216,15 +234,76 @@ async def add_nodes_and_edges_bulk_tx(
         if bool(driver.aoss_client):
             for node_data, entity_node in zip(nodes, entity_nodes, strict=True):
                 if node_data.get('uuid') == entity_node.uuid:
-                    node_data['name_embedding'] = entity_node.name_embedding
+                    node_data['name_embedding'] = embedding_to_list(entity_node.name_embedding)
 
             for edge_data, entity_edge in zip(edges, entity_edges, strict=True):
                 if edge_data.get('uuid') == entity_edge.uuid:
-                    edge_data['fact_embedding'] = entity_edge.fact_embedding
+                    edge_data['fact_embedding'] = embedding_to_list(entity_edge.fact_embedding)
+
+            await semaphore_gather(
+                driver.save_to_aoss(EPISODE_INDEX_NAME, episodes),
+                driver.save_to_aoss(ENTITY_INDEX_NAME, nodes),
+                driver.save_to_aoss(ENTITY_EDGE_INDEX_NAME, edges),
+            )
+
+
+async def add_communities_bulk(
+    driver: GraphDriver,
+    community_nodes: list[CommunityNode],
+    community_edges: list[CommunityEdge],
+):
+    if not community_nodes and not community_edges:
+        return
+
+    if driver.provider == GraphProvider.NEPTUNE:
+        await driver.save_to_aoss(  # pyright: ignore reportAttributeAccessIssue
+            'communities',
+            [
+                {'name': node.name, 'uuid': node.uuid, 'group_id': node.group_id}
+                for node in community_nodes
+            ],
+        )
+
+    session = driver.session()
+    try:
+        await session.execute_write(
+            add_communities_bulk_tx, community_nodes, community_edges, driver=driver
+        )
+    finally:
+        await session.close()
+
+
+async def add_communities_bulk_tx(
+    tx: GraphDriverSession,
+    community_nodes: list[CommunityNode],
+    community_edges: list[CommunityEdge],
+    driver: GraphDriver,
+):
+    node_query = get_community_node_save_query(
+        driver.provider, vector_index_dim=driver.get_vector_index_dim('Community')
+    )
+    for node in community_nodes:
+        await tx.run(
+            node_query,
+            uuid=node.uuid,
+            name=node.name,
+            group_id=node.group_id,
+            summary=node.summary,
+            name_embedding=embedding_to_list(node.name_embedding),
+            created_at=node.created_at,
+            built_at=node.built_at,
+        )
 
-            await driver.save_to_aoss(EPISODE_INDEX_NAME, episodes)
-            await driver.save_to_aoss(ENTITY_INDEX_NAME, nodes)
-            await driver.save_to_aoss(ENTITY_EDGE_INDEX_NAME, edges)
+    edge_query = get_community_edge_save_query(driver.provider)
+    for edge in community_edges:
+        await tx.run(
+            edge_query,
+            community_uuid=edge.source_node_uuid,
+            entity_uuid=edge.target_node_uuid,
+            uuid=edge.uuid,
+            group_id=edge.group_id,
+            created_at=edge.created_at,
+        )
 
 
 async def extract_nodes_and_edges_bulk(
@@ -297,8 +376,12 @@ async def dedupe_nodes_bulk(
 
                 # Check for semantic similarity even if there is no overlap
                 similarity = np.dot(
-                    normalize_l2(node.name_embedding or []),
-                    normalize_l2(existing_node.name_embedding or []),
+                    normalize_l2(node.name_embedding if node.name_embedding is not None else []),
+                    normalize_l2(
+                        existing_node.name_embedding
+                        if existing_node.name_embedding is not None
+                        else []
+                    ),
                 )
                 if similarity >= min_score:
                     candidates_i.append(existing_node)
@@ -392,8 +475,12 @@ async def dedupe_edges_bulk(
 
                 # Check for semantic similarity even if there is no overlap
                 similarity = np.dot(
-                    normalize_l2(edge.fact_embedding or []),
-                    normalize_l2(existing_edge.fact_embedding or []),
+                    normalize_l2(edge.fact_embedding if edge.fact_embedding is not None else []),
+                    normalize_l2(
+                        existing_edge.fact_embedding
+                        if existing_edge.fact_embedding is not None
+                        else []
+                    ),
                 )
                 if similarity >= min_score:
                     candidates.append(existing_edge)
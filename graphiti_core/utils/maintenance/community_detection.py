@@ -0,0 +1,208 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+import os
+import random
+from enum import Enum
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict
+
+logger = logging.getLogger(__name__)
+
+
+class CommunityAlgorithm(str, Enum):
+    label_propagation = 'label_propagation'
+    leiden = 'leiden'
+    louvain = 'louvain'
+
+
+COMMUNITY_ALGORITHM = CommunityAlgorithm(
+    os.getenv('COMMUNITY_ALGORITHM', CommunityAlgorithm.label_propagation.value)
+)
+COMMUNITY_MAX_ITERATIONS = int(os.getenv('COMMUNITY_MAX_ITERATIONS', 100))
+COMMUNITY_SEED = int(os.getenv('COMMUNITY_SEED', 0))
+
+
+class Neighbor(BaseModel):
+    node_uuid: str
+    edge_count: int
+
+
+class GraphProjection(BaseModel):
+    """
+    Weighted entity graph of one group in coordinate form. Entity i is `uuids[i]` and entry k
+    says `weight[k]` RELATES_TO edges connect entities `src_idx[k]` and `dst_idx[k]`. Every
+    pair is listed from both ends.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    uuids: list[str]
+    src_idx: NDArray[np.int64]
+    dst_idx: NDArray[np.int64]
+    weight: NDArray[np.int64]
+
+    @classmethod
+    def from_neighbors(cls, projection: dict[str, list[Neighbor]]) -> 'GraphProjection':
+        uuids = list(projection.keys())
+        index = {uuid: i for i, uuid in enumerate(uuids)}
+        pairs = [
+            (index[uuid], index[neighbor.node_uuid], neighbor.edge_count)
+            for uuid, neighbors in projection.items()
+            for neighbor in neighbors
+        ]
+        columns = np.array(pairs, dtype=np.int64).reshape(-1, 3)
+        return cls(
+            uuids=uuids,
+            src_idx=columns[:, 0].copy(),
+            dst_idx=columns[:, 1].copy(),
+            weight=columns[:, 2].copy(),
+        )
+
+
+class CSRGraph(BaseModel):
+    """Adjacency of a GraphProjection in compressed sparse row form."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    indptr: NDArray[np.int64]
+    indices: NDArray[np.int64]
+    data: NDArray[np.int64]
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @classmethod
+    def from_projection(cls, projection: GraphProjection) -> 'CSRGraph':
+        num_nodes = len(projection.uuids)
+        order = np.argsort(projection.src_idx, kind='stable')
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(projection.src_idx, minlength=num_nodes), out=indptr[1:])
+        return cls(indptr=indptr, indices=projection.dst_idx[order], data=projection.weight[order])
+
+
+def propagate_labels(
+    graph: CSRGraph, max_iterations: int = COMMUNITY_MAX_ITERATIONS
+) -> NDArray[np.int64]:
+    """
+    Synchronous label propagation. Every node starts in its own community and then takes the
+    community holding the largest edge weight among its neighbors, with ties going to the
+    larger community id. A plurality of a single edge only moves a node to a larger community.
+    Synchronous updates can oscillate: when labels alternate between two states, each node
+    settles on the larger of its two labels. Stops when no label changes, or after
+    `max_iterations`.
+    """
+    num_nodes = graph.num_nodes
+    labels = np.arange(num_nodes, dtype=np.int64)
+    rows = np.repeat(labels, np.diff(graph.indptr))
+    weights = graph.data.astype(np.float64)
+    if len(rows) == 0:
+        return labels
+
+    previous_labels = labels
+    for _ in range(max_iterations):
+        # Total weight per (node, neighbor label) pair
+        keys, inverse = np.unique(rows * num_nodes + labels[graph.indices], return_inverse=True)
+        totals = np.bincount(inverse, weights=weights)
+        key_rows, key_labels = np.divmod(keys, num_nodes)
+
+        # Sorted by node, then weight, then label: the last entry per node is its candidate
+        order = np.lexsort((key_labels, totals, key_rows))
+        last = np.append(key_rows[order][1:] != key_rows[order][:-1], True)
+        best = order[last]
+        best_rows = key_rows[best]
+
+        new_labels = labels.copy()
+        new_labels[best_rows] = np.where(
+            totals[best] > 1,
+            key_labels[best],
+            np.maximum(key_labels[best], labels[best_rows]),
+        )
+
+        if np.array_equal(new_labels, labels):
+            return labels
+        if np.array_equal(new_labels, previous_labels):
+            new_labels = np.maximum(labels, new_labels)
+        previous_labels, labels = labels, new_labels
+
+    logger.warning(f'Label propagation did not converge after {max_iterations} iterations')
+    return labels
+
+
+def _igraph_labels(
+    projection: GraphProjection, algorithm: CommunityAlgorithm, max_iterations: int, seed: int
+) -> NDArray[np.int64]:
+    try:
+        import igraph
+    except ImportError:
+        raise ImportError(
+            f'igraph is required for {algorithm.value} community detection. '
+            'Install it with: pip install graphiti-core[igraph]'
+        ) from None
+
+    # Pairs are listed from both ends; keep each undirected edge once
+    mask = projection.src_idx <= projection.dst_idx
+    graph = igraph.Graph(
+        n=len(projection.uuids),
+        edges=np.column_stack((projection.src_idx[mask], projection.dst_idx[mask])).tolist(),
+        directed=False,
+    )
+    graph.es['weight'] = projection.weight[mask].tolist()
+
+    igraph.set_random_number_generator(random.Random(seed))
+    try:
+        if algorithm == CommunityAlgorithm.leiden:
+            clustering = graph.community_leiden(
+                objective_function='modularity', weights='weight', n_iterations=max_iterations
+            )
+        else:
+            clustering = graph.community_multilevel(weights='weight')
+    finally:
+        igraph.set_random_number_generator(random)
+
+    return np.array(clustering.membership, dtype=np.int64)
+
+
+def detect_communities(
+    projection: GraphProjection,
+    algorithm: CommunityAlgorithm = COMMUNITY_ALGORITHM,
+    max_iterations: int = COMMUNITY_MAX_ITERATIONS,
+    seed: int = COMMUNITY_SEED,
+) -> list[list[str]]:
+    """
+    Cluster the entities of a projection. Clusters are returned in order of their first
+    member, and members in projection order, so the same graph always yields the same output.
+    """
+    if not projection.uuids:
+        return []
+
+    if algorithm == CommunityAlgorithm.label_propagation:
+        labels = propagate_labels(CSRGraph.from_projection(projection), max_iterations)
+    else:
+        labels = _igraph_labels(projection, algorithm, max_iterations, seed)
+
+    _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.argsort(np.argsort(first))[inverse]
+    members = np.argsort(rank, kind='stable')
+    bounds = np.cumsum(np.bincount(rank))[:-1]
+
+    return [
+        [projection.uuids[i] for i in cluster.tolist()] for cluster in np.split(members, bounds)
+    ]
@@ -1,134 +1,184 @@
 import asyncio
 import logging
+import multiprocessing
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, Field
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
-from graphiti_core.helpers import semaphore_gather
+from graphiti_core.helpers import parse_db_date, semaphore_gather, to_embedding
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.models.nodes.node_db_queries import COMMUNITY_NODE_RETURN
 from graphiti_core.nodes import CommunityNode, EntityNode, get_community_node_from_record
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.summarize_nodes import Summary, SummaryDescription
+from graphiti_core.utils.bulk_utils import add_communities_bulk
 from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.maintenance.community_detection import (
+    CommunityAlgorithm,
+    GraphProjection,
+    Neighbor,
+    detect_communities,
+)
+from graphiti_core.utils.maintenance.community_summaries import CommunitySummarizer
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
 
-MAX_COMMUNITY_BUILD_CONCURRENCY = 10
+COMMUNITY_PROJECTION_PAGE_SIZE = 10000
+# Opt-in: worker processes are spawned, which re-imports the caller's __main__ module
+COMMUNITY_DETECTION_WORKERS = int(os.getenv('COMMUNITY_DETECTION_WORKERS', 1))
+# Smaller projections are clustered inline, where a worker round trip would cost more
+COMMUNITY_PROCESS_POOL_MIN_EDGES = int(os.getenv('COMMUNITY_PROCESS_POOL_MIN_EDGES', 100_000))
+# Jaccard distance between old and new membership above which a community is re-summarized
+COMMUNITY_RESUMMARIZE_THRESHOLD = float(os.getenv('COMMUNITY_RESUMMARIZE_THRESHOLD', 0.2))
 
 logger = logging.getLogger(__name__)
 
 
-class Neighbor(BaseModel):
-    node_uuid: str
-    edge_count: int
-
-
-async def get_community_clusters(
-    driver: GraphDriver, group_ids: list[str] | None
-) -> list[list[EntityNode]]:
-    community_clusters: list[list[EntityNode]] = []
-
-    if group_ids is None:
-        group_id_values, _, _ = await driver.execute_query(
-            """
-            MATCH (n:Entity)
-            WHERE n.group_id IS NOT NULL
-            RETURN
-                collect(DISTINCT n.group_id) AS group_ids
-            """
-        )
+async def get_group_projection(
+    driver: GraphDriver,
+    group_id: str,
+    nodes: list[EntityNode],
+    page_size: int = COMMUNITY_PROJECTION_PAGE_SIZE,
+) -> GraphProjection:
+    """
+    Project the RELATES_TO edges between `nodes` (the entities of `group_id`) with one
+    aggregate query per `page_size` source entities.
+    """
+    uuids = [node.uuid for node in nodes]
+    index = {uuid: i for i, uuid in enumerate(uuids)}
 
-        group_ids = group_id_values[0]['group_ids'] if group_id_values else []
+    match_query = """
+        MATCH (n:Entity)-[e:RELATES_TO]-(m:Entity {group_id: $group_id})
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity {group_id: $group_id})
+        """
+    query = (
+        match_query
+        + """
+        WHERE n.uuid IN $uuids
+        WITH n.uuid AS src, m.uuid AS dst, count(e) AS weight
+        RETURN src, dst, weight
+        """
+    )
 
-    for group_id in group_ids:
-        projection: dict[str, list[Neighbor]] = {}
-        nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
-            match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[e:RELATES_TO]-(m: Entity {group_id: $group_id})
-            """
-            if driver.provider == GraphProvider.KUZU:
-                match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m: Entity {group_id: $group_id})
-                """
-            records, _, _ = await driver.execute_query(
-                match_query
-                + """
-                WITH count(e) AS count, m.uuid AS uuid
-                RETURN
-                    uuid,
-                    count
-                """,
-                uuid=node.uuid,
+    pages = await semaphore_gather(
+        *[
+            driver.execute_query_columns(
+                query,
+                uuids=uuids[i : i + page_size],
                 group_id=group_id,
+                routing_='r',
             )
+            for i in range(0, len(uuids), page_size)
+        ]
+    )
 
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
+    src_idx: list[int] = []
+    dst_idx: list[int] = []
+    weight: list[int] = []
+    for page in pages:
+        for src, dst, count in zip(
+            page.get('src', []), page.get('dst', []), page.get('weight', []), strict=True
+        ):
+            # Skip neighbors created after the entities were listed
+            if dst not in index:
+                continue
+            src_idx.append(index[src])
+            dst_idx.append(index[dst])
+            weight.append(count)
+
+    return GraphProjection(
+        uuids=uuids,
+        src_idx=np.array(src_idx, dtype=np.int64),
+        dst_idx=np.array(dst_idx, dtype=np.int64),
+        weight=np.array(weight, dtype=np.int64),
+    )
 
-        cluster_uuids = label_propagation(projection)
 
-        community_clusters.extend(
-            list(
-                await semaphore_gather(
-                    *[EntityNode.get_by_uuids(driver, cluster) for cluster in cluster_uuids]
-                )
-            )
+async def get_group_entities(
+    driver: GraphDriver, group_id: str, page_size: int = COMMUNITY_PROJECTION_PAGE_SIZE
+) -> list[EntityNode]:
+    nodes: list[EntityNode] = []
+    uuid_cursor: str | None = None
+    while True:
+        page = await EntityNode.get_by_group_ids(
+            driver, [group_id], limit=page_size, uuid_cursor=uuid_cursor
         )
+        nodes.extend(page)
+        if len(page) < page_size:
+            return nodes
+        uuid_cursor = page[-1].uuid
 
-    return community_clusters
 
+async def get_entity_group_ids(driver: GraphDriver) -> list[str]:
+    group_id_values, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity)
+        WHERE n.group_id IS NOT NULL
+        RETURN
+            collect(DISTINCT n.group_id) AS group_ids
+        """
+    )
 
-def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
-    # Implement the label propagation community detection algorithm.
-    # 1. Start with each node being assigned its own community
-    # 2. Each node will take on the community of the plurality of its neighbors
-    # 3. Ties are broken by going to the largest community
-    # 4. Continue until no communities change during propagation
-
-    community_map = {uuid: i for i, uuid in enumerate(projection.keys())}
-
-    while True:
-        no_change = True
-        new_community_map: dict[str, int] = {}
+    return group_id_values[0]['group_ids'] if group_id_values else []
 
-        for uuid, neighbors in projection.items():
-            curr_community = community_map[uuid]
 
-            community_candidates: dict[int, int] = defaultdict(int)
-            for neighbor in neighbors:
-                community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
-            community_lst = [
-                (count, community) for community, count in community_candidates.items()
-            ]
+async def get_community_clusters(
+    driver: GraphDriver, group_ids: list[str] | None
+) -> list[list[EntityNode]]:
+    community_clusters: list[list[EntityNode]] = []
 
-            community_lst.sort(reverse=True)
-            candidate_rank, community_candidate = community_lst[0] if community_lst else (0, -1)
-            if community_candidate != -1 and candidate_rank > 1:
-                new_community = community_candidate
+    if group_ids is None:
+        group_ids = await get_entity_group_ids(driver)
+
+    # Groups are independent, so large ones are clustered in worker processes while the next
+    # group is being projected
+    loop = asyncio.get_running_loop()
+    executor: ProcessPoolExecutor | None = None
+    workers = min(COMMUNITY_DETECTION_WORKERS, len(group_ids))
+    pending: list[tuple[list[EntityNode], asyncio.Future[list[list[str]]]]] = []
+    try:
+        for group_id in group_ids:
+            nodes = await get_group_entities(driver, group_id)
+            projection = await get_group_projection(driver, group_id, nodes)
+
+            future: asyncio.Future[list[list[str]]]
+            if workers > 1 and len(projection.src_idx) >= COMMUNITY_PROCESS_POOL_MIN_EDGES:
+                if executor is None:
+                    executor = ProcessPoolExecutor(
+                        workers, mp_context=multiprocessing.get_context('spawn')
+                    )
+                future = asyncio.wrap_future(executor.submit(detect_communities, projection))
             else:
-                new_community = max(community_candidate, curr_community)
-
-            new_community_map[uuid] = new_community
-
-            if new_community != curr_community:
-                no_change = False
-
-        if no_change:
-            break
+                future = loop.create_future()
+                future.set_result(detect_communities(projection))
+            pending.append((nodes, future))
+
+        for nodes, future in pending:
+            cluster_uuids = await future
+            nodes_by_uuid = {node.uuid: node for node in nodes}
+            community_clusters.extend(
+                [[nodes_by_uuid[uuid] for uuid in cluster] for cluster in cluster_uuids]
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        community_map = new_community_map
+    return community_clusters
 
-    community_cluster_map = defaultdict(list)
-    for uuid, community in community_map.items():
-        community_cluster_map[community].append(uuid)
 
-    clusters = [cluster for cluster in community_cluster_map.values()]
-    return clusters
+def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
+    return detect_communities(
+        GraphProjection.from_neighbors(projection), CommunityAlgorithm.label_propagation
+    )
 
 
 async def summarize_pair(
@@ -168,34 +218,18 @@ async def generate_summary_description(
 
 
 async def build_community(
-    llm_client: LLMClient, community_cluster: list[EntityNode], ensure_ascii: bool = True
+    llm_client: LLMClient,
+    community_cluster: list[EntityNode],
+    ensure_ascii: bool = True,
+    summarizer: CommunitySummarizer | None = None,
 ) -> tuple[CommunityNode, list[CommunityEdge]]:
-    summaries = [entity.summary for entity in community_cluster]
-    length = len(summaries)
-    while length > 1:
-        odd_one_out: str | None = None
-        if length % 2 == 1:
-            odd_one_out = summaries.pop()
-            length -= 1
-        new_summaries: list[str] = list(
-            await semaphore_gather(
-                *[
-                    summarize_pair(
-                        llm_client, (str(left_summary), str(right_summary)), ensure_ascii
-                    )
-                    for left_summary, right_summary in zip(
-                        summaries[: int(length / 2)], summaries[int(length / 2) :], strict=False
-                    )
-                ]
-            )
-        )
-        if odd_one_out is not None:
-            new_summaries.append(odd_one_out)
-        summaries = new_summaries
-        length = len(summaries)
+    if summarizer is None:
+        summarizer = CommunitySummarizer(llm_client, ensure_ascii)
 
-    summary = summaries[0]
-    name = await generate_summary_description(llm_client, summary, ensure_ascii)
+    summary = await summarizer.summarize(
+        [(entity.uuid, entity.summary) for entity in community_cluster]
+    )
+    name = await summarizer.describe(summary)
     now = utc_now()
     community_node = CommunityNode(
         name=name,
@@ -203,6 +237,7 @@ async def build_community(
         labels=['Community'],
         created_at=now,
         summary=summary,
+        built_at=now,
     )
     community_edges = build_community_edges(community_cluster, community_node, now)
 
@@ -219,15 +254,14 @@ async def build_communities(
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
     community_clusters = await get_community_clusters(driver, group_ids)
 
-    semaphore = asyncio.Semaphore(MAX_COMMUNITY_BUILD_CONCURRENCY)
-
-    async def limited_build_community(cluster):
-        async with semaphore:
-            return await build_community(llm_client, cluster, ensure_ascii)
-
+    # Clusters are summarized concurrently within the summarizer's shared LLM budget
+    summarizer = CommunitySummarizer(llm_client, ensure_ascii)
     communities: list[tuple[CommunityNode, list[CommunityEdge]]] = list(
-        await semaphore_gather(
-            *[limited_build_community(cluster) for cluster in community_clusters]
+        await asyncio.gather(
+            *[
+                build_community(llm_client, cluster, ensure_ascii, summarizer)
+                for cluster in community_clusters
+            ]
         )
     )
 
@@ -240,101 +274,403 @@ async def build_communities(
     return community_nodes, community_edges
 
 
-async def remove_communities(driver: GraphDriver):
-    await driver.execute_query(
-        """
-        MATCH (c:Community)
-        DETACH DELETE c
-        """
+class CommunityRefresh(BaseModel):
+    community_nodes: list[CommunityNode] = Field(
+        default_factory=list,
+        description='Communities to save; new or re-summarized ones have no name embedding yet',
+    )
+    community_edges: list[CommunityEdge] = Field(
+        default_factory=list, description='Membership edges of every kept community'
     )
+    rewired_community_uuids: list[str] = Field(
+        default_factory=list, description='Existing communities whose memberships are replaced'
+    )
+    removed_community_uuids: list[str] = Field(default_factory=list)
 
 
-async def determine_entity_community(
-    driver: GraphDriver, entity: EntityNode
-) -> tuple[CommunityNode | None, bool]:
-    # Check if the node is already part of a community
+async def get_group_communities(
+    driver: GraphDriver, group_id: str
+) -> tuple[list[CommunityNode], dict[str, list[str]], datetime | None]:
+    """
+    Return the communities of a group, their member uuids and when the group's communities
+    were last built or refreshed.
+    """
     records, _, _ = await driver.execute_query(
         """
-        MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity {uuid: $entity_uuid})
+        MATCH (c:Community {group_id: $group_id})
         RETURN
         """
         + COMMUNITY_NODE_RETURN,
-        entity_uuid=entity.uuid,
+        group_id=group_id,
+        routing_='r',
     )
+    communities = [get_community_node_from_record(record) for record in records]
 
-    if len(records) > 0:
-        return get_community_node_from_record(records[0]), False
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (c:Community {group_id: $group_id})-[e:HAS_MEMBER]->(n:Entity)
+        RETURN c.uuid AS community_uuid, collect(n.uuid) AS members, max(e.created_at) AS joined_at
+        """,
+        group_id=group_id,
+        routing_='r',
+    )
+    members = {record['community_uuid']: record['members'] for record in records}
+
+    # Membership edges are also written when new entities are folded into a community, so they
+    # only stand in for the build time of communities saved before built_at existed
+    built_at = max((c.built_at for c in communities if c.built_at is not None), default=None)
+    if built_at is None:
+        joined_at = [parse_db_date(record['joined_at']) for record in records]
+        built_at = max((date for date in joined_at if date), default=None)
+
+    return communities, members, built_at
 
-    # If the node has no community, add it to the mode community of surrounding entities
+
+async def get_changed_entities(driver: GraphDriver, group_id: str, since: datetime) -> set[str]:
+    """Entities created, or with RELATES_TO edges created, after `since`."""
     match_query = """
-        MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(n:Entity {uuid: $entity_uuid})
+        MATCH (n:Entity {group_id: $group_id})-[e:RELATES_TO]-(m:Entity)
     """
     if driver.provider == GraphProvider.KUZU:
         match_query = """
-            MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(n:Entity {uuid: $entity_uuid})
+        MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
         """
-    records, _, _ = await driver.execute_query(
+    edge_columns = await driver.execute_query_columns(
         match_query
         + """
-        RETURN
+        WHERE e.created_at > $since
+        RETURN DISTINCT n.uuid AS uuid
+        """,
+        group_id=group_id,
+        since=since,
+        routing_='r',
+    )
+    node_columns = await driver.execute_query_columns(
         """
-        + COMMUNITY_NODE_RETURN,
-        entity_uuid=entity.uuid,
+        MATCH (n:Entity {group_id: $group_id})
+        WHERE n.created_at > $since
+        RETURN n.uuid AS uuid
+        """,
+        group_id=group_id,
+        since=since,
+        routing_='r',
     )
 
-    communities: list[CommunityNode] = [
-        get_community_node_from_record(record) for record in records
-    ]
+    return set(edge_columns.get('uuid', [])) | set(node_columns.get('uuid', []))
 
-    community_map: dict[str, int] = defaultdict(int)
-    for community in communities:
-        community_map[community.uuid] += 1
 
-    community_uuid = None
-    max_count = 0
-    for uuid, count in community_map.items():
-        if count > max_count:
-            community_uuid = uuid
-            max_count = count
+def induced_projection(projection: GraphProjection, uuids: set[str]) -> GraphProjection:
+    keep = np.array([uuid in uuids for uuid in projection.uuids], dtype=bool)
+    new_index = np.cumsum(keep) - 1
+    mask = keep[projection.src_idx] & keep[projection.dst_idx]
+    return GraphProjection(
+        uuids=[uuid for uuid in projection.uuids if uuid in uuids],
+        src_idx=new_index[projection.src_idx[mask]],
+        dst_idx=new_index[projection.dst_idx[mask]],
+        weight=projection.weight[mask],
+    )
 
-    if max_count == 0:
-        return None, False
 
-    for community in communities:
-        if community.uuid == community_uuid:
-            return community, True
+async def refresh_group_communities(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    group_id: str,
+    resummarize_threshold: float = COMMUNITY_RESUMMARIZE_THRESHOLD,
+    ensure_ascii: bool = True,
+) -> CommunityRefresh:
+    """
+    Bring the communities of a group up to date with the entities and edges added since they
+    were last built.
+
+    Only the changed entities, their neighbors and the other members of their communities are
+    re-clustered. Each new cluster takes over the existing community it overlaps most; if the
+    membership changed by at most `resummarize_threshold` (Jaccard distance) the community
+    keeps its summary, otherwise it is re-summarized under the same uuid. Communities left
+    without a cluster are removed.
+    """
+    nodes = await get_group_entities(driver, group_id)
+    communities, members, built_at = await get_group_communities(driver, group_id)
+    nodes_by_uuid = {node.uuid: node for node in nodes}
+    projection = await get_group_projection(driver, group_id, nodes)
+
+    community_of = {
+        uuid: community_uuid
+        for community_uuid, community_members in members.items()
+        for uuid in community_members
+    }
+    changed = {uuid for uuid in nodes_by_uuid if uuid not in community_of}
+    if built_at is not None:
+        changed |= await get_changed_entities(driver, group_id, built_at)
+    changed &= nodes_by_uuid.keys()
+    if not changed:
+        return CommunityRefresh()
+
+    # Expand the changed entities to their neighbors, then to whole communities
+    index = {uuid: i for i, uuid in enumerate(projection.uuids)}
+    changed_idx = np.array([index[uuid] for uuid in changed], dtype=np.int64)
+    neighbor_idx = projection.dst_idx[np.isin(projection.src_idx, changed_idx)]
+    affected = changed | {projection.uuids[i] for i in neighbor_idx.tolist()}
+    touched = {community_of[uuid] for uuid in affected if uuid in community_of}
+    for community_uuid in touched:
+        affected.update(uuid for uuid in members[community_uuid] if uuid in nodes_by_uuid)
+
+    clusters = detect_communities(induced_projection(projection, affected))
+
+    # Greedily pair clusters with the touched communities they overlap most
+    overlap_counts: dict[tuple[int, str], int] = defaultdict(int)
+    for i, cluster in enumerate(clusters):
+        for uuid in cluster:
+            if uuid in community_of:
+                overlap_counts[(i, community_of[uuid])] += 1
+    matches: dict[int, str] = {}
+    matched: set[str] = set()
+    for _, i, community_uuid in sorted(
+        ((count, i, community_uuid) for (i, community_uuid), count in overlap_counts.items()),
+        reverse=True,
+    ):
+        if i not in matches and community_uuid not in matched:
+            matches[i] = community_uuid
+            matched.add(community_uuid)
+
+    communities_by_uuid = {community.uuid: community for community in communities}
+    refresh = CommunityRefresh(
+        rewired_community_uuids=list(matched),
+        removed_community_uuids=[uuid for uuid in touched if uuid not in matched],
+    )
+    to_build: list[tuple[list[EntityNode], str | None]] = []
+    now = utc_now()
+    for i, cluster in enumerate(clusters):
+        cluster_nodes = [nodes_by_uuid[uuid] for uuid in cluster]
+        community_uuid = matches.get(i)
+        if community_uuid is not None:
+            previous = set(members[community_uuid])
+            distance = 1 - len(previous & set(cluster)) / len(previous | set(cluster))
+            community = communities_by_uuid.get(community_uuid)
+            if community is not None and distance <= resummarize_threshold:
+                community.built_at = now
+                refresh.community_nodes.append(community)
+                refresh.community_edges.extend(build_community_edges(cluster_nodes, community, now))
+                continue
+        to_build.append((cluster_nodes, community_uuid))
+
+    summarizer = CommunitySummarizer(llm_client, ensure_ascii)
+
+    async def rebuild_community(cluster_nodes: list[EntityNode], uuid: str | None):
+        community, edges = await build_community(
+            llm_client, cluster_nodes, ensure_ascii, summarizer
+        )
+        if uuid is not None:
+            community.uuid = uuid
+            for edge in edges:
+                edge.source_node_uuid = uuid
+        return community, edges
+
+    for community, edges in await asyncio.gather(
+        *[rebuild_community(cluster_nodes, uuid) for cluster_nodes, uuid in to_build]
+    ):
+        refresh.community_nodes.append(community)
+        refresh.community_edges.extend(edges)
+
+    logger.debug(
+        f'Refreshed communities of {group_id}: {len(changed)} changed entities, '
+        f'{len(refresh.community_nodes)} summarized, {len(refresh.removed_community_uuids)} removed'
+    )
 
-    return None, False
+    return refresh
 
 
-async def update_community(
+async def refresh_communities(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    group_ids: list[str] | None,
+    resummarize_threshold: float = COMMUNITY_RESUMMARIZE_THRESHOLD,
+    ensure_ascii: bool = True,
+) -> CommunityRefresh:
+    if group_ids is None:
+        group_ids = await get_entity_group_ids(driver)
+
+    refresh = CommunityRefresh()
+    for group_id in group_ids:
+        group_refresh = await refresh_group_communities(
+            driver, llm_client, group_id, resummarize_threshold, ensure_ascii
+        )
+        refresh.community_nodes.extend(group_refresh.community_nodes)
+        refresh.community_edges.extend(group_refresh.community_edges)
+        refresh.rewired_community_uuids.extend(group_refresh.rewired_community_uuids)
+        refresh.removed_community_uuids.extend(group_refresh.removed_community_uuids)
+
+    return refresh
+
+
+async def remove_community_members(driver: GraphDriver, community_uuids: list[str]):
+    await driver.execute_query(
+        """
+        MATCH (c:Community)-[e:HAS_MEMBER]->(n)
+        WHERE c.uuid IN $community_uuids
+        DELETE e
+        """,
+        community_uuids=community_uuids,
+    )
+
+
+async def remove_communities(driver: GraphDriver):
+    await driver.execute_query(
+        """
+        MATCH (c:Community)
+        DETACH DELETE c
+        """
+    )
+
+
+async def determine_entity_communities(
+    driver: GraphDriver, entities: list[EntityNode]
+) -> dict[str, tuple[CommunityNode, bool]]:
+    """
+    Resolve the community of each entity with one membership query. An entity already in a
+    community keeps it; otherwise it joins the community most of its neighbors belong to, and
+    the flag is True because the membership edge still has to be created. Entities without a
+    community in reach are left out.
+    """
+    if not entities:
+        return {}
+
+    neighbor_match = """
+        MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(n:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        neighbor_match = """
+        MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(n:Entity)
+        """
+    columns = await driver.execute_query_columns(
+        """
+        MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity)
+        WHERE n.uuid IN $entity_uuids
+        RETURN n.uuid AS entity_uuid, c.uuid AS community_uuid, true AS is_member
+        UNION ALL
+        """
+        + neighbor_match
+        + """
+        WHERE n.uuid IN $entity_uuids
+        RETURN n.uuid AS entity_uuid, c.uuid AS community_uuid, false AS is_member
+        """,
+        entity_uuids=[entity.uuid for entity in entities],
+        routing_='r',
+    )
+
+    members: dict[str, str] = {}
+    neighbor_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for entity_uuid, community_uuid, is_member in zip(
+        columns.get('entity_uuid', []),
+        columns.get('community_uuid', []),
+        columns.get('is_member', []),
+        strict=True,
+    ):
+        if is_member:
+            members.setdefault(entity_uuid, community_uuid)
+        else:
+            neighbor_counts[entity_uuid][community_uuid] += 1
+
+    resolved: dict[str, tuple[str, bool]] = {}
+    for entity in entities:
+        if entity.uuid in members:
+            resolved[entity.uuid] = (members[entity.uuid], False)
+        elif entity.uuid in neighbor_counts:
+            # The first community with the most neighbors, like max() over the counts
+            counts = neighbor_counts[entity.uuid]
+            resolved[entity.uuid] = (max(counts, key=lambda uuid: counts[uuid]), True)
+
+    if not resolved:
+        return {}
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (c:Community)
+        WHERE c.uuid IN $uuids
+        RETURN
+        """
+        + COMMUNITY_NODE_RETURN,
+        uuids=list({community_uuid for community_uuid, _ in resolved.values()}),
+        routing_='r',
+    )
+    communities = {record['uuid']: get_community_node_from_record(record) for record in records}
+
+    return {
+        entity_uuid: (communities[community_uuid], is_new)
+        for entity_uuid, (community_uuid, is_new) in resolved.items()
+        if community_uuid in communities
+    }
+
+
+async def determine_entity_community(
+    driver: GraphDriver, entity: EntityNode
+) -> tuple[CommunityNode | None, bool]:
+    return (await determine_entity_communities(driver, [entity])).get(entity.uuid, (None, False))
+
+
+async def update_entity_communities(
     driver: GraphDriver,
     llm_client: LLMClient,
     embedder: EmbedderClient,
-    entity: EntityNode,
+    entities: list[EntityNode],
     ensure_ascii: bool = True,
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
-    community, is_new = await determine_entity_community(driver, entity)
-
-    if community is None:
+    """
+    Fold new entities into their communities. Each affected community is summarized, named
+    and embedded once for all of its new members, and every community and new membership edge
+    is written in a single transaction.
+    """
+    memberships = await determine_entity_communities(driver, entities)
+
+    communities: dict[str, CommunityNode] = {}
+    community_members: dict[str, list[EntityNode]] = defaultdict(list)
+    new_members: dict[str, list[EntityNode]] = defaultdict(list)
+    for entity in entities:
+        if entity.uuid not in memberships:
+            continue
+        community, is_new = memberships[entity.uuid]
+        community = communities.setdefault(community.uuid, community)
+        community_members[community.uuid].append(entity)
+        if is_new:
+            new_members[community.uuid].append(entity)
+
+    if not communities:
         return [], []
 
-    new_summary = await summarize_pair(
-        llm_client, (entity.summary, community.summary), ensure_ascii
+    summarizer = CommunitySummarizer(llm_client, ensure_ascii)
+
+    async def fold_community(community: CommunityNode):
+        community.summary = await summarizer.summarize(
+            [(community.uuid, community.summary)]
+            + [(entity.uuid, entity.summary) for entity in community_members[community.uuid]]
+        )
+        community.name = await summarizer.describe(community.summary)
+
+    community_nodes = list(communities.values())
+    await asyncio.gather(*[fold_community(community) for community in community_nodes])
+
+    name_embeddings = await embedder.create_batch(
+        [community.name.replace('\n', ' ') for community in community_nodes]
     )
-    new_name = await generate_summary_description(llm_client, new_summary, ensure_ascii)
+    for community, name_embedding in zip(community_nodes, name_embeddings, strict=True):
+        community.name_embedding = to_embedding(name_embedding)
 
-    community.summary = new_summary
-    community.name = new_name
+    now = utc_now()
+    community_edges = [
+        edge
+        for community_uuid, members in new_members.items()
+        for edge in build_community_edges(members, communities[community_uuid], now)
+    ]
 
-    community_edges = []
-    if is_new:
-        community_edge = (build_community_edges([entity], community, utc_now()))[0]
-        await community_edge.save(driver)
-        community_edges.append(community_edge)
+    await add_communities_bulk(driver, community_nodes, community_edges)
 
-    await community.generate_name_embedding(embedder)
+    return community_nodes, community_edges
 
-    await community.save(driver)
 
-    return [community], community_edges
+async def update_community(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    embedder: EmbedderClient,
+    entity: EntityNode,
+    ensure_ascii: bool = True,
+) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+    return await update_entity_communities(driver, llm_client, embedder, [entity], ensure_ascii)
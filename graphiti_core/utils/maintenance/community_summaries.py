@@ -0,0 +1,203 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+from diskcache import Cache
+
+from graphiti_core.embedder.batching import estimate_tokens
+from graphiti_core.helpers import SEMAPHORE_LIMIT, semaphore_gather
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.prompts import prompt_library
+from graphiti_core.prompts.summarize_nodes import Summary, SummaryDescription
+
+logger = logging.getLogger(__name__)
+
+COMMUNITY_SUMMARY_MAX_TOKENS = int(os.getenv('COMMUNITY_SUMMARY_MAX_TOKENS', 8000))
+COMMUNITY_SUMMARY_MAX_FAN_IN = int(os.getenv('COMMUNITY_SUMMARY_MAX_FAN_IN', 16))
+COMMUNITY_SUMMARY_CONCURRENCY = int(os.getenv('COMMUNITY_SUMMARY_CONCURRENCY', SEMAPHORE_LIMIT))
+COMMUNITY_SUMMARY_CACHE_SIZE = int(os.getenv('COMMUNITY_SUMMARY_CACHE_SIZE', 10000))
+COMMUNITY_SUMMARY_CACHE_DIR = os.getenv('COMMUNITY_SUMMARY_CACHE_DIR') or None
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha1('\x1f'.join(parts).encode()).hexdigest()
+
+
+class SummaryCache:
+    """
+    Summaries keyed by the hash of the member summaries they cover. Kept in an in-memory LRU
+    of `maxsize` entries, or in a diskcache at `directory` so they outlive the process.
+    """
+
+    def __init__(self, maxsize: int = COMMUNITY_SUMMARY_CACHE_SIZE, directory: str | None = None):
+        self.maxsize = maxsize
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._disk = Cache(directory) if directory else None
+
+    def get(self, key: str) -> str | None:
+        if self._disk is not None:
+            value = self._disk.get(key)
+            return value if isinstance(value, str) else None
+
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str):
+        if self._disk is not None:
+            self._disk.set(key, value)
+            return
+
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+_default_cache: SummaryCache | None = None
+
+
+def get_default_summary_cache() -> SummaryCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SummaryCache(directory=COMMUNITY_SUMMARY_CACHE_DIR)
+    return _default_cache
+
+
+class CommunitySummarizer:
+    """
+    Map-reduce summarization of community members.
+
+    Member summaries are packed into as few LLM calls as `max_tokens` and `max_fan_in` allow,
+    and the results are reduced the same way until one summary remains, so a cluster of N
+    members takes about N / k calls instead of N - 1 pairwise ones. Groups end at members whose
+    uuid hashes to a boundary, so adding or removing a member only changes the groups around
+    it; every intermediate summary is cached under the hash of the member summaries it covers
+    and reused on the next build. One summarizer is meant to be shared
+    across clusters: all of its LLM calls draw from the same `concurrency` budget.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        ensure_ascii: bool = True,
+        max_tokens: int = COMMUNITY_SUMMARY_MAX_TOKENS,
+        max_fan_in: int = COMMUNITY_SUMMARY_MAX_FAN_IN,
+        concurrency: int = COMMUNITY_SUMMARY_CONCURRENCY,
+        cache: SummaryCache | None = None,
+    ):
+        self.llm_client = llm_client
+        self.ensure_ascii = ensure_ascii
+        self.max_tokens = max_tokens
+        self.max_fan_in = max(max_fan_in, 2)
+        self.cache = cache if cache is not None else get_default_summary_cache()
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.llm_calls = 0
+
+    async def summarize(self, members: list[tuple[str, str]]) -> str:
+        """Reduce (uuid, summary) pairs to one summary."""
+        if not members:
+            return ''
+
+        # Leaves are ordered by uuid, and their keys start with the uuid hash, so group
+        # boundaries only depend on which members are present
+        items = [
+            (_digest(uuid) + _digest(summary), summary)
+            for uuid, summary in sorted(members, key=lambda member: member[0])
+        ]
+        while len(items) > 1:
+            items = list(
+                await semaphore_gather(*[self._reduce(group) for group in self.pack(items)])
+            )
+
+        return items[0][1]
+
+    async def describe(self, summary: str) -> str:
+        key = _digest('description', summary)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        context = {'summary': summary, 'ensure_ascii': self.ensure_ascii}
+        async with self.semaphore:
+            self.llm_calls += 1
+            llm_response = await self.llm_client.generate_response(
+                prompt_library.summarize_nodes.summary_description(context),
+                response_model=SummaryDescription,
+            )
+
+        description = llm_response.get('description', '')
+        self.cache.set(key, description)
+        return description
+
+    def pack(self, items: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+        """
+        Split items into groups that fit the token budget and fan-in, with at least two items
+        per group so every level makes progress; only a trailing item can be left alone. A group
+        also ends after an item whose key hashes to a boundary, on average every max_fan_in / 2
+        items.
+        """
+        boundary = max(self.max_fan_in // 2, 2)
+        groups: list[list[tuple[str, str]]] = []
+        group: list[tuple[str, str]] = []
+        tokens = 0
+        for key, summary in items:
+            item_tokens = estimate_tokens(summary)
+            if len(group) >= 2 and (
+                tokens + item_tokens > self.max_tokens or len(group) >= self.max_fan_in
+            ):
+                groups.append(group)
+                group, tokens = [], 0
+
+            group.append((key, summary))
+            tokens += item_tokens
+            if len(group) >= 2 and int(key[:8], 16) % boundary == 0:
+                groups.append(group)
+                group, tokens = [], 0
+
+        if group:
+            groups.append(group)
+        return groups
+
+    async def _reduce(self, group: list[tuple[str, str]]) -> tuple[str, str]:
+        if len(group) == 1:
+            return group[0]
+
+        key = _digest(*(key for key, _ in group))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return key, cached
+
+        context = {
+            'node_summaries': [{'summary': summary} for _, summary in group],
+            'ensure_ascii': self.ensure_ascii,
+        }
+        async with self.semaphore:
+            self.llm_calls += 1
+            llm_response = await self.llm_client.generate_response(
+                prompt_library.summarize_nodes.summarize_summaries(context),
+                response_model=Summary,
+            )
+
+        summary = llm_response.get('summary', '')
+        self.cache.set(key, summary)
+        return key, summary
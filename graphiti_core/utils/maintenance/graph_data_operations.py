@@ -15,12 +15,27 @@ limitations under the License.
 """
 
 import logging
+import os
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 
+from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver, GraphProvider
-from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.driver.driver import (
+    COMMUNITY_INDEX_NAME,
+    ENTITY_EDGE_INDEX_NAME,
+    ENTITY_INDEX_NAME,
+    EPISODE_INDEX_NAME,
+    GraphDriver,
+    GraphProvider,
+)
+from graphiti_core.graph_queries import (
+    get_fulltext_indices,
+    get_range_indices,
+    get_vector_indices,
+)
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.models.nodes.node_db_queries import (
     EPISODIC_NODE_RETURN,
@@ -29,6 +44,7 @@ from graphiti_core.models.nodes.node_db_queries import (
 from graphiti_core.nodes import EpisodeType, EpisodicNode, get_episodic_node_from_record
 
 EPISODE_WINDOW_LEN = 3
+DELETE_BATCH_SIZE = int(os.getenv('DELETE_BATCH_SIZE', 1000))
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +77,14 @@ async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bo
         fulltext_indices: list[LiteralString] = get_fulltext_indices(driver.provider)
 
     if driver.provider == GraphProvider.KUZU:
-        # Skip creating fulltext indices if they already exist. Need to do this manually
-        # until Kuzu supports `IF NOT EXISTS` for indices.
+        # Skip creating fulltext indices that already exist. Need to do this manually
+        # until Kuzu supports `IF NOT EXISTS` for indices. Vector indexes are listed here
+        # too, so match on the index name rather than skipping whenever any index exists.
         result, _, _ = await driver.execute_query('CALL SHOW_INDEXES() RETURN *;')
-        if len(result) > 0:
-            fulltext_indices = []
+        existing = {f"'{record['index_name']}'" for record in result}
+        fulltext_indices = [
+            query for query in fulltext_indices if not any(name in query for name in existing)
+        ]
 
         # Only load the `fts` extension if it's not already loaded, otherwise throw an error.
         result, _, _ = await driver.execute_query('CALL SHOW_LOADED_EXTENSIONS() RETURN *;')
@@ -79,22 +98,33 @@ async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bo
             )
 
     index_queries: list[LiteralString] = range_indices + fulltext_indices
+    vector_indices = get_vector_indices(driver.provider, getattr(driver, 'embedding_dim', 0))
 
     await semaphore_gather(
         *[
             driver.execute_query(
                 query,
             )
-            for query in index_queries
+            for query in index_queries + vector_indices
         ]
     )
 
+    if driver.provider == GraphProvider.FALKORDB:
+        await driver.load_vector_indexes()  # pyright: ignore[reportAttributeAccessIssue]
+
 
 async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
     async with driver.session() as session:
 
         async def delete_all(tx):
-            await tx.run('MATCH (n) DETACH DELETE n')
+            if driver.provider == GraphProvider.KUZU:
+                # Leave the embedding mirror tables alone: deleting rows from a vector-indexed
+                # table corrupts the index, so it is rebuilt below instead
+                for label in ['Entity', 'Episodic', 'Community', 'RelatesToNode_']:
+                    await tx.run(f'MATCH (n:{label}) DETACH DELETE n')
+                await driver.rebuild_vector_indices()  # pyright: ignore[reportAttributeAccessIssue]
+            else:
+                await tx.run('MATCH (n) DETACH DELETE n')
             if driver.aoss_client:
                 await driver.clear_aoss_indices()
 
@@ -179,3 +209,285 @@ async def retrieve_episodes(
 
     episodes = [get_episodic_node_from_record(record) for record in result]
     return list(reversed(episodes))  # Return in chronological order
+
+
+class EpisodeRemoval(BaseModel):
+    episode_uuids: list[str] = Field(default_factory=list)
+    node_uuids: list[str] = Field(default_factory=list, description='orphaned entities')
+    edge_uuids: list[str] = Field(
+        default_factory=list, description='entity edges first extracted from the episodes'
+    )
+
+
+def _chunks(uuids: list[str], size: int) -> list[list[str]]:
+    return [uuids[i : i + size] for i in range(0, len(uuids), size)]
+
+
+def get_delete_queries(provider: GraphProvider, label: str) -> list[str]:
+    """
+    Statements deleting the `label` nodes, or RELATES_TO edges, whose uuids are in $uuids.
+    """
+    if label == 'RELATES_TO':
+        if provider == GraphProvider.KUZU:
+            return [
+                """
+                MATCH (e:RelatesToNode_)
+                WHERE e.uuid IN $uuids
+                DETACH DELETE e
+                """
+            ]
+        return [
+            """
+            MATCH (:Entity)-[e:RELATES_TO]->(:Entity)
+            WHERE e.uuid IN $uuids
+            DELETE e
+            """
+        ]
+
+    queries = []
+    if label == 'Entity' and provider == GraphProvider.KUZU:
+        # Entity edges are nodes in Kuzu, so they are removed before the entities they connect
+        queries.append(
+            """
+            MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)
+            WHERE n.uuid IN $uuids
+            WITH DISTINCT e
+            DETACH DELETE e
+            """
+        )
+    queries.append(
+        f"""
+        MATCH (n:{label})
+        WHERE n.uuid IN $uuids
+        DETACH DELETE n
+        """
+    )
+    return queries
+
+
+async def get_episode_orphans(
+    driver: GraphDriver, episodes: list[EpisodicNode]
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Find what would be left behind by removing `episodes`, in one query: the entities no other
+    episode mentions, and the entity edges first extracted from one of the episodes. Both are
+    returned as uuid -> group_id.
+    """
+    if not episodes:
+        return {}, {}
+
+    match driver.provider:
+        case GraphProvider.KUZU:
+            edge_match = """
+                MATCH (e:RelatesToNode_)
+                WHERE e.uuid IN $edge_uuids AND e.episodes[1] IN $episode_uuids
+            """
+        case GraphProvider.NEPTUNE:
+            edge_match = """
+                MATCH (:Entity)-[e:RELATES_TO]->(:Entity)
+                WHERE e.uuid IN $edge_uuids AND split(e.episodes, ',')[0] IN $episode_uuids
+            """
+        case _:
+            edge_match = """
+                MATCH (:Entity)-[e:RELATES_TO]->(:Entity)
+                WHERE e.uuid IN $edge_uuids AND e.episodes[0] IN $episode_uuids
+            """
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (ep:Episodic)-[:MENTIONS]->(n:Entity)
+        WHERE ep.uuid IN $episode_uuids
+        WITH DISTINCT n
+        OPTIONAL MATCH (other:Episodic)-[:MENTIONS]->(n)
+        WHERE NOT other.uuid IN $episode_uuids
+        WITH n, count(other) AS mentions
+        WHERE mentions = 0
+        RETURN 'node' AS kind, n.uuid AS uuid, n.group_id AS group_id
+        UNION ALL
+        """
+        + edge_match
+        + """
+        RETURN 'edge' AS kind, e.uuid AS uuid, e.group_id AS group_id
+        """,
+        episode_uuids=[episode.uuid for episode in episodes],
+        edge_uuids=list({uuid for episode in episodes for uuid in episode.entity_edges}),
+        routing_='r',
+    )
+
+    nodes: dict[str, str] = {}
+    edges: dict[str, str] = {}
+    for record in records:
+        orphans = nodes if record['kind'] == 'node' else edges
+        orphans[record['uuid']] = record['group_id']
+    return nodes, edges
+
+
+async def remove_episodes(
+    driver: GraphDriver, episode_uuids: list[str], batch_size: int = DELETE_BATCH_SIZE
+) -> EpisodeRemoval:
+    """
+    Remove episodes along with the entities only they mention and the entity edges they
+    introduced. Everything is deleted in one transaction of statements covering at most
+    `batch_size` uuids each, and removed from the OpenSearch indexes with bulk deletes.
+    Unknown uuids are ignored.
+    """
+    episodes = await EpisodicNode.get_by_uuids(driver, episode_uuids)
+    nodes, edges = await get_episode_orphans(driver, episodes)
+    removal = EpisodeRemoval(
+        episode_uuids=[episode.uuid for episode in episodes],
+        node_uuids=list(nodes),
+        edge_uuids=list(edges),
+    )
+    if not episodes:
+        return removal
+
+    # Deleting an entity also detaches its other edges, which have to leave the index too
+    detached: dict[str, str] = {}
+    if driver.aoss_client and removal.node_uuids:
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Entity)-[e:RELATES_TO]-(:Entity)
+            WHERE n.uuid IN $uuids
+            RETURN DISTINCT e.uuid AS uuid, e.group_id AS group_id
+            """,
+            uuids=removal.node_uuids,
+            routing_='r',
+        )
+        detached = {record['uuid']: record['group_id'] for record in records}
+
+    async def delete_all(tx):
+        for label, uuids in [
+            ('RELATES_TO', removal.edge_uuids),
+            ('Entity', removal.node_uuids),
+            ('Episodic', removal.episode_uuids),
+        ]:
+            for chunk in _chunks(uuids, batch_size):
+                for query in get_delete_queries(driver.provider, label):
+                    await tx.run(query, uuids=chunk)
+
+    async with driver.session() as session:
+        await session.execute_write(delete_all)
+
+    if driver.aoss_client:
+        documents: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for episode in episodes:
+            documents[(EPISODE_INDEX_NAME, episode.group_id)].append(episode.uuid)
+        for uuid, group_id in nodes.items():
+            documents[(ENTITY_INDEX_NAME, group_id)].append(uuid)
+        for uuid, group_id in (detached | edges).items():
+            documents[(ENTITY_EDGE_INDEX_NAME, group_id)].append(uuid)
+
+        await semaphore_gather(
+            *[
+                driver.delete_from_aoss([index_name], uuids, routing=group_id)
+                for (index_name, group_id), uuids in documents.items()
+            ]
+        )
+
+    logger.debug(
+        f'Removed {len(removal.episode_uuids)} episodes, {len(removal.node_uuids)} entities '
+        f'and {len(removal.edge_uuids)} entity edges'
+    )
+    return removal
+
+
+class GroupPurge(BaseModel):
+    group_id: str
+    entity_edges: int = Field(default=0, description='entity edges deleted so far')
+    communities: int = Field(default=0, description='communities deleted so far')
+    entities: int = Field(default=0, description='entities deleted so far')
+    episodes: int = Field(default=0, description='episodes deleted so far')
+    done: bool = False
+
+
+async def _run_delete_queries(tx, queries: list[str], uuids: list[str]):
+    for query in queries:
+        await tx.run(query, uuids=uuids)
+
+
+# Order in which a group is purged, with the GroupPurge counter of each label
+GROUP_PURGE_LABELS = [
+    ('RELATES_TO', 'entity_edges'),
+    ('Community', 'communities'),
+    ('Entity', 'entities'),
+    ('Episodic', 'episodes'),
+]
+
+
+async def purge_group(
+    driver: GraphDriver,
+    group_id: str,
+    batch_size: int = DELETE_BATCH_SIZE,
+    on_progress: Callable[[GroupPurge], Awaitable[None]] | None = None,
+) -> GroupPurge:
+    """
+    Delete everything in a group, `batch_size` objects per transaction. Entity edges go first
+    so deleting an entity never detaches an unbounded number of them, then communities,
+    entities and episodes. Every chunk is committed on its own, so an interrupted purge is
+    resumed by running it again. `on_progress` is awaited after each chunk.
+    """
+    purge = GroupPurge(group_id=group_id)
+
+    for label, counter in GROUP_PURGE_LABELS:
+        if label != 'RELATES_TO':
+            select_query = f"""
+                MATCH (n:{label})
+                WHERE n.group_id = $group_id
+                RETURN n.uuid AS uuid
+                LIMIT $limit
+            """
+        elif driver.provider == GraphProvider.KUZU:
+            select_query = """
+                MATCH (e:RelatesToNode_)
+                WHERE e.group_id = $group_id
+                RETURN e.uuid AS uuid
+                LIMIT $limit
+            """
+        else:
+            select_query = """
+                MATCH (:Entity)-[e:RELATES_TO]->(:Entity)
+                WHERE e.group_id = $group_id
+                RETURN e.uuid AS uuid
+                LIMIT $limit
+            """
+        delete_queries = get_delete_queries(driver.provider, label)
+
+        while True:
+            records, _, _ = await driver.execute_query(
+                select_query, group_id=group_id, limit=batch_size
+            )
+            uuids = [record['uuid'] for record in records]
+            if not uuids:
+                break
+
+            async with driver.session() as session:
+                await session.execute_write(_run_delete_queries, delete_queries, uuids)
+
+            setattr(purge, counter, getattr(purge, counter) + len(uuids))
+            logger.info(f'Purging group {group_id}: {purge.model_dump(exclude={"group_id"})}')
+            if on_progress is not None:
+                await on_progress(purge)
+
+    # Dropping the group's documents by query also catches ones left over from an interrupted
+    # run, whose graph objects are already gone
+    if driver.aoss_client:
+        await semaphore_gather(
+            *[
+                driver.aoss_client.delete_by_query(
+                    index=index_name,
+                    body={'query': {'term': {'group_id': group_id}}},
+                    params={'routing': group_id},
+                )
+                for index_name in (
+                    EPISODE_INDEX_NAME,
+                    ENTITY_INDEX_NAME,
+                    COMMUNITY_INDEX_NAME,
+                    ENTITY_EDGE_INDEX_NAME,
+                )
+            ]
+        )
+
+    purge.done = True
+    if on_progress is not None:
+        await on_progress(purge)
+    return purge
@@ -65,6 +65,7 @@ load_dotenv()
 DEFAULT_LLM_MODEL = 'gpt-4.1-mini'
 SMALL_LLM_MODEL = 'gpt-4.1-nano'
 DEFAULT_EMBEDDER_MODEL = 'text-embedding-3-small'
+DEFAULT_ONNX_EMBEDDER_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
 
 # Semaphore limit for concurrent Graphiti operations.
 # Decrease this if you're experiencing 429 rate limit errors from your LLM provider.
@@ -378,12 +379,16 @@ class GraphitiEmbedderConfig(BaseModel):
     Centralizes all embedding-related configuration parameters.
     """
 
+    provider: str = 'openai'
     model: str = DEFAULT_EMBEDDER_MODEL
     api_key: str | None = None
     azure_openai_endpoint: str | None = None
     azure_openai_deployment_name: str | None = None
     azure_openai_api_version: str | None = None
     azure_openai_use_managed_identity: bool = False
+    onnx_num_threads: int | None = None
+    onnx_quantize: bool = False
+    embedding_dim: int | None = None
 
     @classmethod
     def from_env(cls) -> 'GraphitiEmbedderConfig':
@@ -393,6 +398,20 @@ class GraphitiEmbedderConfig(BaseModel):
         model_env = os.environ.get('EMBEDDER_MODEL_NAME', '')
         model = model_env if model_env.strip() else DEFAULT_EMBEDDER_MODEL
 
+        provider = os.environ.get('EMBEDDER_PROVIDER', 'openai').strip().lower() or 'openai'
+        if provider == 'onnx':
+            # Local CPU embeddings, no API key required
+            threads_env = os.environ.get('ONNX_EMBEDDER_THREADS', '')
+            # Unset means the model's own dimension
+            dim_env = os.environ.get('EMBEDDING_DIM', '')
+            return cls(
+                provider=provider,
+                model=model if model_env.strip() else DEFAULT_ONNX_EMBEDDER_MODEL,
+                onnx_num_threads=int(threads_env) if threads_env.strip() else None,
+                onnx_quantize=os.environ.get('ONNX_EMBEDDER_QUANTIZE', 'false').lower() == 'true',
+                embedding_dim=int(dim_env) if dim_env.strip() else None,
+            )
+
         azure_openai_endpoint = os.environ.get('AZURE_OPENAI_EMBEDDING_ENDPOINT', None)
         azure_openai_api_version = os.environ.get('AZURE_OPENAI_EMBEDDING_API_VERSION', None)
         azure_openai_deployment_name = os.environ.get(
@@ -437,6 +456,19 @@ class GraphitiEmbedderConfig(BaseModel):
             )
 
     def create_client(self) -> EmbedderClient | None:
+        if self.provider == 'onnx':
+            # Imported lazily so the onnx extra is only needed when it is selected
+            from graphiti_core.embedder.onnx import OnnxEmbedder, OnnxEmbedderConfig
+
+            return OnnxEmbedder(
+                config=OnnxEmbedderConfig(
+                    embedding_model=self.model,
+                    num_threads=self.onnx_num_threads,
+                    quantize=self.onnx_quantize,
+                    embedding_dim=self.embedding_dim,
+                )
+            )
+
         if self.azure_openai_endpoint is not None:
             # Azure OpenAI API setup
             if self.azure_openai_use_managed_identity:
@@ -14,6 +14,15 @@ class Settings(BaseSettings):
     neo4j_uri: str
     neo4j_user: str
     neo4j_password: str
+    ingest_workers: int = Field(
+        4, description='Groups whose queued messages are processed in parallel'
+    )
+    bulk_ingest_chunk_size: int = Field(
+        100, description='Messages passed to add_episode_bulk at a time by bulk ingestion jobs'
+    )
+    max_concurrent_requests: int = Field(
+        64, description='Requests that may use the shared Graphiti client at once'
+    )
 
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
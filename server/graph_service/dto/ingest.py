@@ -1,3 +1,8 @@
+from datetime import datetime
+from typing import Literal
+from uuid import uuid4
+
+from graphiti_core.utils.datetime_utils import utc_now
 from pydantic import BaseModel, Field
 
 from graph_service.dto.common import Message
@@ -6,6 +11,10 @@ from graph_service.dto.common import Message
 class AddMessagesRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the messages to add')
     messages: list[Message] = Field(..., description='The messages to add')
+    bulk: bool = Field(
+        default=False,
+        description='Ingest the messages as one bulk job instead of one episode at a time',
+    )
 
 
 class AddEntityNodeRequest(BaseModel):
@@ -13,3 +22,17 @@ class AddEntityNodeRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the node to add')
     name: str = Field(..., description='The name of the node to add')
     summary: str = Field(default='', description='The summary of the node to add')
+
+
+class IngestJob(BaseModel):
+    job_id: str = Field(default_factory=lambda: str(uuid4()))
+    group_id: str
+    status: Literal['queued', 'running', 'completed', 'failed'] = 'queued'
+    total: int = Field(..., description='The number of messages in the job')
+    processed: int = Field(
+        default=0,
+        description='The number of messages ingested so far, which stay ingested if the job fails',
+    )
+    error: str | None = Field(default=None, description='Why the job failed')
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
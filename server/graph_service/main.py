@@ -1,20 +1,24 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from graphiti_core.driver.neo4j_driver import Neo4jDriver  # type: ignore
 
 from graph_service.config import get_settings
 from graph_service.routers import ingest, retrieve
-from graph_service.zep_graphiti import initialize_graphiti
+from graph_service.zep_graphiti import RequestLimiter, create_graphiti
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     settings = get_settings()
-    await initialize_graphiti(settings)
+    graphiti = create_graphiti(settings)
+    await graphiti.build_indices_and_constraints()
+    app.state.graphiti = graphiti
+    app.state.request_limiter = RequestLimiter(settings.max_concurrent_requests)
     yield
     # Shutdown
-    # No need to close Graphiti here, as it's handled per-request
+    await graphiti.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -25,5 +29,13 @@ app.include_router(ingest.router)
 
 
 @app.get('/healthcheck')
-async def healthcheck():
-    return JSONResponse(content={'status': 'healthy'}, status_code=200)
+async def healthcheck(request: Request):
+    content = {
+        'status': 'healthy',
+        'requests': request.app.state.request_limiter.stats(),
+        'ingest': ingest.ingest_workers.stats(),
+    }
+    driver = request.app.state.graphiti.driver
+    if isinstance(driver, Neo4jDriver):
+        content['neo4j_pool'] = driver.pool_metrics().model_dump()
+    return JSONResponse(content=content, status_code=200)
@@ -1,48 +1,189 @@
 import asyncio
+import logging
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from functools import partial
+from time import monotonic
+from typing import Any
 
-from fastapi import APIRouter, FastAPI, status
+from fastapi import APIRouter, FastAPI, HTTPException, status
 from graphiti_core.nodes import EpisodeType  # type: ignore
+from graphiti_core.utils.bulk_utils import RawEpisode  # type: ignore
+from graphiti_core.utils.datetime_utils import utc_now  # type: ignore
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data  # type: ignore
 
-from graph_service.dto import AddEntityNodeRequest, AddMessagesRequest, Message, Result
-from graph_service.zep_graphiti import ZepGraphitiDep
+from graph_service.config import get_settings
+from graph_service.dto import (
+    AddEntityNodeRequest,
+    AddMessagesRequest,
+    IngestJob,
+    Message,
+    Result,
+)
+from graph_service.zep_graphiti import ZepGraphiti, ZepGraphitiDep
 
+logger = logging.getLogger(__name__)
 
-class AsyncWorker:
-    def __init__(self):
-        self.queue = asyncio.Queue()
-        self.task = None
+
+class IngestWorkerPool:
+    """
+    Runs ingestion jobs in order within each group_id, with up to `max_workers` groups in
+    parallel. Groups with pending jobs take turns: a worker runs one job of a group and then
+    moves the group to the back of the line, so a group with a long backlog does not starve
+    the others.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max_workers
+        self.jobs: dict[str, deque[tuple[float, Callable[[], Awaitable[None]]]]] = {}
+        self.ready: asyncio.Queue[str] = asyncio.Queue()
+        self.tasks: list[asyncio.Task] = []
+        self.running = 0
+        self.processed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def put(self, group_id: str, job: Callable[[], Awaitable[None]]):
+        pending = self.jobs.get(group_id)
+        if pending is None:
+            # The group is neither queued nor running, so it joins the line
+            pending = self.jobs[group_id] = deque()
+            self.ready.put_nowait(group_id)
+        pending.append((monotonic(), job))
 
     async def worker(self):
         while True:
+            group_id = await self.ready.get()
+            pending = self.jobs[group_id]
+            enqueued_at, job = pending.popleft()
+
+            wait = monotonic() - enqueued_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.running += 1
             try:
-                print(f'Got a job: (size of remaining queue: {self.queue.qsize()})')
-                job = await self.queue.get()
                 await job()
+                self.processed += 1
             except asyncio.CancelledError:
-                break
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f'Ingestion job for group {group_id} failed: {e}')
+            finally:
+                self.running -= 1
+                if pending:
+                    self.ready.put_nowait(group_id)
+                else:
+                    del self.jobs[group_id]
 
-    async def start(self):
-        self.task = asyncio.create_task(self.worker())
+    def stats(self) -> dict[str, Any]:
+        started = self.processed + self.failed + self.running
+        return {
+            'workers': self.max_workers,
+            'running': self.running,
+            'queued': sum(len(pending) for pending in self.jobs.values()),
+            'queued_groups': len(self.jobs),
+            'processed': self.processed,
+            'failed': self.failed,
+            'avg_wait_seconds': self.total_wait / started if started else 0.0,
+            'max_wait_seconds': self.max_wait,
+        }
+
+    async def start(self, max_workers: int | None = None):
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self.tasks = [asyncio.create_task(self.worker()) for _ in range(self.max_workers)]
 
     async def stop(self):
-        if self.task:
-            self.task.cancel()
-            await self.task
-        while not self.queue.empty():
-            self.queue.get_nowait()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        self.jobs.clear()
+        while not self.ready.empty():
+            self.ready.get_nowait()
+
+
+class IngestJobs:
+    """
+    Bulk ingestion jobs by id, keeping the `max_jobs` most recent for polling.
+
+    Jobs live in the memory of the process that accepted them and are lost on restart.
+    """
+
+    def __init__(self, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self.jobs: OrderedDict[str, IngestJob] = OrderedDict()
+
+    def add(self, job: IngestJob):
+        self.jobs[job.job_id] = job
+        while len(self.jobs) > self.max_jobs:
+            self.jobs.popitem(last=False)
+
+    def get(self, job_id: str) -> IngestJob | None:
+        return self.jobs.get(job_id)
+
+    def update(self, job: IngestJob, **fields: Any):
+        for name, value in fields.items():
+            setattr(job, name, value)
+        job.updated_at = utc_now()
+
+
+ingest_workers = IngestWorkerPool()
+ingest_jobs = IngestJobs()
+
 
+def get_raw_episode(m: Message) -> RawEpisode:
+    return RawEpisode(
+        uuid=m.uuid,
+        name=m.name,
+        content=f'{m.role or ""}({m.role_type}): {m.content}',
+        source_description=m.source_description,
+        source=EpisodeType.message,
+        reference_time=m.timestamp,
+    )
+
+
+async def enqueue_bulk_job(request: AddMessagesRequest, graphiti: ZepGraphiti) -> IngestJob:
+    """
+    Queue the messages as one job in the group's ingestion order. The job feeds them to
+    add_episode_bulk in chunks of BULK_INGEST_CHUNK_SIZE messages, so large uploads are
+    deduplicated and written in bulk without holding the whole upload in one extraction pass,
+    and its progress is updated after every chunk.
+
+    Chunks are committed as they finish and are not rolled back if a later chunk fails, so a
+    failed job has ingested its first `processed` messages (in timestamp order).
+    """
+    job = IngestJob(group_id=request.group_id, total=len(request.messages))
+    ingest_jobs.add(job)
+    chunk_size = get_settings().bulk_ingest_chunk_size
+    episodes = sorted(
+        (get_raw_episode(m) for m in request.messages), key=lambda e: e.reference_time
+    )
+
+    async def bulk_task():
+        ingest_jobs.update(job, status='running')
+        try:
+            for i in range(0, len(episodes), chunk_size):
+                chunk = episodes[i : i + chunk_size]
+                await graphiti.add_episode_bulk(chunk, group_id=request.group_id)
+                ingest_jobs.update(job, processed=job.processed + len(chunk))
+        except Exception as e:
+            ingest_jobs.update(job, status='failed', error=str(e))
+            raise
+        ingest_jobs.update(job, status='completed')
 
-async_worker = AsyncWorker()
+    await ingest_workers.put(request.group_id, bulk_task)
+    return job
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await async_worker.start()
+    await ingest_workers.start(get_settings().ingest_workers)
     yield
-    await async_worker.stop()
+    await ingest_workers.stop()
 
 
 router = APIRouter(lifespan=lifespan)
@@ -53,6 +194,9 @@ async def add_messages(
     request: AddMessagesRequest,
     graphiti: ZepGraphitiDep,
 ):
+    if request.bulk:
+        return await enqueue_bulk_job(request, graphiti)
+
     async def add_messages_task(m: Message):
         await graphiti.add_episode(
             uuid=m.uuid,
@@ -65,11 +209,39 @@ async def add_messages(
         )
 
     for m in request.messages:
-        await async_worker.queue.put(partial(add_messages_task, m))
+        await ingest_workers.put(request.group_id, partial(add_messages_task, m))
 
     return Result(message='Messages added to processing queue', success=True)
 
 
+@router.post('/messages/bulk', status_code=status.HTTP_202_ACCEPTED)
+async def add_messages_bulk(
+    request: AddMessagesRequest,
+    graphiti: ZepGraphitiDep,
+) -> IngestJob:
+    """
+    Ingest the messages as one job and return it for polling with GET /jobs/{job_id}.
+
+    Job state is kept per process, so with several server workers the job can only be polled
+    on the worker that accepted it. If the job fails, the chunks ingested before the failure
+    stay in the graph; `processed` says how many messages that covers, and retrying only the
+    rest avoids duplicates.
+    """
+    return await enqueue_bulk_job(request, graphiti)
+
+
+@router.get('/jobs/{job_id}', status_code=status.HTTP_200_OK)
+async def get_job(job_id: str) -> IngestJob:
+    """
+    Return a bulk ingestion job. Jobs are only known to the process that accepted them and are
+    forgotten on restart, or after 1000 newer jobs, which all return 404.
+    """
+    job = ingest_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f'job {job_id} not found')
+    return job
+
+
 @router.post('/entity-node', status_code=status.HTTP_201_CREATED)
 async def add_entity_node(
     request: AddEntityNodeRequest,
@@ -92,8 +264,14 @@ async def delete_entity_edge(uuid: str, graphiti: ZepGraphitiDep):
 
 @router.delete('/group/{group_id}', status_code=status.HTTP_200_OK)
 async def delete_group(group_id: str, graphiti: ZepGraphitiDep):
-    await graphiti.delete_group(group_id)
-    return Result(message='Group deleted', success=True)
+    purge = await graphiti.delete_group(group_id)
+    return Result(
+        message=(
+            f'Group deleted: {purge.episodes} episodes, {purge.entities} entities, '
+            f'{purge.entity_edges} entity edges and {purge.communities} communities'
+        ),
+        success=True,
+    )
 
 
 @router.delete('/episode/{uuid}', status_code=status.HTTP_200_OK)
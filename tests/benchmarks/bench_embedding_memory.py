@@ -0,0 +1,105 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Compares the memory held by entity nodes/edges with list[float] embeddings against the
+# float32 representation, for single embeddings and for create_batch results.
+#
+#     python -m tests.benchmarks.bench_embedding_memory --count 10000 --dim 1024
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+from graphiti_core.edges import EntityEdge, create_entity_edge_embeddings
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+class RandomEmbedder(EmbedderClient):
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.rng = np.random.default_rng(0)
+
+    async def create(self, input_data) -> list[float]:
+        return self.rng.random(self.dim).tolist()
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return self.rng.random((len(input_data_list), self.dim)).tolist()
+
+
+def measure(build: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure embedding memory per object')
+    parser.add_argument('--count', type=int, default=10_000)
+    parser.add_argument('--dim', type=int, default=1024)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = [rng.random(args.dim).tolist() for _ in range(args.count)]
+
+    def as_lists():
+        # Baseline: what the pydantic models held before, one boxed float per dimension.
+        # tolist() allocates fresh float objects, like decoding driver records does.
+        return [np.asarray(v).tolist() for v in vectors]
+
+    def as_nodes():
+        return [
+            EntityNode(name=f'node {i}', group_id='bench', name_embedding=v)
+            for i, v in enumerate(vectors)
+        ]
+
+    def as_batch_edges():
+        edges = [
+            EntityEdge(
+                name='RELATES_TO',
+                fact=f'fact {i}',
+                group_id='bench',
+                source_node_uuid='a',
+                target_node_uuid='b',
+                created_at=utc_now(),
+            )
+            for i in range(args.count)
+        ]
+        asyncio.run(create_entity_edge_embeddings(RandomEmbedder(args.dim), edges))
+        return edges
+
+    baseline = measure(as_lists)
+    nodes = measure(as_nodes)
+    edges = measure(as_batch_edges)
+
+    print(f'{args.count} embeddings of dim {args.dim}')
+    print(f'  list[float] vectors only : {baseline / args.count / 1024:8.1f} KiB/object')
+    print(f'  EntityNode (float32)     : {nodes / args.count / 1024:8.1f} KiB/object')
+    print(f'  EntityEdge (batch matrix): {edges / args.count / 1024:8.1f} KiB/object')
+    print(f'  reduction vs list[float] : {baseline / nodes:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
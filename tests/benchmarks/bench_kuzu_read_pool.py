@@ -0,0 +1,99 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Concurrent similarity search throughput against an in-memory KuzuDriver for increasing
+# read pool sizes. A pool of one serializes every search, as the single shared connection
+# used to; larger pools should scale with the number of cores.
+#
+#     python -m tests.benchmarks.bench_kuzu_read_pool --nodes 20000 --searches 200
+
+import argparse
+import asyncio
+import os
+import time
+
+import numpy as np
+
+from graphiti_core.driver.kuzu_driver import KuzuDriver
+from graphiti_core.helpers import semaphore_gather
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import node_similarity_search
+
+GROUP_ID = 'bench'
+
+
+async def populate(driver: KuzuDriver, nodes: int, dim: int, rng: np.random.Generator):
+    await driver.execute_query(
+        """
+        UNWIND $nodes AS node
+        CREATE (:Entity {
+            uuid: node.uuid, name: node.name, group_id: $group_id, labels: [],
+            created_at: current_timestamp(), name_embedding: node.embedding,
+            summary: '', attributes: '{}'
+        })
+        """,
+        nodes=[
+            {'uuid': f'node-{i}', 'name': f'entity {i}', 'embedding': embedding}
+            for i, embedding in enumerate(rng.random((nodes, dim), dtype=np.float32).tolist())
+        ],
+        group_id=GROUP_ID,
+    )
+
+
+async def run(nodes: int, searches: int, dim: int, pool_sizes: list[int], threads: int):
+    rng = np.random.default_rng(0)
+    vectors = rng.random((searches, dim), dtype=np.float32).tolist()
+
+    print(f'{searches} similarity searches over {nodes} nodes ({dim} dims)')
+    for pool_size in pool_sizes:
+        driver = KuzuDriver(read_pool_size=pool_size, max_threads_per_read=threads)
+        await populate(driver, nodes, dim, rng)
+
+        start = time.perf_counter()
+        await semaphore_gather(
+            *(
+                node_similarity_search(driver, vector, SearchFilters(), [GROUP_ID], min_score=0)
+                for vector in vectors
+            )
+        )
+        elapsed = time.perf_counter() - start
+        print(f'  read pool {pool_size:3d}: {searches / elapsed:8.1f} searches/s')
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Measure Kuzu search throughput by pool size')
+    parser.add_argument('--nodes', type=int, default=20_000)
+    parser.add_argument('--searches', type=int, default=200)
+    parser.add_argument('--dim', type=int, default=256)
+    parser.add_argument(
+        '--pool-sizes',
+        type=int,
+        nargs='+',
+        default=sorted({1, max(cpus // 2, 1), cpus}),
+    )
+    parser.add_argument(
+        '--max-threads-per-read', type=int, default=1, help='0 lets each query use every core'
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(args.nodes, args.searches, args.dim, args.pool_sizes, args.max_threads_per_read)
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Concurrent search throughput against NeptuneDriver with a simulated network latency.
+# "blocking" calls the synchronous client on the event loop, as execute_query used to;
+# "thread pool" goes through the driver's bounded executor.
+#
+#     python -m tests.benchmarks.bench_neptune_concurrency --queries 200 --latency-ms 20
+
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+from graphiti_core.driver.neptune_driver import NeptuneDriver
+from graphiti_core.helpers import semaphore_gather
+
+
+def make_driver(latency: float, max_concurrent_queries: int) -> NeptuneDriver:
+    with (
+        patch('graphiti_core.driver.neptune_driver.NeptuneGraph'),
+        patch('graphiti_core.driver.neptune_driver.boto3'),
+        patch('graphiti_core.driver.neptune_driver.AWSV4SignerAsyncAuth'),
+        patch('graphiti_core.driver.neptune_driver.AsyncOpenSearch'),
+    ):
+        driver = NeptuneDriver(
+            host='neptune-db://bench',
+            aoss_host='bench',
+            max_concurrent_queries=max_concurrent_queries,
+        )
+
+    def query(cypher, params):
+        time.sleep(latency)
+        return [{'uuid': 'x'}]
+
+    driver.client = MagicMock()
+    driver.client.query.side_effect = query
+    return driver
+
+
+async def run(queries: int, latency: float, max_concurrent_queries: int):
+    driver = make_driver(latency, max_concurrent_queries)
+
+    async def blocking_query():
+        return driver._run_query('MATCH (n:Entity) RETURN n.uuid AS uuid', {})
+
+    start = time.perf_counter()
+    await semaphore_gather(*(blocking_query() for _ in range(queries)))
+    blocking = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await semaphore_gather(
+        *(driver.execute_query('MATCH (n:Entity) RETURN n.uuid AS uuid') for _ in range(queries))
+    )
+    pooled = time.perf_counter() - start
+
+    print(f'{queries} queries, {latency * 1000:.0f} ms latency each')
+    print(f'  blocking    : {queries / blocking:8.1f} queries/s')
+    print(f'  thread pool : {queries / pooled:8.1f} queries/s ({max_concurrent_queries} workers)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure concurrent Neptune query throughput')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--max-concurrent-queries', type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.queries, args.latency_ms / 1000, args.max_concurrent_queries))
+
+
+if __name__ == '__main__':
+    main()
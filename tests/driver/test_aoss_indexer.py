@@ -0,0 +1,139 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from graphiti_core.driver.aoss_indexer import AossIndexer, chunk_actions
+
+
+class FakeBulkClient:
+    """Records bulk requests and answers each item with the status from `statuses`."""
+
+    def __init__(self, statuses: dict[str, list[int]] | None = None, delay: float = 0.0):
+        self.statuses = statuses or {}
+        self.delay = delay
+        self.requests: list[list[dict[str, Any]]] = []
+        self.params: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def bulk(self, body: str, **params: Any) -> dict[str, Any]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.requests.append(lines)
+        self.params.append(params)
+
+        items = []
+        for line in lines:
+            op, meta = next(iter(line.items()))
+            if op not in ('index', 'delete'):
+                continue
+            statuses = self.statuses.get(meta['_id'])
+            status = statuses.pop(0) if statuses else 201
+            items.append({op: {'_id': meta['_id'], 'status': status, 'error': 'boom'}})
+        return {'errors': any(i[next(iter(i))]['status'] >= 300 for i in items), 'items': items}
+
+
+def make_action(uuid: str, text: str = 'x') -> dict[str, Any]:
+    return {
+        '_index': 'entities',
+        '_id': uuid,
+        '_routing': 'g',
+        '_source': {
+            'uuid': uuid,
+            'name': text,
+            'created_at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+        },
+    }
+
+
+def test_chunks_are_bounded_by_count_and_bytes():
+    actions = [make_action(str(i)) for i in range(5)] + [make_action('big', 'x' * 500)]
+
+    chunks = list(chunk_actions(actions, chunk_size=2, max_chunk_bytes=400))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1, 1]
+    header, source = chunks[0][0][1]
+    assert json.loads(header) == {'index': {'_index': 'entities', '_id': '0', 'routing': 'g'}}
+    assert json.loads(source)['created_at'] == '2024-01-01T00:00:00+00:00'
+
+
+@pytest.mark.asyncio
+async def test_index_runs_chunks_concurrently_with_refresh_policy():
+    client = FakeBulkClient(delay=0.01)
+    indexer = AossIndexer(client, chunk_size=1, concurrency=2, refresh='wait_for')
+
+    result = await indexer.index(make_action(str(i)) for i in range(6))
+
+    assert result.success == 6
+    assert len(client.requests) == 6
+    assert client.peak == 2
+    assert client.params[0] == {'request_timeout': 60, 'refresh': 'wait_for'}
+
+
+@pytest.mark.asyncio
+async def test_per_item_errors_are_retried_or_reported():
+    client = FakeBulkClient(statuses={'a': [429, 201], 'b': [400], 'c': [404]})
+    indexer = AossIndexer(client, initial_backoff=0)
+
+    result = await indexer.index(
+        [
+            make_action('a'),
+            make_action('b'),
+            {'_op_type': 'delete', '_index': 'entities', '_id': 'c', '_routing': None},
+        ]
+    )
+
+    # The throttled item is resent alone; deleting a missing document is not an error
+    assert [len(request) for request in client.requests] == [5, 2]
+    assert result.success == 2
+    assert [(error.id, error.status, error.retryable) for error in result.errors] == [
+        ('b', 400, False)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_queues_failures_durably(tmp_path):
+    path = str(tmp_path / 'aoss-retry.jsonl')
+    client = FakeBulkClient(statuses={'a': [503, 503]})
+    indexer = AossIndexer(
+        client, max_retries=1, initial_backoff=0, write_behind=True, retry_queue_path=path
+    )
+
+    queued = await indexer.submit([make_action('a'), make_action('b')])
+    assert queued == 2
+    await indexer.close()
+
+    with open(path) as f:
+        assert [json.loads(line)['_id'] for line in f] == ['a']
+
+    # A new indexer (e.g. after a restart) replays the queue
+    client = FakeBulkClient()
+    replayed = await AossIndexer(client, retry_queue_path=path).retry_failed()
+
+    assert replayed == 1
+    assert client.requests[0][0] == {'index': {'_index': 'entities', '_id': 'a', 'routing': 'g'}}
+    assert not (tmp_path / 'aoss-retry.jsonl').exists()
+    assert not (tmp_path / 'aoss-retry.jsonl.retrying').exists()
@@ -112,6 +112,41 @@ class TestFalkorDriver:
         assert header == ['column1', 'column2']
         assert summary is None
 
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_query_decodes_rows_lazily(self):
+        """Test records keep the raw rows and pad short rows with None."""
+        mock_graph = MagicMock()
+        mock_result = MagicMock()
+        mock_result.header = [(1, 'uuid'), (1, 'score')]
+        mock_result.result_set = [['a', 1.0], ['b']]
+        mock_graph.query = AsyncMock(return_value=mock_result)
+        self.mock_client.select_graph.return_value = mock_graph
+
+        records, _, _ = await self.driver.execute_query('MATCH (n) RETURN n')
+
+        assert records.rows is mock_result.result_set
+        assert len(records) == 2
+        assert records[1] == {'uuid': 'b', 'score': None}
+        assert records[-1:] == [{'uuid': 'b', 'score': None}]
+        assert records.column('uuid') == ['a', 'b']
+        assert records.column('missing') == [None, None]
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_query_columns(self):
+        """Test the columnar fast path returns one list per field."""
+        mock_graph = MagicMock()
+        mock_result = MagicMock()
+        mock_result.header = [(1, 'uuid'), (1, 'name_embedding')]
+        mock_result.result_set = [['a', [0.1]], ['b', [0.2]]]
+        mock_graph.query = AsyncMock(return_value=mock_result)
+        self.mock_client.select_graph.return_value = mock_graph
+
+        columns = await self.driver.execute_query_columns('MATCH (n) RETURN n')
+
+        assert columns == {'uuid': ['a', 'b'], 'name_embedding': [[0.1], [0.2]]}
+
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     async def test_execute_query_handles_index_already_exists_error(self):
@@ -213,6 +248,49 @@ class TestFalkorDriver:
 
             mock_execute.assert_called_once_with('CALL db.indexes() YIELD name DROP INDEX name')
 
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_load_vector_indexes(self):
+        """Test only labels with a vector index on their embedding are detected."""
+        records = [
+            {'label': 'Entity', 'types': {'uuid': ['RANGE'], 'name_embedding': ['VECTOR']}},
+            {'label': 'Community', 'types': {'uuid': ['RANGE']}},
+            {'label': 'RELATES_TO', 'types': {'fact_embedding': ['VECTOR']}},
+            {'label': 'Episodic', 'types': {'content': ['FULLTEXT']}},
+        ]
+        with patch.object(
+            self.driver, 'execute_query', new=AsyncMock(return_value=(records, None, None))
+        ):
+            labels = await self.driver.load_vector_indexes()
+
+        assert labels == {'Entity', 'RELATES_TO'}
+        assert self.driver.vector_index_labels == labels
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_query_vector_index(self):
+        """Test KNN hits are returned best first and skipped without a usable index."""
+        self.driver.embedding_dim = 2
+        self.driver.vector_index_labels = frozenset({'RELATES_TO'})
+        self.driver._vector_indexes_loaded = True
+        records = [{'uuid': 'b', 'score': 0.6}, {'uuid': 'a', 'score': 0.9}]
+
+        with patch.object(
+            self.driver, 'execute_query', new=AsyncMock(return_value=(records, None, None))
+        ) as mock_execute:
+            hits = await self.driver.query_vector_index('RELATES_TO', [0.1, 0.2], 4)
+            assert await self.driver.query_vector_index('Entity', [0.1, 0.2], 4) is None
+            assert await self.driver.query_vector_index('RELATES_TO', [0.1], 4) is None
+
+        assert hits == [('a', 0.9), ('b', 0.6)]
+        query = mock_execute.call_args.args[0]
+        assert "db.idx.vector.queryRelationships('RELATES_TO', 'fact_embedding'" in query
+        assert mock_execute.call_args.kwargs == {
+            'search_vector': [0.1, 0.2],
+            'k': 4,
+            'routing_': 'r',
+        }
+
 
 class TestFalkorDriverSession:
     """Test FalkorDB driver session functionality."""
@@ -0,0 +1,170 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.instrumentation import (
+    InMemoryQueryMetrics,
+    QueryInstrumentation,
+    QueryMetric,
+    QueryMetricsSink,
+)
+
+
+class FakeSession(GraphDriverSession):
+    provider = GraphProvider.FALKORDB
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def run(self, query: str | list, **kwargs: Any) -> Any:
+        return None
+
+    async def close(self):
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        return await func(self, *args, **kwargs)
+
+
+class FakeDriver(GraphDriver):
+    provider = GraphProvider.FALKORDB
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.profiled: list[str] = []
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        await asyncio.sleep(self.delay)
+        if 'FAIL' in cypher_query_:
+            raise ValueError('bad query')
+        return [{'uuid': 'a'}, {'uuid': 'b'}], ['uuid'], None
+
+    async def profile_query(self, cypher_query_: str, **kwargs: Any) -> str | None:
+        self.profiled.append(cypher_query_)
+        return 'Results\n    Project'
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return FakeSession()
+
+    async def close(self):
+        pass
+
+    async def delete_all_indexes(self):
+        pass
+
+
+class ListSink(QueryMetricsSink):
+    def __init__(self):
+        self.metrics: list[QueryMetric] = []
+
+    def record(self, metric: QueryMetric) -> None:
+        self.metrics.append(metric)
+
+
+async def search_entities(driver: GraphDriver):
+    return await driver.execute_query(
+        'MATCH (n:Entity) WHERE n.uuid IN $uuids RETURN n.uuid AS uuid',
+        uuids=['a', 'b', 'c'],
+        embedding=[0.1] * 8,
+        routing_='r',
+    )
+
+
+@pytest.mark.asyncio
+async def test_queries_are_named_by_caller_and_aggregated():
+    driver = FakeDriver()
+    metrics = InMemoryQueryMetrics()
+    driver.instrumentation = QueryInstrumentation(sink=metrics)
+
+    for _ in range(3):
+        await search_entities(driver)
+    columns = await driver.execute_query_columns('MATCH (n) RETURN n.uuid AS uuid')
+
+    assert columns == {'uuid': ['a', 'b']}
+    names = list(metrics.stats)
+    assert len(names) == 2
+    assert names[0].startswith('test_instrumentation.search_entities:')
+    stats = metrics.stats[names[0]]
+    assert stats.count == 3
+    assert stats.rows == 6
+    # 3 uuids, 8 embedding values and the routing flag per call
+    assert stats.param_values == 3 * 12
+    assert sum(stats.buckets) == 3
+    # execute_query_columns delegates to execute_query, which is not recorded twice
+    assert metrics.stats[names[1]].count == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_reads_are_logged_and_profiled(caplog):
+    driver = FakeDriver(delay=0.02)
+    sink = ListSink()
+    driver.instrumentation = QueryInstrumentation(
+        sink=sink, slow_query_threshold_ms=10, profile_sample_rate=1.0
+    )
+
+    with caplog.at_level(logging.WARNING, logger='graphiti_core.driver.instrumentation'):
+        await search_entities(driver)
+        await driver.execute_query('CREATE (n:Entity)')
+
+    read, write = sink.metrics
+    assert read.slow and write.slow
+    assert read.profile == 'Results\n    Project'
+    # Writes are never re-run for profiling
+    assert write.profile is None
+    assert len(driver.profiled) == 1
+    assert 'Slow query test_instrumentation.search_entities' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_errors_are_recorded_and_raised():
+    driver = FakeDriver()
+    sink = ListSink()
+    driver.instrumentation = QueryInstrumentation(sink=sink)
+
+    with pytest.raises(ValueError):
+        await driver.execute_query('FAIL')
+
+    assert sink.metrics[0].error == 'ValueError'
+    assert sink.metrics[0].rows is None
+
+
+@pytest.mark.asyncio
+async def test_sessions_inherit_instrumentation():
+    driver = FakeDriver()
+    sink = ListSink()
+    driver.instrumentation = QueryInstrumentation(sink=sink)
+
+    session = driver.session()
+    await session.run([('MERGE (n:Entity {uuid: $uuid})', {'uuid': 'a'})])
+
+    assert session.instrumentation is driver.instrumentation
+    assert len(sink.metrics) == 1
+
+
+@pytest.mark.asyncio
+async def test_uninstrumented_driver_records_nothing():
+    driver = FakeDriver()
+
+    records, _, _ = await search_entities(driver)
+
+    assert driver.instrumentation is None
+    assert len(records) == 2
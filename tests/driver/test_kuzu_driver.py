@@ -0,0 +1,216 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import CommunityNode, EntityNode
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import node_similarity_search
+from graphiti_core.utils.maintenance.graph_data_operations import build_indices_and_constraints
+
+try:
+    from graphiti_core.driver.kuzu_driver import KuzuDriver
+
+    HAS_KUZU = True
+except ImportError:
+    KuzuDriver = None
+    HAS_KUZU = False
+
+pytestmark = pytest.mark.skipif(not HAS_KUZU, reason='kuzu is not installed')
+
+
+@pytest.mark.asyncio
+async def test_reads_use_read_pool_and_see_writes():
+    driver = KuzuDriver(read_pool_size=2)
+    assert driver.read_client is not driver.client
+    assert len(driver.read_client.connections) == 2
+
+    await driver.execute_query(
+        "CREATE (:Entity {uuid: $uuid, name: 'alice', group_id: 'g'})", uuid='a'
+    )
+    records, _, _ = await driver.execute_query(
+        'MATCH (n:Entity) RETURN n.uuid AS uuid', routing_='r'
+    )
+
+    assert records == [{'uuid': 'a'}]
+
+
+@pytest.mark.asyncio
+async def test_routing_selects_connection_pool():
+    driver = KuzuDriver(read_pool_size=2)
+    driver.client.execute = AsyncMock(return_value=[])
+    driver.read_client.execute = AsyncMock(return_value=[])
+
+    await driver.execute_query('MATCH (n) RETURN n', routing_='r', database_='ignored')
+    await driver.execute_query('CREATE (:Entity {uuid: $uuid})', uuid='a')
+
+    driver.read_client.execute.assert_awaited_once_with('MATCH (n) RETURN n', parameters={})
+    driver.client.execute.assert_awaited_once_with(
+        'CREATE (:Entity {uuid: $uuid})', parameters={'uuid': 'a'}
+    )
+
+
+def test_read_pool_can_be_disabled():
+    driver = KuzuDriver(read_pool_size=0)
+
+    assert driver.read_client is driver.client
+
+
+@pytest.mark.asyncio
+async def test_session_runs_read_batches_concurrently_and_writes_in_order():
+    driver = KuzuDriver(read_pool_size=2)
+    in_flight = 0
+    peak = 0
+    order = []
+
+    async def execute_query(cypher, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        order.append(cypher)
+        in_flight -= 1
+        return [], None, None
+
+    driver.execute_query = execute_query  # type: ignore[method-assign]
+    session = driver.session()
+
+    await session.run([(f'MATCH (n) RETURN {i}', {'routing_': 'r'}) for i in range(3)])
+    assert peak == 3
+
+    peak = 0
+    order.clear()
+    await session.run([('CREATE (a)', {}), ('MATCH (a) RETURN a', {'routing_': 'r'})])
+    assert peak == 1
+    assert order == ['CREATE (a)', 'MATCH (a) RETURN a']
+
+
+def make_entity(name: str, embedding: list[float], group_id: str = 'g') -> EntityNode:
+    return EntityNode(
+        name=name,
+        group_id=group_id,
+        labels=[],
+        created_at=datetime.now(timezone.utc),
+        name_embedding=embedding,
+    )
+
+
+async def count_embedding_rows(driver: 'KuzuDriver') -> int:
+    records, _, _ = await driver.execute_query(
+        'MATCH (n:EntityEmbedding_) RETURN count(n) AS count'
+    )
+    return records[0]['count']
+
+
+@pytest.mark.asyncio
+async def test_vector_index_backs_similarity_search():
+    driver = KuzuDriver(read_pool_size=0, embedding_dim=4)
+    await build_indices_and_constraints(driver)
+    assert driver.vector_index_labels == {'Entity', 'Community', 'RELATES_TO'}
+
+    alice = make_entity('alice', [1.0, 0.0, 0.0, 0.0])
+    bob = make_entity('bob', [0.0, 1.0, 0.0, 0.0])
+    await alice.save(driver)
+    await bob.save(driver)
+
+    hits = await driver.query_vector_index('Entity', [0.9, 0.1, 0.0, 0.0], 2)
+    assert [uuid for uuid, _ in hits] == [alice.uuid, bob.uuid]  # type: ignore[union-attr]
+    assert await driver.query_vector_index('Entity', [1.0, 0.0], 2) is None
+
+    nodes = await node_similarity_search(
+        driver, [0.9, 0.1, 0.0, 0.0], SearchFilters(), ['g'], min_score=0.5
+    )
+    assert [node.uuid for node in nodes] == [alice.uuid]
+
+    # Fulltext indexes are still created alongside the vector indexes
+    records, _, _ = await driver.execute_query('CALL SHOW_INDEXES() RETURN index_name')
+    names = {record['index_name'] for record in records}
+    assert {'node_name_and_summary', 'entity_name_embedding'} <= names
+
+
+@pytest.mark.asyncio
+async def test_embedding_rows_only_added_when_embedding_changes():
+    driver = KuzuDriver(read_pool_size=0, embedding_dim=4)
+    alice = make_entity('alice', [1.0, 0.0, 0.0, 0.0])
+
+    await alice.save(driver)
+    await alice.save(driver)
+    assert await count_embedding_rows(driver) == 1
+
+    alice.name_embedding = [0.0, 0.0, 1.0, 0.0]
+    await alice.save(driver)
+    assert await count_embedding_rows(driver) == 2
+
+    # Search re-scores against the current embedding, so the stale row is never returned
+    nodes = await node_similarity_search(
+        driver, [1.0, 0.0, 0.0, 0.0], SearchFilters(), ['g'], min_score=0.5
+    )
+    assert nodes == []
+
+    await driver.rebuild_vector_indices()
+    assert await count_embedding_rows(driver) == 1
+
+
+@pytest.mark.asyncio
+async def test_embeddings_of_another_size_are_saved_without_index_rows():
+    driver = KuzuDriver(read_pool_size=0, embedding_dim=4)
+    alice = make_entity('alice', [0.1, 0.2, 0.3])
+    bob = make_entity('bob', [1.0, 0.0, 0.0, 0.0])
+    await alice.save(driver)
+    await bob.save(driver)
+    await EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='KNOWS',
+        fact='alice knows bob',
+        fact_embedding=[0.1, 0.2, 0.3],
+        group_id='g',
+        created_at=datetime.now(timezone.utc),
+    ).save(driver)
+    await CommunityNode(
+        name='people',
+        group_id='g',
+        name_embedding=[0.1, 0.2, 0.3],
+        created_at=datetime.now(timezone.utc),
+    ).save(driver)
+
+    # Only bob's embedding fits the index; the others are still stored on the graph
+    assert await count_embedding_rows(driver) == 1
+    records, _, _ = await driver.execute_query(
+        'MATCH (n:Entity {uuid: $uuid}) RETURN n.name_embedding AS embedding', uuid=alice.uuid
+    )
+    assert records[0]['embedding'] == pytest.approx([0.1, 0.2, 0.3])
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_falls_back_to_full_scan():
+    driver = KuzuDriver(read_pool_size=0, embedding_dim=4)
+    for i in range(8):
+        await make_entity(f'near {i}', [1.0, 0.01 * i, 0.0, 0.0], group_id='a').save(driver)
+    far = make_entity('far', [1.0, 0.5, 0.0, 0.0], group_id='b')
+    await far.save(driver)
+
+    # The index only returns group `a` candidates, so the group filter leaves nothing
+    nodes = await node_similarity_search(
+        driver, [1.0, 0.0, 0.0, 0.0], SearchFilters(), ['b'], limit=1, min_score=0.5
+    )
+
+    assert [node.uuid for node in nodes] == [far.uuid]
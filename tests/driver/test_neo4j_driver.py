@@ -0,0 +1,158 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from neo4j.exceptions import ConnectionAcquisitionTimeoutError
+
+from graphiti_core.driver.instrumentation import InMemoryQueryMetrics, QueryInstrumentation
+from graphiti_core.driver.neo4j_driver import Neo4jDriver
+
+
+def make_driver(**kwargs) -> tuple[Neo4jDriver, AsyncMock]:
+    with patch('graphiti_core.driver.neo4j_driver.AsyncGraphDatabase') as mock_db:
+        driver = Neo4jDriver('neo4j://localhost:7687', 'neo4j', 'password', **kwargs)
+    return driver, mock_db
+
+
+def test_pool_settings_are_passed_to_driver():
+    _, mock_db = make_driver(
+        max_connection_pool_size=10,
+        connection_acquisition_timeout=5,
+        max_connection_lifetime=300,
+        fetch_size=50,
+    )
+
+    _, kwargs = mock_db.driver.call_args
+    assert kwargs['max_connection_pool_size'] == 10
+    assert kwargs['connection_acquisition_timeout'] == 5
+    assert kwargs['max_connection_lifetime'] == 300
+    assert kwargs['fetch_size'] == 50
+
+
+@pytest.mark.asyncio
+async def test_reads_can_be_pinned_to_leader():
+    driver, _ = make_driver(route_reads_to_followers=False)
+    driver.client.execute_query = AsyncMock()
+
+    await driver.execute_query('MATCH (n) RETURN n', routing_='r')
+
+    _, kwargs = driver.client.execute_query.call_args
+    assert 'routing_' not in kwargs
+    assert driver.pool_metrics().total_reads == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_in_flight_queries():
+    driver, _ = make_driver(max_connection_pool_size=4)
+    release = asyncio.Event()
+
+    async def execute_query(*args, **kwargs):
+        await release.wait()
+
+    driver.client.execute_query = execute_query
+    tasks = [
+        asyncio.create_task(driver.execute_query('MATCH (n) RETURN n', routing_='r')),
+        asyncio.create_task(driver.execute_query('MATCH (n) RETURN n', routing_='r')),
+        asyncio.create_task(driver.execute_query('CREATE (n)')),
+    ]
+    await asyncio.sleep(0)
+
+    metrics = driver.with_database('other').pool_metrics()
+    assert (metrics.in_flight_reads, metrics.in_flight_writes) == (2, 1)
+    assert metrics.utilization == 0.75
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    metrics = driver.pool_metrics()
+    assert metrics.in_flight_reads + metrics.in_flight_writes == 0
+    assert metrics.peak_in_flight == 3
+    assert (metrics.total_reads, metrics.total_writes) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_acquisition_timeouts_are_counted():
+    driver, _ = make_driver()
+    driver.client.execute_query = AsyncMock(side_effect=ConnectionAcquisitionTimeoutError('full'))
+
+    with pytest.raises(ConnectionAcquisitionTimeoutError):
+        await driver.execute_query('MATCH (n) RETURN n')
+
+    assert driver.pool_metrics().acquisition_timeouts == 1
+
+
+def make_session(tx: AsyncMock) -> MagicMock:
+    session = MagicMock()
+    session.run = AsyncMock()
+    session.close = AsyncMock()
+
+    async def execute_write(work):
+        return await work(tx)
+
+    session.execute_write = execute_write
+    return session
+
+
+@pytest.mark.asyncio
+async def test_session_and_transaction_queries_are_instrumented():
+    driver, _ = make_driver()
+    sink = InMemoryQueryMetrics()
+    driver.instrumentation = QueryInstrumentation(sink=sink)
+    tx = AsyncMock()
+    driver.client.session = MagicMock(return_value=make_session(tx))
+
+    async def write(tx, uuids):
+        await tx.run('MATCH (n:Entity) WHERE n.uuid IN $uuids DETACH DELETE n', uuids=uuids)
+
+    async with driver.session() as session:
+        await session.run('MATCH (n:Entity) RETURN count(n)')
+        await session.execute_write(write, ['a', 'b'])
+
+    tx.run.assert_awaited_once_with(
+        'MATCH (n:Entity) WHERE n.uuid IN $uuids DETACH DELETE n', uuids=['a', 'b']
+    )
+    assert sum(stats.count for stats in sink.stats.values()) == 2
+    assert all(name.startswith('test_neo4j_driver.') for name in sink.stats)
+
+
+@pytest.mark.asyncio
+async def test_session_writes_count_towards_pool_metrics():
+    driver, _ = make_driver(max_connection_pool_size=2)
+    release = asyncio.Event()
+    tx = AsyncMock()
+    driver.client.session = MagicMock(return_value=make_session(tx))
+
+    async def write(tx):
+        await release.wait()
+        await tx.run('CREATE (n)')
+
+    async with driver.session() as session:
+        task = asyncio.create_task(session.execute_write(write))
+        await asyncio.sleep(0)
+
+        metrics = driver.pool_metrics()
+        assert metrics.in_flight_writes == 1
+        assert metrics.utilization == 0.5
+
+        release.set()
+        await task
+        await session.run('MATCH (n) RETURN n')
+
+    metrics = driver.pool_metrics()
+    assert (metrics.in_flight_writes, metrics.total_writes, metrics.peak_in_flight) == (0, 2, 1)
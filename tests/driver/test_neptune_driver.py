@@ -0,0 +1,187 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+try:
+    from graphiti_core.driver.neptune_driver import NeptuneDriver, _compile_query, prepare_query
+
+    HAS_NEPTUNE = True
+except ImportError:
+    NeptuneDriver = None
+    HAS_NEPTUNE = False
+
+pytestmark = pytest.mark.skipif(not HAS_NEPTUNE, reason='langchain-aws is not installed')
+
+
+def make_driver(**kwargs) -> 'NeptuneDriver':
+    with (
+        patch('graphiti_core.driver.neptune_driver.NeptuneGraph'),
+        patch('graphiti_core.driver.neptune_driver.boto3'),
+        patch('graphiti_core.driver.neptune_driver.AWSV4SignerAsyncAuth'),
+        patch('graphiti_core.driver.neptune_driver.AsyncOpenSearch'),
+    ):
+        driver = NeptuneDriver(host='neptune-db://test-host', aoss_host='aoss-host', **kwargs)  # type: ignore[misc]
+    driver.client = MagicMock()
+    driver.aoss_client = MagicMock()
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_queries_do_not_block_event_loop():
+    driver = make_driver(max_concurrent_queries=5)
+
+    def slow_query(query, params):
+        time.sleep(0.1)
+        return [{'ok': True}]
+
+    driver.client.query.side_effect = slow_query
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(driver.execute_query('RETURN 1') for _ in range(5)))
+    elapsed = time.perf_counter() - start
+
+    assert all(records == [{'ok': True}] for records, _, _ in results)
+    # Sequential execution would take at least 0.5s
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_query_timeout():
+    driver = make_driver(query_timeout=0.05)
+    driver.client.query.side_effect = lambda query, params: time.sleep(0.2)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await driver.execute_query('RETURN 1')
+
+
+@pytest.mark.asyncio
+async def test_queued_queries_do_not_time_out_on_a_busy_pool():
+    driver = make_driver(max_concurrent_queries=2, query_timeout=0.15)
+    executor = driver._executor
+
+    def slow_query(query, params):
+        time.sleep(0.1)
+        return [{'ok': True}]
+
+    driver.client.query.side_effect = slow_query
+
+    # Three rounds of two queries take 0.3s, longer than the timeout of each query
+    results = await asyncio.gather(*(driver.execute_query('RETURN 1') for _ in range(6)))
+
+    assert all(records == [{'ok': True}] for records, _, _ in results)
+    assert driver._executor is executor
+
+
+@pytest.mark.asyncio
+async def test_blocked_query_does_not_starve_later_queries():
+    driver = make_driver(max_concurrent_queries=1, query_timeout=0.05)
+    release = threading.Event()
+
+    def query(query, params):
+        if query == 'BLOCK':
+            release.wait(5)
+            return []
+        return [{'ok': True}]
+
+    driver.client.query.side_effect = query
+
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await driver.execute_query('BLOCK')
+
+        # The only worker of the original pool is still stuck on the first query
+        records, _, _ = await driver.execute_query('RETURN 1')
+        assert records == [{'ok': True}]
+    finally:
+        release.set()
+
+
+@pytest.mark.asyncio
+async def test_run_aoss_query_uses_async_client():
+    driver = make_driver()
+    driver.aoss_client.search = AsyncMock(return_value={'hits': {'total': {'value': 0}}})
+
+    await driver.run_aoss_query('node_name_and_summary', 'alice', limit=5)
+
+    _, kwargs = driver.aoss_client.search.call_args
+    assert kwargs['index'] == 'node_name_and_summary'
+    assert kwargs['body']['size'] == 5
+    assert kwargs['body']['query']['multi_match']['query'] == 'alice'
+
+
+@pytest.mark.asyncio
+async def test_save_to_aoss_maps_index_names():
+    driver = make_driver()
+    driver.aoss_client.bulk = AsyncMock(
+        return_value={'errors': False, 'items': [{'index': {'_id': 'e1', 'status': 201}}]}
+    )
+
+    saved = await driver.save_to_aoss(
+        'entity_edges',
+        [{'uuid': 'e1', 'name': 'KNOWS', 'fact': 'a knows b', 'fact_embedding': [0.1]}],
+    )
+
+    assert saved == 1
+    body = driver.aoss_client.bulk.call_args.kwargs['body']
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {'index': {'_index': 'edge_name_and_fact', '_id': 'e1'}},
+        {'uuid': 'e1', 'name': 'KNOWS', 'fact': 'a knows b'},
+    ]
+
+
+def test_prepare_query_converts_datetimes_without_inlining():
+    at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    query = 'MATCH (e) WHERE e.valid_at IN $dates AND e.group_id IN $dates_group RETURN e'
+
+    prepared, params = prepare_query(
+        query,
+        {
+            'dates': [at],
+            'dates_group': ['Test'],
+            'created_at': at,
+            'rows': [{'valid_at': at, 'embedding': [0.1, 0.2]}],
+        },
+    )
+
+    assert prepared == (
+        'MATCH (e) WHERE e.valid_at IN [dt IN $dates | datetime(dt)] '
+        'AND e.group_id IN $dates_group RETURN e'
+    )
+    assert params == {
+        'dates': [at.isoformat()],
+        'dates_group': ['Test'],
+        'created_at': at.isoformat(),
+        'rows': [{'valid_at': at.isoformat(), 'embedding': [0.1, 0.2]}],
+    }
+
+
+def test_prepare_query_is_cached_per_template_and_shape():
+    query = 'MATCH (e) WHERE e.valid_at IN $dates RETURN e'
+    _compile_query.cache_clear()
+
+    first, _ = prepare_query(query, {'dates': [datetime(2024, 1, 1)]})
+    second, _ = prepare_query(query, {'dates': [datetime(2025, 6, 1), datetime(2025, 7, 1)]})
+
+    assert first == second
+    assert _compile_query.cache_info().hits == 1
@@ -0,0 +1,90 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.embedder.batching import EmbeddingBatcher, estimate_tokens
+
+
+def test_split_by_item_count() -> None:
+    batcher = EmbeddingBatcher(max_batch_size=2)
+
+    assert batcher.split(['a', 'b', 'c', 'd', 'e']) == [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def test_split_by_estimated_tokens() -> None:
+    long_text = 'x' * 400
+    batcher = EmbeddingBatcher(max_batch_size=100, max_batch_tokens=estimate_tokens(long_text) + 1)
+
+    chunks = batcher.split([long_text, 'a', long_text, long_text])
+
+    assert chunks == [[long_text, 'a'], [long_text], [long_text]]
+
+
+@pytest.mark.asyncio
+async def test_run_preserves_order_across_concurrent_chunks() -> None:
+    batcher = EmbeddingBatcher(max_batch_size=2, max_concurrency=3)
+    in_flight = 0
+    peak = 0
+
+    async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later chunks finish first to make sure results are reassembled by position
+        await asyncio.sleep(0.01 / int(chunk[0]))
+        in_flight -= 1
+        return [[float(text)] for text in chunk]
+
+    inputs = [str(i) for i in range(1, 11)]
+    result = await batcher.run(inputs, embed_chunk)
+
+    assert result == [[float(i)] for i in range(1, 11)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_run_retries_only_failed_chunk() -> None:
+    batcher = EmbeddingBatcher(max_batch_size=1, max_retries=2, max_retry_wait=0)
+    calls: list[str] = []
+
+    async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+        calls.append(chunk[0])
+        if chunk[0] == 'b' and calls.count('b') == 1:
+            raise ConnectionError('transient')
+        return [[1.0]]
+
+    result = await batcher.run(['a', 'b', 'c'], embed_chunk)
+
+    assert result == [[1.0], [1.0], [1.0]]
+    assert sorted(calls) == ['a', 'b', 'b', 'c']
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_retry_value_errors() -> None:
+    batcher = EmbeddingBatcher(max_batch_size=10, max_retries=2, max_retry_wait=0)
+    calls = 0
+
+    async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+        nonlocal calls
+        calls += 1
+        return []
+
+    with pytest.raises(ValueError):
+        await batcher.run(['a', 'b'], embed_chunk)
+    assert calls == 1
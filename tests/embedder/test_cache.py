@@ -0,0 +1,149 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.embedder.cache import CachedEmbedder, DiskEmbeddingStore, EmbeddingCacheConfig
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.embedder.coalesce import CoalescingEmbedder
+from graphiti_core.embedder.openai import OpenAIEmbedderConfig
+
+DIM = 8
+
+
+def make_mock_embedder() -> MagicMock:
+    """Create a mock embedder that embeds a string as its length repeated DIM times."""
+    embedder = MagicMock()
+    embedder.config = OpenAIEmbedderConfig(embedding_dim=DIM, embedding_model='test-model')
+    embedder.create = AsyncMock(side_effect=lambda input_data: [float(len(input_data[0]))] * DIM)
+    embedder.create_batch = AsyncMock(
+        side_effect=lambda input_data_list: [[float(len(t))] * DIM for t in input_data_list]
+    )
+    return embedder
+
+
+@pytest.mark.asyncio
+async def test_create_hits_cache_on_repeat() -> None:
+    embedder = make_mock_embedder()
+    cached = CachedEmbedder(embedder)
+
+    first = await cached.create(input_data=['alice'])
+    second = await cached.create(input_data=['alice'])
+
+    assert first == second == [5.0] * DIM
+    embedder.create.assert_awaited_once()
+    assert cached.hits == 1
+    assert cached.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_create_batch_only_sends_misses() -> None:
+    embedder = make_mock_embedder()
+    cached = CachedEmbedder(embedder)
+
+    await cached.create(input_data=['alice'])
+    result = await cached.create_batch(['alice', 'bob', 'carol', 'bob'])
+
+    embedder.create_batch.assert_awaited_once_with(['bob', 'carol'])
+    assert result == [[5.0] * DIM, [3.0] * DIM, [5.0] * DIM, [3.0] * DIM]
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_is_bounded() -> None:
+    embedder = make_mock_embedder()
+    cached = CachedEmbedder(embedder, EmbeddingCacheConfig(max_entries=2))
+
+    await cached.create_batch(['a', 'bb', 'ccc'])
+    await cached.create(input_data=['a'])
+
+    assert embedder.create.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_store_survives_restart(tmp_path) -> None:
+    config = EmbeddingCacheConfig(disk_path=str(tmp_path))
+    embedder = make_mock_embedder()
+    cached = CachedEmbedder(embedder, config)
+    await cached.create_batch(['alice', 'bob'])
+    cached.close()
+
+    embedder = make_mock_embedder()
+    reopened = CachedEmbedder(embedder, config)
+    result = await reopened.create_batch(['bob', 'alice'])
+
+    embedder.create_batch.assert_not_awaited()
+    assert result == [[3.0] * DIM, [5.0] * DIM]
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_key_includes_model() -> None:
+    embedder = make_mock_embedder()
+    other = make_mock_embedder()
+    other.config = OpenAIEmbedderConfig(embedding_dim=DIM, embedding_model='other-model')
+
+    assert CachedEmbedder(embedder)._key('alice') != CachedEmbedder(other)._key('alice')
+
+
+@pytest.mark.asyncio
+async def test_token_inputs_pass_through() -> None:
+    embedder = make_mock_embedder()
+    embedder.create = AsyncMock(return_value=[0.0] * DIM)
+    cached = CachedEmbedder(embedder)
+
+    await cached.create(input_data=[1, 2, 3])
+    await cached.create(input_data=[1, 2, 3])
+
+    assert embedder.create.await_count == 2
+
+
+class FakeEmbedder(EmbedderClient):
+    def __init__(self, model: str, dim: int):
+        self.config = OpenAIEmbedderConfig(embedding_dim=dim, embedding_model=model)
+
+    async def create(self, input_data):
+        return [1.0] * self.config.embedding_dim
+
+
+def test_model_and_dim_come_from_the_wrapped_client() -> None:
+    cached = CachedEmbedder(CoalescingEmbedder(FakeEmbedder('small-model', 4)))
+    other = CachedEmbedder(CoalescingEmbedder(FakeEmbedder('large-model', 4)))
+
+    assert cached.model == 'small-model'
+    assert cached.embedding_dim == 4
+    assert cached._key('alice') != other._key('alice')
+
+
+def test_underivable_model_or_dim_raises() -> None:
+    embedder = MagicMock(spec=EmbedderClient)
+
+    with pytest.raises(ValueError, match='model='):
+        CachedEmbedder(embedder)
+    with pytest.raises(ValueError, match='embedding_dim='):
+        CachedEmbedder(embedder, model='some-model')
+    assert CachedEmbedder(embedder, model='some-model', embedding_dim=DIM).embedding_dim == DIM
+
+
+def test_disk_store_warns_about_vectors_of_another_size(tmp_path, caplog) -> None:
+    store = DiskEmbeddingStore(str(tmp_path), DIM, capacity=4)
+
+    store.put_many([('a', [1.0] * DIM), ('b', [1.0] * (DIM + 1))])
+
+    assert len(store) == 1
+    assert 'dropping 1 of another size' in caplog.text
+    store.close()
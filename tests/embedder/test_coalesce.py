@@ -0,0 +1,92 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.embedder.coalesce import CoalescingConfig, CoalescingEmbedder
+
+DIM = 4
+
+
+def make_mock_embedder() -> MagicMock:
+    """Create a mock embedder that embeds a string as its length repeated DIM times."""
+    embedder = MagicMock()
+    embedder.create = AsyncMock(return_value=[0.0] * DIM)
+    embedder.create_batch = AsyncMock(
+        side_effect=lambda input_data_list: [[float(len(t))] * DIM for t in input_data_list]
+    )
+    return embedder
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_share_one_batch() -> None:
+    embedder = make_mock_embedder()
+    coalescing = CoalescingEmbedder(embedder, CoalescingConfig(window_ms=20))
+
+    results = await asyncio.gather(
+        coalescing.create(input_data=['a']),
+        coalescing.create(input_data=['bb']),
+        coalescing.create_batch(['ccc', 'a']),
+    )
+
+    embedder.create_batch.assert_awaited_once_with(['a', 'bb', 'ccc'])
+    assert results == [[1.0] * DIM, [2.0] * DIM, [[3.0] * DIM, [1.0] * DIM]]
+
+
+@pytest.mark.asyncio
+async def test_flushes_at_max_batch_size() -> None:
+    embedder = make_mock_embedder()
+    coalescing = CoalescingEmbedder(embedder, CoalescingConfig(window_ms=1000, max_batch_size=2))
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            coalescing.create(input_data=['a']),
+            coalescing.create(input_data=['bb']),
+        ),
+        timeout=0.5,
+    )
+
+    assert results == [[1.0] * DIM, [2.0] * DIM]
+    assert embedder.create_batch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_caller() -> None:
+    embedder = make_mock_embedder()
+    embedder.create_batch = AsyncMock(side_effect=RuntimeError('provider down'))
+    coalescing = CoalescingEmbedder(embedder)
+
+    results = await asyncio.gather(
+        coalescing.create(input_data=['a']),
+        coalescing.create(input_data=['b']),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_token_inputs_pass_through() -> None:
+    embedder = make_mock_embedder()
+    coalescing = CoalescingEmbedder(embedder)
+
+    await coalescing.create(input_data=[1, 2, 3])
+
+    embedder.create.assert_awaited_once_with([1, 2, 3])
+    embedder.create_batch.assert_not_awaited()
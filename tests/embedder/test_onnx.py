@@ -0,0 +1,132 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip('onnx')
+pytest.importorskip('onnxruntime')
+tokenizers = pytest.importorskip('tokenizers')
+
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from graphiti_core.embedder.onnx import OnnxEmbedder, OnnxEmbedderConfig  # noqa: E402
+
+VOCAB = ['[PAD]', '[UNK]', 'alice', 'bob', 'knows', 'works', 'at', 'acme']
+HIDDEN = 16
+
+
+@pytest.fixture(scope='module')
+def model_dir(tmp_path_factory) -> str:
+    """Build a tiny embedding-lookup + projection model and a word-level tokenizer."""
+    path = tmp_path_factory.mktemp('onnx_model')
+    rng = np.random.default_rng(0)
+
+    table = numpy_helper.from_array(
+        rng.standard_normal((len(VOCAB), HIDDEN)).astype(np.float32), 'table'
+    )
+    projection = numpy_helper.from_array(
+        rng.standard_normal((HIDDEN, HIDDEN)).astype(np.float32), 'projection'
+    )
+    graph = helper.make_graph(
+        [
+            helper.make_node('Gather', ['table', 'input_ids'], ['embedded']),
+            helper.make_node('MatMul', ['embedded', 'projection'], ['last_hidden_state']),
+        ],
+        'tiny_encoder',
+        [
+            helper.make_tensor_value_info('input_ids', TensorProto.INT64, ['batch', 'seq']),
+            helper.make_tensor_value_info('attention_mask', TensorProto.INT64, ['batch', 'seq']),
+        ],
+        [
+            helper.make_tensor_value_info(
+                'last_hidden_state', TensorProto.FLOAT, ['batch', 'seq', HIDDEN]
+            )
+        ],
+        initializer=[table, projection],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 17)])
+    model.ir_version = 8
+    onnx.save(model, os.path.join(path, 'model.onnx'))
+
+    tokenizer = tokenizers.Tokenizer(
+        tokenizers.models.WordLevel({w: i for i, w in enumerate(VOCAB)}, unk_token='[UNK]')
+    )
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.save(os.path.join(path, 'tokenizer.json'))
+
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_create_batch_is_padding_invariant(model_dir: str) -> None:
+    embedder = OnnxEmbedder(OnnxEmbedderConfig(embedding_model=model_dir, embedding_dim=8))
+
+    alone = await embedder.create_batch(['alice'])
+    mixed = await embedder.create_batch(['alice knows bob works at acme', 'alice'])
+
+    assert len(mixed) == 2
+    assert len(mixed[1]) == 8
+    np.testing.assert_allclose(alone[0], mixed[1], rtol=1e-5)
+    assert np.linalg.norm(mixed[0]) == pytest.approx(1.0, rel=1e-5)
+    embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_match_batch(model_dir: str) -> None:
+    embedder = OnnxEmbedder(
+        OnnxEmbedderConfig(embedding_model=model_dir, embedding_dim=HIDDEN, num_threads=1)
+    )
+
+    batch = await embedder.create_batch(['alice', 'bob knows alice'])
+    single = await asyncio.gather(
+        embedder.create(input_data=['alice']), embedder.create(input_data='bob knows alice')
+    )
+
+    np.testing.assert_allclose(batch, single, rtol=1e-5)
+    embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_quantized_model_is_close_to_float(model_dir: str) -> None:
+    float_embedder = OnnxEmbedder(OnnxEmbedderConfig(embedding_model=model_dir))
+    int8_embedder = OnnxEmbedder(OnnxEmbedderConfig(embedding_model=model_dir, quantize=True))
+
+    text = ['alice works at acme']
+    expected = np.array(await float_embedder.create_batch(text))
+    actual = np.array(await int8_embedder.create_batch(text))
+
+    assert os.path.exists(os.path.join(model_dir, 'model.int8.onnx'))
+    assert float(expected[0] @ actual[0]) > 0.95
+    float_embedder.close()
+    int8_embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_embedding_dim_defaults_to_model_output(model_dir: str) -> None:
+    embedder = OnnxEmbedder(OnnxEmbedderConfig(embedding_model=model_dir))
+
+    assert embedder.config.embedding_dim == HIDDEN
+    assert len(await embedder.create('alice')) == HIDDEN
+    embedder.close()
+
+
+def test_embedding_dim_larger_than_model_output_raises(model_dir: str) -> None:
+    with pytest.raises(ValueError, match=f'produces {HIDDEN}-dimensional'):
+        OnnxEmbedder(OnnxEmbedderConfig(embedding_model=model_dir, embedding_dim=HIDDEN * 2))
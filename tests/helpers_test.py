@@ -24,7 +24,7 @@ from dotenv import load_dotenv
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import EntityEdge, EpisodicEdge
 from graphiti_core.embedder.client import EmbedderClient
-from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.helpers import embedding_to_list, lucene_sanitize
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
@@ -189,6 +189,18 @@ def test_lucene_sanitize():
         assert assert_result == result
 
 
+def test_embeddings_stored_as_float32():
+    node = EntityNode(name='Alice', group_id='test', name_embedding=[0.5] * 1024)
+
+    assert isinstance(node.name_embedding, np.ndarray)
+    assert node.name_embedding.dtype == np.float32
+    assert node.name_embedding.nbytes == 4 * 1024
+    # Drivers and model_dump() still see a plain list of floats
+    assert node.model_dump()['name_embedding'] == [0.5] * 1024
+    assert embedding_to_list(node.name_embedding) == [0.5] * 1024
+    assert EntityNode(name='Bob', group_id='test').model_dump()['name_embedding'] is None
+
+
 async def get_node_count(driver: GraphDriver, uuids: list[str]) -> int:
     results, _, _ = await driver.execute_query(
         """
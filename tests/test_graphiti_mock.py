@@ -15,7 +15,7 @@ limitations under the License.
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import numpy as np
 import pytest
@@ -25,6 +25,7 @@ from graphiti_core.edges import CommunityEdge, EntityEdge, EpisodicEdge
 from graphiti_core.graphiti import Graphiti
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.prompts.summarize_nodes import SummaryDescription
 from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
 from graphiti_core.search.search_utils import (
     community_fulltext_search,
@@ -48,18 +49,23 @@ from graphiti_core.search.search_utils import (
     node_similarity_search,
 )
 from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
     determine_entity_community,
     get_community_clusters,
+    get_group_communities,
     remove_communities,
+    update_entity_communities,
 )
 from graphiti_core.utils.maintenance.edge_operations import filter_existing_duplicate_of_edges
+from graphiti_core.utils.maintenance.graph_data_operations import GroupPurge, purge_group
 from tests.helpers_test import (
     GraphProvider,
     assert_entity_edge_equals,
     assert_entity_node_equals,
     assert_episodic_edge_equals,
     assert_episodic_node_equals,
+    embeddings,
     get_edge_count,
     get_node_count,
     group_id,
@@ -450,6 +456,154 @@ async def test_remove_episode(
     assert edge_count == 3
 
 
+@pytest.mark.asyncio
+async def test_remove_episodes(
+    graph_driver, mock_llm_client, mock_embedder, mock_cross_encoder_client
+):
+    graphiti = Graphiti(
+        graph_driver=graph_driver,
+        llm_client=mock_llm_client,
+        embedder=mock_embedder,
+        cross_encoder=mock_cross_encoder_client,
+    )
+    now = datetime.now()
+
+    def create_episode(content: str) -> EpisodicNode:
+        return EpisodicNode(
+            name='test_episode',
+            group_id=group_id,
+            labels=[],
+            created_at=now,
+            source=EpisodeType.message,
+            source_description='conversation message',
+            content=content,
+            valid_at=now,
+        )
+
+    def mention(episode: EpisodicNode, node: EntityNode) -> EpisodicEdge:
+        return EpisodicEdge(
+            source_node_uuid=episode.uuid,
+            target_node_uuid=node.uuid,
+            created_at=now,
+            group_id=group_id,
+        )
+
+    alice_node = EntityNode(name='Alice', group_id=group_id, labels=[], created_at=now)
+    await alice_node.generate_name_embedding(mock_embedder)
+    bob_node = EntityNode(name='Bob', group_id=group_id, labels=[], created_at=now)
+    await bob_node.generate_name_embedding(mock_embedder)
+
+    episode_1 = create_episode('Alice likes Bob')
+    episode_2 = create_episode('Alice')
+    entity_edge = EntityEdge(
+        source_node_uuid=alice_node.uuid,
+        target_node_uuid=bob_node.uuid,
+        created_at=now,
+        name='likes',
+        fact='Alice likes Bob',
+        episodes=[episode_1.uuid],
+        group_id=group_id,
+    )
+    await entity_edge.generate_embedding(mock_embedder)
+    episode_1.entity_edges = [entity_edge.uuid]
+
+    await add_nodes_and_edges_bulk(
+        graph_driver,
+        [episode_1, episode_2],
+        [
+            mention(episode_1, alice_node),
+            mention(episode_1, bob_node),
+            mention(episode_2, alice_node),
+        ],
+        [alice_node, bob_node],
+        [entity_edge],
+        mock_embedder,
+    )
+
+    # Alice is still mentioned by the second episode
+    removal = await graphiti.remove_episodes([episode_1.uuid])
+    assert removal.episode_uuids == [episode_1.uuid]
+    assert removal.node_uuids == [bob_node.uuid]
+    assert removal.edge_uuids == [entity_edge.uuid]
+    assert await get_node_count(graph_driver, [episode_1.uuid, bob_node.uuid]) == 0
+    assert await get_edge_count(graph_driver, [entity_edge.uuid]) == 0
+    assert await get_node_count(graph_driver, [episode_2.uuid, alice_node.uuid]) == 2
+
+    # Unknown uuids are ignored
+    removal = await graphiti.remove_episodes([episode_2.uuid, 'missing'])
+    assert removal.episode_uuids == [episode_2.uuid]
+    assert removal.node_uuids == [alice_node.uuid]
+    assert await get_node_count(graph_driver, [episode_2.uuid, alice_node.uuid]) == 0
+
+
+@pytest.mark.asyncio
+async def test_purge_group(graph_driver, mock_embedder):
+    now = datetime.now()
+    episode = EpisodicNode(
+        name='test_episode',
+        group_id=group_id,
+        labels=[],
+        created_at=now,
+        source=EpisodeType.message,
+        source_description='conversation message',
+        content='Alice likes Bob',
+        valid_at=now,
+    )
+    alice_node = EntityNode(name='Alice', group_id=group_id, labels=[], created_at=now)
+    await alice_node.generate_name_embedding(mock_embedder)
+    bob_node = EntityNode(name='Bob', group_id=group_id, labels=[], created_at=now)
+    await bob_node.generate_name_embedding(mock_embedder)
+    other_node = EntityNode(name='Alice', group_id=group_id_2, labels=[], created_at=now)
+    await other_node.generate_name_embedding(mock_embedder)
+    entity_edge = EntityEdge(
+        source_node_uuid=alice_node.uuid,
+        target_node_uuid=bob_node.uuid,
+        created_at=now,
+        name='likes',
+        fact='Alice likes Bob',
+        episodes=[episode.uuid],
+        group_id=group_id,
+    )
+    await entity_edge.generate_embedding(mock_embedder)
+    mentions = [
+        EpisodicEdge(
+            source_node_uuid=episode.uuid,
+            target_node_uuid=node.uuid,
+            created_at=now,
+            group_id=group_id,
+        )
+        for node in [alice_node, bob_node]
+    ]
+    await add_nodes_and_edges_bulk(
+        graph_driver,
+        [episode],
+        mentions,
+        [alice_node, bob_node, other_node],
+        [entity_edge],
+        mock_embedder,
+    )
+
+    progress: list[GroupPurge] = []
+
+    async def on_progress(purge: GroupPurge):
+        progress.append(purge.model_copy())
+
+    purge = await purge_group(graph_driver, group_id, batch_size=1, on_progress=on_progress)
+
+    assert (purge.entity_edges, purge.entities, purge.episodes, purge.done) == (1, 2, 1, True)
+    # One update per chunk, then one when done
+    assert [p.entities for p in progress] == [0, 1, 2, 2, 2]
+    assert progress[-1].done
+    assert await get_node_count(graph_driver, [episode.uuid, alice_node.uuid, bob_node.uuid]) == 0
+    assert await get_edge_count(graph_driver, [entity_edge.uuid]) == 0
+    # Other groups are left alone
+    assert await get_node_count(graph_driver, [other_node.uuid]) == 1
+
+    # Purging again is a no-op
+    purge = await purge_group(graph_driver, group_id)
+    assert (purge.entity_edges, purge.entities, purge.episodes, purge.done) == (0, 0, 0, True)
+
+
 @pytest.mark.asyncio
 async def test_graphiti_retrieve_episodes(
     graph_driver, mock_llm_client, mock_embedder, mock_cross_encoder_client
@@ -749,6 +903,76 @@ async def test_determine_entity_community(graph_driver, mock_embedder):
     assert node_count == 0
 
 
+@pytest.mark.asyncio
+async def test_update_entity_communities(graph_driver, mock_embedder):
+    if graph_driver.provider == GraphProvider.FALKORDB:
+        pytest.skip('Skipping as test fails on FalkorDB')
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_response = AsyncMock(
+        return_value={'summary': 'community summary', 'description': 'test_community_1'}
+    )
+    mock_embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: [embeddings[text] for text in texts]
+    )
+
+    entities = []
+    for name in ['test_entity_1', 'test_entity_2', 'test_entity_3', 'test_entity_4']:
+        node = EntityNode(name=name, labels=[], created_at=utc_now(), group_id=group_id)
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+        entities.append(node)
+    entity_1, entity_2, entity_3, entity_4 = entities
+
+    for source in [entity_1, entity_2]:
+        edge = EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=entity_4.uuid,
+            name='RELATES_TO',
+            fact=f'{source.name} relates to {entity_4.name}',
+            created_at=utc_now(),
+            group_id=group_id,
+        )
+        await edge.generate_embedding(mock_embedder)
+        await edge.save(graph_driver)
+
+    community = CommunityNode(name='test_community_1', created_at=utc_now(), group_id=group_id)
+    await community.generate_name_embedding(mock_embedder)
+    await community.save(graph_driver)
+    for member in [entity_1, entity_2]:
+        await CommunityEdge(
+            source_node_uuid=community.uuid,
+            target_node_uuid=member.uuid,
+            created_at=utc_now(),
+            group_id=group_id,
+        ).save(graph_driver)
+
+    # Entity 1 is already a member, entity 4 joins through its neighbors, entity 3 has no
+    # community in reach
+    communities, community_edges = await update_entity_communities(
+        graph_driver, llm_client, mock_embedder, [entity_1, entity_3, entity_4]
+    )
+
+    assert [node.uuid for node in communities] == [community.uuid]
+    assert communities[0].summary == 'community summary'
+    assert [edge.target_node_uuid for edge in community_edges] == [entity_4.uuid]
+    # The community is folded and named once for both entities, with one embedding request.
+    # Three summaries take one or two calls depending on where the uuids split them
+    response_models = [
+        call.kwargs['response_model'] for call in llm_client.generate_response.await_args_list
+    ]
+    assert response_models.count(SummaryDescription) == 1
+    assert len(response_models) <= 3
+    assert mock_embedder.create_batch.await_count == 1
+
+    saved = await CommunityNode.get_by_uuid(graph_driver, community.uuid)
+    assert saved.summary == 'community summary'
+    _, members, _ = await get_group_communities(graph_driver, group_id)
+    assert sorted(members[community.uuid]) == sorted([entity_1.uuid, entity_2.uuid, entity_4.uuid])
+
+    await remove_communities(graph_driver)
+
+
 @pytest.mark.asyncio
 async def test_get_community_clusters(graph_driver, mock_embedder):
     if graph_driver.provider == GraphProvider.FALKORDB:
@@ -834,6 +1058,142 @@ async def test_get_community_clusters(graph_driver, mock_embedder):
     )
 
 
+@pytest.mark.asyncio
+async def test_build_communities_incremental(
+    graph_driver, mock_embedder, mock_cross_encoder_client
+):
+    if graph_driver.provider == GraphProvider.FALKORDB:
+        pytest.skip('Skipping as test fails on FalkorDB')
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_response = AsyncMock(
+        return_value={'summary': 'community summary', 'description': 'test_community_1'}
+    )
+    graphiti = Graphiti(
+        graph_driver=graph_driver,
+        llm_client=llm_client,
+        embedder=mock_embedder,
+        cross_encoder=mock_cross_encoder_client,
+    )
+
+    async def create_entity(name: str) -> EntityNode:
+        node = EntityNode(name=name, labels=[], created_at=utc_now(), group_id=group_id)
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+        return node
+
+    async def relate(source: EntityNode, target: EntityNode):
+        edge = EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='RELATES_TO',
+            fact=f'{source.name} relates to {target.name}',
+            created_at=utc_now(),
+            group_id=group_id,
+        )
+        await edge.generate_embedding(mock_embedder)
+        await edge.save(graph_driver)
+
+    entity_1 = await create_entity('test_entity_1')
+    entity_2 = await create_entity('test_entity_2')
+    entity_3 = await create_entity('test_entity_3')
+    await relate(entity_1, entity_2)
+
+    communities, _ = await graphiti.build_communities([group_id])
+    assert len(communities) == 2
+    _, members, _ = await get_group_communities(graph_driver, group_id)
+    community_3 = next(uuid for uuid, m in members.items() if m == [entity_3.uuid])
+
+    # Nothing changed since the build
+    llm_client.generate_response.reset_mock()
+    assert await graphiti.build_communities([group_id], incremental=True) == ([], [])
+    assert llm_client.generate_response.await_count == 0
+
+    # A new entity joins the community of entity 3; the other community is left alone
+    entity_4 = await create_entity('test_entity_4')
+    await relate(entity_3, entity_4)
+
+    summarized, member_edges = await graphiti.build_communities([group_id], incremental=True)
+
+    assert [community.uuid for community in summarized] == [community_3]
+    assert sorted(edge.target_node_uuid for edge in member_edges) == sorted(
+        [entity_3.uuid, entity_4.uuid]
+    )
+    _, members, _ = await get_group_communities(graph_driver, group_id)
+    assert sorted(sorted(m) for m in members.values()) == sorted(
+        [sorted([entity_1.uuid, entity_2.uuid]), sorted([entity_3.uuid, entity_4.uuid])]
+    )
+
+    await remove_communities(graph_driver)
+
+
+@pytest.mark.asyncio
+async def test_folded_members_do_not_advance_community_watermark(
+    graph_driver, mock_embedder, mock_cross_encoder_client
+):
+    if graph_driver.provider == GraphProvider.FALKORDB:
+        pytest.skip('Skipping as test fails on FalkorDB')
+
+    llm_client = Mock(spec=LLMClient)
+    llm_client.generate_response = AsyncMock(
+        return_value={'summary': 'community summary', 'description': 'test_community_1'}
+    )
+    mock_embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: [embeddings[text] for text in texts]
+    )
+    graphiti = Graphiti(
+        graph_driver=graph_driver,
+        llm_client=llm_client,
+        embedder=mock_embedder,
+        cross_encoder=mock_cross_encoder_client,
+    )
+
+    async def create_entity(name: str) -> EntityNode:
+        node = EntityNode(name=name, labels=[], created_at=utc_now(), group_id=group_id)
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+        return node
+
+    async def relate(source: EntityNode, target: EntityNode):
+        edge = EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='RELATES_TO',
+            fact=f'{source.name} relates to {target.name}',
+            created_at=utc_now(),
+            group_id=group_id,
+        )
+        await edge.generate_embedding(mock_embedder)
+        await edge.save(graph_driver)
+
+    entity_1 = await create_entity('test_entity_1')
+    entity_2 = await create_entity('test_entity_2')
+    entity_3 = await create_entity('test_entity_3')
+    await relate(entity_1, entity_2)
+    await graphiti.build_communities([group_id])
+    _, _, built_at = await get_group_communities(graph_driver, group_id)
+    assert built_at is not None
+
+    # An edge between the two communities, then a new entity folded in after it
+    await relate(entity_1, entity_3)
+    entity_4 = await create_entity('test_entity_4')
+    await relate(entity_2, entity_4)
+    _, community_edges = await update_entity_communities(
+        graph_driver, llm_client, mock_embedder, [entity_4]
+    )
+    assert [edge.target_node_uuid for edge in community_edges] == [entity_4.uuid]
+    _, _, folded_built_at = await get_group_communities(graph_driver, group_id)
+    assert folded_built_at == built_at
+
+    # The edge predates the fold's membership edge but is still picked up
+    communities, _ = await graphiti.build_communities([group_id], incremental=True)
+    assert communities
+    _, _, refreshed_at = await get_group_communities(graph_driver, group_id)
+    assert refreshed_at is not None and refreshed_at > built_at
+
+    await remove_communities(graph_driver)
+
+
 @pytest.mark.asyncio
 async def test_get_mentioned_nodes(graph_driver, mock_embedder):
     # Create episodic nodes
@@ -1657,9 +2017,6 @@ async def test_get_relevant_nodes(
     if graph_driver.provider == GraphProvider.FALKORDB:
         pytest.skip('Skipping as tests fail on Falkordb')
 
-    if graph_driver.provider == GraphProvider.KUZU:
-        pytest.skip('Skipping as tests fail on Kuzu')
-
     graphiti = Graphiti(
         graph_driver=graph_driver,
         llm_client=mock_llm_client,
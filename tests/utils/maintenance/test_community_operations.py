@@ -0,0 +1,207 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.maintenance import community_operations
+from graphiti_core.utils.maintenance.community_detection import (
+    CommunityAlgorithm,
+    GraphProjection,
+    Neighbor,
+    detect_communities,
+)
+from graphiti_core.utils.maintenance.community_operations import (
+    get_community_clusters,
+    get_group_projection,
+    label_propagation,
+)
+from graphiti_core.utils.maintenance.community_summaries import CommunitySummarizer, SummaryCache
+
+try:
+    import igraph  # noqa: F401
+
+    HAS_IGRAPH = True
+except ImportError:
+    HAS_IGRAPH = False
+
+
+def make_node(uuid: str) -> EntityNode:
+    return EntityNode(
+        uuid=uuid, name=uuid, group_id='g', labels=[], created_at=datetime.now(timezone.utc)
+    )
+
+
+@pytest.mark.asyncio
+async def test_group_projection_uses_one_query_per_page():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query_columns = AsyncMock(
+        side_effect=[
+            {'src': ['a', 'b'], 'dst': ['b', 'a'], 'weight': [2, 2]},
+            # 'x' was created after the entities were listed
+            {'src': ['c', 'c'], 'dst': ['b', 'x'], 'weight': [1, 1]},
+        ]
+    )
+    nodes = [make_node(uuid) for uuid in ['a', 'b', 'c']]
+
+    projection = await get_group_projection(driver, 'g', nodes, page_size=2)
+
+    assert driver.execute_query_columns.await_count == 2
+    assert driver.execute_query_columns.await_args_list[1].kwargs['uuids'] == ['c']
+    assert projection.uuids == ['a', 'b', 'c']
+    assert projection.src_idx.tolist() == [0, 1, 2]
+    assert projection.dst_idx.tolist() == [1, 0, 1]
+    assert projection.weight.tolist() == [2, 2, 1]
+
+
+def make_projection(edges: dict[tuple[str, str], int], uuids: list[str]) -> GraphProjection:
+    projection: dict[str, list[Neighbor]] = {uuid: [] for uuid in uuids}
+    for (a, b), weight in edges.items():
+        projection[a].append(Neighbor(node_uuid=b, edge_count=weight))
+        projection[b].append(Neighbor(node_uuid=a, edge_count=weight))
+    return GraphProjection.from_neighbors(projection)
+
+
+TWO_TRIANGLES = {
+    ('a', 'b'): 2,
+    ('b', 'c'): 2,
+    ('a', 'c'): 2,
+    ('d', 'e'): 2,
+    ('e', 'f'): 2,
+    ('d', 'f'): 2,
+    ('c', 'd'): 1,
+}
+
+
+def test_label_propagation_clusters_dense_groups():
+    projection = make_projection(TWO_TRIANGLES, ['a', 'b', 'c', 'd', 'e', 'f', 'g'])
+
+    clusters = detect_communities(projection, CommunityAlgorithm.label_propagation)
+
+    assert clusters == [['a', 'b', 'c'], ['d', 'e', 'f'], ['g']]
+    assert label_propagation(
+        {'x': [Neighbor(node_uuid='y', edge_count=3)], 'y': [Neighbor(node_uuid='x', edge_count=3)]}
+    ) == [['x', 'y']]
+
+
+def test_label_propagation_stops_when_labels_oscillate():
+    # Synchronous updates never settle on this path
+    projection = make_projection(
+        {('a', 'b'): 1, ('b', 'd'): 2, ('c', 'd'): 2}, ['a', 'b', 'c', 'd']
+    )
+
+    clusters = detect_communities(projection, CommunityAlgorithm.label_propagation)
+
+    assert sorted(uuid for cluster in clusters for uuid in cluster) == ['a', 'b', 'c', 'd']
+    assert detect_communities(projection, CommunityAlgorithm.label_propagation) == clusters
+
+
+@pytest.mark.skipif(not HAS_IGRAPH, reason='igraph is not installed')
+@pytest.mark.parametrize('algorithm', [CommunityAlgorithm.leiden, CommunityAlgorithm.louvain])
+def test_igraph_backends_are_seeded(algorithm: CommunityAlgorithm):
+    projection = make_projection(TWO_TRIANGLES, ['a', 'b', 'c', 'd', 'e', 'f'])
+
+    clusters = detect_communities(projection, algorithm, seed=7)
+
+    assert sorted(sorted(cluster) for cluster in clusters) == [['a', 'b', 'c'], ['d', 'e', 'f']]
+    assert detect_communities(projection, algorithm, seed=7) == clusters
+
+
+@pytest.mark.asyncio
+async def test_groups_are_clustered_in_worker_processes(monkeypatch):
+    nodes = {group_id: [make_node(f'{group_id}-{i}') for i in range(2)] for group_id in 'xy'}
+
+    async def get_group_entities(driver, group_id):
+        return nodes[group_id]
+
+    async def get_group_projection(driver, group_id, group_nodes):
+        uuids = [node.uuid for node in group_nodes]
+        return make_projection({(uuids[0], uuids[1]): 2}, uuids)
+
+    monkeypatch.setattr(community_operations, 'get_group_entities', get_group_entities)
+    monkeypatch.setattr(community_operations, 'get_group_projection', get_group_projection)
+    monkeypatch.setattr(community_operations, 'COMMUNITY_DETECTION_WORKERS', 2)
+    monkeypatch.setattr(community_operations, 'COMMUNITY_PROCESS_POOL_MIN_EDGES', 0)
+
+    clusters = await get_community_clusters(MagicMock(), ['x', 'y'])
+
+    assert [[node.uuid for node in cluster] for cluster in clusters] == [
+        ['x-0', 'x-1'],
+        ['y-0', 'y-1'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_are_opt_in(monkeypatch):
+    nodes = {group_id: [make_node(f'{group_id}-{i}') for i in range(2)] for group_id in 'xy'}
+
+    async def get_group_entities(driver, group_id):
+        return nodes[group_id]
+
+    async def get_group_projection(driver, group_id, group_nodes):
+        uuids = [node.uuid for node in group_nodes]
+        return make_projection({(uuids[0], uuids[1]): 2}, uuids)
+
+    def no_process_pool(*args, **kwargs):
+        raise AssertionError('worker processes were started')
+
+    monkeypatch.setattr(community_operations, 'get_group_entities', get_group_entities)
+    monkeypatch.setattr(community_operations, 'get_group_projection', get_group_projection)
+    monkeypatch.setattr(community_operations, 'COMMUNITY_PROCESS_POOL_MIN_EDGES', 0)
+    monkeypatch.setattr(community_operations, 'ProcessPoolExecutor', no_process_pool)
+
+    clusters = await get_community_clusters(MagicMock(), ['x', 'y'])
+
+    assert community_operations.COMMUNITY_DETECTION_WORKERS == 1
+    assert len(clusters) == 2
+
+
+def make_summarizer_llm(fan_ins: list[int]) -> MagicMock:
+    llm_client = MagicMock()
+
+    async def generate_response(messages, response_model=None):
+        fan_ins.append(messages[1].content.count('"summary"'))
+        return {'summary': f'summary of {fan_ins[-1]}', 'description': 'description'}
+
+    llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    return llm_client
+
+
+@pytest.mark.asyncio
+async def test_summarizer_packs_members_and_reuses_cached_subtrees():
+    fan_ins: list[int] = []
+    summarizer = CommunitySummarizer(
+        make_summarizer_llm(fan_ins), max_fan_in=8, cache=SummaryCache()
+    )
+    members = [(f'uuid-{i:02d}', f'member {i} summary') for i in range(40)]
+
+    summary = await summarizer.summarize(members)
+
+    assert summary.startswith('summary of')
+    assert max(fan_ins) <= 8
+    # Pairwise folding needs 39 calls
+    assert summarizer.llm_calls < 20
+
+    calls = summarizer.llm_calls
+    assert await summarizer.summarize(list(reversed(members))) == summary
+    assert summarizer.llm_calls == calls
+
+    # Only the groups above the changed member are summarized again
+    members[17] = ('uuid-17', 'member 17 has a new summary')
+    await summarizer.summarize(members)
+    assert summarizer.llm_calls - calls <= 4
+
+
+@pytest.mark.asyncio
+async def test_summarizer_respects_token_budget():
+    fan_ins: list[int] = []
+    summarizer = CommunitySummarizer(
+        make_summarizer_llm(fan_ins), max_tokens=30, max_fan_in=16, cache=SummaryCache()
+    )
+
+    await summarizer.summarize([(f'uuid-{i}', 'x' * 40) for i in range(6)])
+
+    # Each summary is ~11 tokens, so only two fit in a call
+    assert fan_ins[:3] == [2, 2, 2]
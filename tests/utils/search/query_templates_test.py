@@ -0,0 +1,99 @@
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.search.query_templates import QueryTemplateRegistry
+from graphiti_core.search.search_filters import (
+    ComparisonOperator,
+    DateFilter,
+    SearchFilters,
+    edge_search_filter_query_constructor,
+)
+from graphiti_core.search.search_utils import (
+    edge_fulltext_search,
+    edge_similarity_search,
+    node_fulltext_search,
+    node_similarity_search,
+)
+
+
+def make_driver(provider: GraphProvider) -> MagicMock:
+    driver = MagicMock()
+    driver.provider = provider
+    driver.aoss_client = None
+    driver.fulltext_syntax = ''
+    driver.execute_query = AsyncMock(return_value=([], None, None))
+    driver.query_vector_index = AsyncMock(return_value=None)
+    return driver
+
+
+def random_filters(rng: random.Random) -> SearchFilters:
+    at = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=rng.randint(0, 365))
+    return SearchFilters(
+        node_labels=rng.sample(['Person', 'Place', 'Organization', 'Event'], rng.randint(1, 3)),
+        valid_at=[[DateFilter(date=at, comparison_operator=ComparisonOperator.greater_than)]],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('provider', [GraphProvider.NEO4J, GraphProvider.KUZU])
+async def test_search_queries_have_bounded_texts(provider: GraphProvider):
+    rng = random.Random(0)
+    driver = make_driver(provider)
+
+    for i in range(100):
+        search_filter = random_filters(rng)
+        group_ids = [f'group-{rng.randint(0, 50)}']
+        vector = [rng.random() for _ in range(8)]
+        query = f'alice works at company {i}'
+
+        await node_fulltext_search(driver, query, search_filter, group_ids)
+        await node_similarity_search(driver, vector, search_filter, group_ids)
+        await edge_fulltext_search(driver, query, search_filter, group_ids)
+        await edge_similarity_search(driver, vector, None, None, search_filter, group_ids)
+
+    texts = {call.args[0] for call in driver.execute_query.call_args_list}
+    # One text per search method, regardless of the values searched for
+    assert len(texts) == 4
+
+
+def test_date_filter_params_do_not_collide():
+    first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    second = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    filters = SearchFilters(
+        valid_at=[
+            [DateFilter(date=first, comparison_operator=ComparisonOperator.less_than)],
+            [
+                DateFilter(date=None, comparison_operator=ComparisonOperator.is_null),
+                DateFilter(date=second, comparison_operator=ComparisonOperator.greater_than),
+            ],
+        ]
+    )
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        filters, GraphProvider.NEO4J
+    )
+
+    assert filter_queries == [
+        '((e.valid_at < $valid_at_0_0) OR (e.valid_at IS NULL) AND (e.valid_at > $valid_at_1_1))'
+    ]
+    assert filter_params == {'valid_at_0_0': first, 'valid_at_1_1': second}
+
+
+def test_registry_builds_each_key_once():
+    registry = QueryTemplateRegistry(maxsize=2)
+    build = MagicMock(side_effect=lambda: 'MATCH (n) RETURN n')
+
+    for _ in range(3):
+        registry.get(('search', GraphProvider.NEO4J), build)
+    registry.get(('other', GraphProvider.NEO4J), lambda: 'RETURN 1')
+    registry.get(('third', GraphProvider.NEO4J), lambda: 'RETURN 2')
+
+    assert build.call_count == 1
+    assert (registry.hits, registry.misses) == (2, 3)
+    assert len(registry) == 2
+    assert ('search', GraphProvider.NEO4J) not in registry
+    assert registry.templates() == {'RETURN 1', 'RETURN 2'}